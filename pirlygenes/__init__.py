@@ -43,7 +43,9 @@ from .expression import (
     available_percentile_cohorts,
     available_representative_cohorts,
     cancer_enriched_genes,
+    cancer_enriched_genes_all,
     cancer_expression,
+    cancer_expressions,
     CohortExpressionViews,
     cancer_reference_expression,
     cohort_expression_views,
@@ -53,6 +55,8 @@ from .expression import (
     clean_tpm_removal_mask,
     drop_technical_genes,
     estimate_signatures,
+    ExpressionMatrix,
+    NormalizationPlan,
     filter_technical_rna,
     filter_to_genes,
     fpkm_to_tpm,
@@ -61,6 +65,8 @@ from .expression import (
     is_rescue_feature,
     log2_transform,
     normalize_expression,
+    normalize_per_sample_parquet,
+    normalize_quant_directory,
     normalize_technical_rna_columns,
     normalize_technical_rna_long_table,
     normalize_to_housekeeping,
@@ -143,7 +149,16 @@ from .gene_sets_cancer import (
     tme_marker_gene_names,
     tme_markers_df,
 )
-from .load_dataset import get_data, load_all_dataframes, load_all_dataframes_dict
+from .caches import cache_info, clear_caches
+from .load_dataset import (
+    evict_dataset,
+    get_data,
+    load_all_dataframes,
+    load_all_dataframes_dict,
+    set_dataset_cache_budget,
+    set_float_dtype_default,
+    set_readonly_default,
+)
 from .gene_canonicalization import (
     CANONICAL_ENSEMBL_RELEASE,
     CANONICAL_GENE_MAP_VERSION,
@@ -172,6 +187,12 @@ __all__ = [
     "load_all_dataframes",
     "load_all_dataframes_dict",
     "get_data",
+    "set_readonly_default",
+    "set_float_dtype_default",
+    "set_dataset_cache_budget",
+    "evict_dataset",
+    "cache_info",
+    "clear_caches",
     "CANONICAL_ENSEMBL_RELEASE",
     "CANONICAL_GENE_MAP_VERSION",
     "CANONICAL_PROTEOFORM_MAP_VERSION",
@@ -262,11 +283,15 @@ __all__ = [
     "representative_cohort_samples",
     "cohort_expression_views",
     "CohortExpressionViews",
+    "ExpressionMatrix",
+    "NormalizationPlan",
     "available_representative_cohorts",
     "cohort_gene_percentiles",
     "available_percentile_cohorts",
     "cancer_expression",
+    "cancer_expressions",
     "cancer_enriched_genes",
+    "cancer_enriched_genes_all",
     "hpa_cell_type_expression",
     "estimate_signatures",
     "tumor_up_vs_matched_normal",
@@ -283,6 +308,8 @@ __all__ = [
     "clean_tpm_matrix",
     "clean_tpm_removal_mask",
     "drop_technical_genes",
+    "normalize_per_sample_parquet",
+    "normalize_quant_directory",
     "rank_normalize",
     "zscore_normalize",
     # expression: reference-frame convenience
@@ -0,0 +1,273 @@
+"""Process-wide registry of pirlygenes' in-memory caches.
+
+Loaders across the package memoize parsed tables, gene maps and derived
+matrices for the life of the process. Each of them registers here, so a
+long-running worker can see what is resident and drop it:
+
+- :func:`cache_info` — one row per cache: name, kind, hit/miss counts, entry
+  count and approximate bytes held.
+- :func:`clear_caches` — clear every cache whose name matches a glob pattern.
+
+Memoized functions use :func:`cached` (a ``functools.lru_cache`` that also
+builds each key once under concurrent first calls, see :class:`_SingleFlight`)
+and register themselves; other cache objects — plain ``dict`` memos, the
+byte-bounded ``_FrameLRUCache`` instances — are registered with
+:func:`register_cache`. Names are the defining module (without the
+``pirlygenes.`` prefix) plus the function or global name, e.g.
+``expression.accessors._pan_source_reference_frame``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import functools
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+_CacheInfo = namedtuple("_CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+_KWARGS_MARK = object()
+_UNSET = object()
+
+# name -> zero-argument callable returning the live cache object. Looking the
+# object up at query time keeps monkeypatched module globals reporting (and
+# clearing) whatever is actually installed.
+_REGISTRY: dict[str, Callable[[], object]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+class _SingleFlight:
+    """Per-key build locks so concurrent first calls build an artifact once.
+
+    ``with flights(key) as flight:`` serializes callers for one key: the first
+    thread in builds while the rest block, then find the result already
+    memoized (or parked on ``flight`` — a ``[lock, waiters, value]`` entry
+    shared by every caller of the key while any of them is inside). Entries
+    are reference-counted and dropped once no thread holds or waits on them,
+    so the table only ever holds keys that are being built. Locks are
+    re-entrant, so a builder may recurse into its own key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict = {}
+
+    @contextmanager
+    def __call__(self, key):
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = [threading.RLock(), 0, _UNSET]
+            flight[1] += 1
+        try:
+            with flight[0]:
+                yield flight
+        finally:
+            with self._lock:
+                flight[1] -= 1
+                if not flight[1]:
+                    del self._flights[key]
+
+
+def _cache_name(module: str, name: str) -> str:
+    return f"{module.removeprefix('pirlygenes.')}.{name}"
+
+
+def register_cache(name: str, cache) -> None:
+    """Register a cache object (or a zero-argument getter returning it).
+
+    Supported objects: :func:`cached` / ``functools.lru_cache`` functions,
+    anything with ``info()`` returning ``(hits, misses, maxbytes, currbytes,
+    entries)`` plus ``clear()`` (``_FrameLRUCache``), and plain ``dict``
+    memos. Re-registering a name replaces it.
+    """
+    getter = cache if _is_getter(cache) else (lambda: cache)
+    with _REGISTRY_LOCK:
+        _REGISTRY[name] = getter
+
+
+def _is_getter(obj) -> bool:
+    return (
+        callable(obj)
+        and not hasattr(obj, "cache_info")
+        and not isinstance(obj, (dict, OrderedDict))
+        and not hasattr(obj, "info")
+    )
+
+
+def cached(maxsize: Optional[int] = 128):
+    """Memoize a module-level function like ``functools.lru_cache(maxsize)``.
+
+    Hits are served by the C ``lru_cache`` itself. Only a miss enters the
+    single-flight path: when several threads miss one key together the first
+    builds it and the rest receive its result instead of repeating the build.
+    ``cache_info()`` counts those waiters as hits, and the wrapper registers
+    itself with :func:`cache_info` / :func:`clear_caches` under its module
+    and name. Arguments must be hashable; a raised exception is not cached.
+    """
+
+    def decorator(func):
+        flights = _SingleFlight()
+        lock = threading.Lock()
+        waited = [0]  # misses served by another thread's build
+        # Approximate bytes of each built value, recorded at build time and
+        # trimmed to ``maxsize`` in build order (exact for maxsize 1 / None).
+        sizes: OrderedDict = OrderedDict()
+
+        def build(*args, **kwargs):
+            key = args + (_KWARGS_MARK, *kwargs.items()) if kwargs else args
+            with flights(key) as flight:
+                if flight[2] is not _UNSET:
+                    with lock:
+                        waited[0] += 1
+                    return flight[2]
+                value = func(*args, **kwargs)
+                flight[2] = value
+            nbytes = _approx_nbytes(value)
+            with lock:
+                sizes[key] = nbytes
+                sizes.move_to_end(key)
+                if maxsize is not None:
+                    while len(sizes) > maxsize:
+                        sizes.popitem(last=False)
+            return value
+
+        wrapper = functools.lru_cache(maxsize=maxsize)(build)
+        functools.update_wrapper(wrapper, func)
+        lru_info = wrapper.cache_info
+        lru_clear = wrapper.cache_clear
+
+        def cache_info() -> _CacheInfo:
+            with lock:
+                info = lru_info()
+                return _CacheInfo(
+                    info.hits + waited[0], info.misses - waited[0],
+                    info.maxsize, info.currsize,
+                )
+
+        def cache_clear() -> None:
+            with lock:
+                lru_clear()
+                waited[0] = 0
+                sizes.clear()
+
+        def cache_nbytes() -> int:
+            with lock:
+                return sum(sizes.values()) if lru_info().currsize else 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper._cache_nbytes = cache_nbytes
+        register_cache(_cache_name(func.__module__, func.__qualname__), wrapper)
+        return wrapper
+
+    return decorator
+
+
+def _approx_nbytes(value, depth: int = 2) -> int:
+    """Shallow-ish byte estimate: frames and arrays report their buffers
+    (``memory_usage(deep=False)``, ``nbytes``), containers add their items
+    down to ``depth`` levels, anything else is ``sys.getsizeof``."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=False))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            sys.getsizeof(k) + _approx_nbytes(v, depth - 1)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_approx_nbytes(v, depth - 1) for v in value)
+    return size
+
+
+def _cache_row(name: str, cache) -> dict:
+    row = {
+        "name": name, "kind": None, "hits": None, "misses": None,
+        "entries": 0, "nbytes": None,
+    }
+    if hasattr(cache, "_cache_nbytes"):
+        info = cache.cache_info()
+        row.update(
+            kind="cached", hits=info.hits, misses=info.misses,
+            entries=info.currsize, nbytes=cache._cache_nbytes(),
+        )
+    elif hasattr(cache, "cache_info"):
+        # A plain functools.lru_cache: counts only, its values are opaque.
+        info = cache.cache_info()
+        row.update(
+            kind="lru_cache", hits=info.hits, misses=info.misses,
+            entries=info.currsize,
+        )
+    elif hasattr(cache, "info"):
+        info = cache.info()
+        row.update(
+            kind="frame_lru", hits=info.hits, misses=info.misses,
+            entries=info.entries, nbytes=info.currbytes,
+        )
+    elif isinstance(cache, dict):
+        row.update(
+            kind="dict", entries=len(cache),
+            nbytes=sum(_approx_nbytes(v) for v in list(cache.values())),
+        )
+    return row
+
+
+def _matching(pattern: Optional[str]) -> list[tuple[str, object]]:
+    with _REGISTRY_LOCK:
+        items = sorted(_REGISTRY.items())
+    return [
+        (name, getter())
+        for name, getter in items
+        if pattern is None or fnmatch.fnmatchcase(name, pattern)
+    ]
+
+
+def cache_info(pattern: Optional[str] = None) -> pd.DataFrame:
+    """One row per registered cache (optionally only names matching the glob
+    ``pattern``, e.g. ``"expression.*"``).
+
+    Columns: ``name``, ``kind`` (``cached`` / ``lru_cache`` / ``frame_lru`` /
+    ``dict``), ``hits`` and ``misses`` (missing for plain dict memos),
+    ``entries`` and ``nbytes`` — an approximate byte count of what the cache
+    holds (frame buffers and array sizes; object-string payloads are not
+    walked). Only modules imported so far have registered their caches.
+    """
+    rows = [_cache_row(name, cache) for name, cache in _matching(pattern)]
+    out = pd.DataFrame(
+        rows, columns=["name", "kind", "hits", "misses", "entries", "nbytes"],
+    )
+    for col in ("hits", "misses", "nbytes"):
+        out[col] = out[col].astype("Int64")
+    out["entries"] = out["entries"].astype("int64")
+    return out
+
+
+def clear_caches(pattern: Optional[str] = None) -> list[str]:
+    """Clear every registered cache whose name matches the glob ``pattern``
+    (all of them when ``None``) and return the cleared names.
+
+    The next call to a cleared loader rebuilds it — from the persisted
+    on-disk artifacts where those exist, so this frees memory without
+    forcing a full re-parse.
+    """
+    cleared = []
+    for name, cache in _matching(pattern):
+        if hasattr(cache, "cache_clear"):
+            cache.cache_clear()
+        else:
+            cache.clear()
+        cleared.append(name)
+    return cleared
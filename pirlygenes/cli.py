@@ -3,6 +3,8 @@
 ``downloads`` inspects and fetches oncoref-owned source matrices, ``build``
 identifies oncoref as the regeneration owner, and ``data`` inspects the
 delegated summaries plus pirlygenes' curated compatibility artifacts.
+``normalize`` rolls a directory of per-sample ``quant.sf`` files up to genes
+in parallel and writes one normalized gene × sample parquet.
 
 Per-sample analysis (``analyze`` and siblings) lives in
 ``pirl-trufflepig``. This CLI keeps the migration-pointer message for
@@ -88,6 +90,7 @@ def _build_parser() -> argparse.ArgumentParser:
             "  downloads   inspect/fetch oncoref per-sample matrices\n"
             "  build       identify the upstream build owner\n"
             "  data        inspect packaged/delegated reference data\n"
+            "  normalize   batch-normalize a directory of quant.sf files\n"
         ),
         epilog=(
             "Examples:\n"
@@ -95,6 +98,7 @@ def _build_parser() -> argparse.ArgumentParser:
             "  pirlygenes data sources NET_PANCREAS       # which sources feed a cancer code\n"
             "  pirlygenes data status               # is the data bundle downloaded?\n"
             "  pirlygenes build list                # source ids and build owners\n"
+            "  pirlygenes normalize --input-dir quants --jobs 8\n"
             "\n"
             "The Python data API is unchanged: `from pirlygenes import\n"
             "gene_sets_cancer, gene_ids, gene_names, gene_families`.\n"
@@ -229,6 +233,12 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Explicitly download the data bundle from the GitHub "
              "Release matching the installed version.",
     )
+    data_sub.add_parser(
+        "build-pan-cache",
+        help="Precompute the canonical pan-cancer matrix and its normalize "
+             "variants next to the bundle, so new processes memory-map them "
+             "instead of parsing the CSV (otherwise done lazily on first use).",
+    )
     prune_parser = data_sub.add_parser(
         "prune",
         help="Delete stale v<old-version>/ bundled-data cache dirs "
@@ -273,6 +283,44 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Deprecated compatibility arguments; no local builder is run.",
     )
 
+    normalize_parser = subparsers.add_parser(
+        "normalize",
+        help="Batch-normalize a directory of quant.sf files into one parquet.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=(
+            "Roll every sample under --input-dir (<sample>/quant.sf or\n"
+            "<sample>.sf) up to genes across --jobs worker processes, then\n"
+            "write one gene x sample parquet with a <sample>_TPM* column per\n"
+            "sample and normalization mode."
+        ),
+        epilog=(
+            "Example:\n"
+            "  pirlygenes normalize --input-dir quants --modes tpm_clean,hk,percentile \\\n"
+            "      --jobs 8 --output cohort.parquet\n"
+        ),
+    )
+    normalize_parser.add_argument(
+        "--input-dir", required=True,
+        help="directory of per-sample quantification outputs",
+    )
+    normalize_parser.add_argument(
+        "--output", default="normalized.parquet",
+        help="combined gene x sample parquet to write (default: %(default)s)",
+    )
+    normalize_parser.add_argument(
+        "--modes", default="tpm_clean",
+        help="comma-separated modes from tpm, tpm_clean, tpm_log1p, "
+             "tpm_clean_log1p, hk, percentile (default: %(default)s)",
+    )
+    normalize_parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="worker processes; 0 uses every CPU (default: %(default)s)",
+    )
+    normalize_parser.add_argument(
+        "--quant-file", default="quant.sf",
+        help="file name inside each sample directory (default: %(default)s)",
+    )
+
     plot_parser = subparsers.add_parser(
         "plot",
         help="Cohort-level plots over the reference data.",
@@ -544,6 +592,18 @@ def cmd_data_fetch(_args: argparse.Namespace) -> int:
         return 1
 
 
+def cmd_data_build_pan_cache(_args: argparse.Namespace) -> int:
+    from .expression import build_pan_cancer_expression_cache
+
+    try:
+        path = build_pan_cancer_expression_cache()
+    except Exception as exc:
+        sys.stderr.write(f"pirlygenes data build-pan-cache failed: {exc}\n")
+        return 1
+    sys.stdout.write(f"pan-cancer matrices cached under {path}\n")
+    return 0
+
+
 def cmd_data_prune(args: argparse.Namespace) -> int:
     versions = data_bundle.list_cache_versions()
     if not versions:
@@ -645,6 +705,22 @@ def cmd_build(args: argparse.Namespace) -> int:
     return 2
 
 
+def cmd_normalize(args: argparse.Namespace) -> int:
+    from .expression import normalize_quant_directory
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    try:
+        path = normalize_quant_directory(
+            args.input_dir, args.output, modes=modes, jobs=args.jobs,
+            quant_file=args.quant_file,
+        )
+    except (ValueError, FileNotFoundError) as exc:
+        sys.stderr.write(f"error: {exc}\n")
+        return 2
+    sys.stdout.write(f"normalized {args.input_dir} ({', '.join(modes)}) -> {path}\n")
+    return 0
+
+
 def cmd_plot_patient_coverage(args: argparse.Namespace) -> int:
     from . import coverage
 
@@ -713,6 +789,7 @@ _DATA_DISPATCH = {
     "status": cmd_data_status,
     "cache-dir": cmd_data_cache_dir,
     "fetch": cmd_data_fetch,
+    "build-pan-cache": cmd_data_build_pan_cache,
     "prune": cmd_data_prune,
 }
 
@@ -746,7 +823,8 @@ def main(argv: list[str] | None = None) -> int:
         handler = _DATA_DISPATCH.get(args.data_action)
         if handler is None:
             sys.stderr.write(
-                "usage: pirlygenes data {list,status,cache-dir,fetch,prune}\n"
+                "usage: pirlygenes data "
+                "{list,status,cache-dir,fetch,build-pan-cache,prune}\n"
             )
             return 2
         return handler(args)
@@ -761,6 +839,7 @@ def main(argv: list[str] | None = None) -> int:
 
     dispatch = {
         "build": cmd_build,
+        "normalize": cmd_normalize,
     }
     handler = dispatch.get(subcommand)
     if handler is None:
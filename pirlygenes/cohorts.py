@@ -13,10 +13,11 @@ to :mod:`oncoref.expression_builders`.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import lru_cache
 
 import pandas as pd
 
+from .caches import cached
+
 PER_SAMPLE_SUFFIX = "_per_sample_tpm.parquet"
 ID_COLS = ("Ensembl_Gene_ID", "Symbol")
 
@@ -93,7 +94,7 @@ def _owner_registry() -> pd.DataFrame:
     return source_matrices.registry()
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _owner_sources():
     from oncoref.expression_registry import expression_sources
 
@@ -173,7 +174,7 @@ def _per_sample_sources() -> dict[str, tuple[str, str]]:
 PER_SAMPLE_SOURCES: dict[str, tuple[str, str]] = _per_sample_sources()
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _legacy_source_routes() -> dict[str, tuple[str, ...]]:
     """Map historical source IDs to current owner routes by provenance.
 
@@ -363,11 +364,22 @@ def sample_columns(df: pd.DataFrame) -> list[str]:
     return [column for column in df.columns if column not in ID_COLS]
 
 
-def read_per_sample(cohort: Cohort) -> pd.DataFrame:
-    """Read a cohort matrix, fetching its owner artifact on first use."""
+def read_per_sample(cohort: Cohort, *, dtype=None) -> pd.DataFrame:
+    """Read a cohort matrix, fetching its owner artifact on first use.
+
+    Sample columns are stored as ``dtype`` (``"float32"`` / ``"float64"``);
+    ``None`` follows :func:`pirlygenes.load_dataset.set_float_dtype_default`.
+    """
     from oncoref import source_matrices
 
-    return pd.read_parquet(source_matrices.ensure(cohort.code))
+    from .load_dataset import _cast_float_columns, _resolve_float_dtype
+
+    df = pd.read_parquet(source_matrices.ensure(cohort.code))
+    return _cast_float_columns(
+        df,
+        _resolve_float_dtype(dtype),
+        [c for c in sample_columns(df) if pd.api.types.is_float_dtype(df[c])],
+    )
 
 
 def _parquet_sample_count(cohort: Cohort) -> int:
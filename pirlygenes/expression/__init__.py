@@ -25,6 +25,9 @@ Subpackage layout::
       qc.py          # classify_gene_qc, GeneQcClass, family classifier
       normalize.py   # normalize_expression, fpkm_to_tpm, ...
       aggregate.py   # aggregate_gene_expression (tx -> gene rollup)
+      matrix.py      # ExpressionMatrix (dense ndarray + label indexes)
+      plan.py        # NormalizationPlan (precompiled per-gene-universe state)
+      batch.py       # normalize_quant_directory (parallel quant.sf intake)
 
 Public surface — re-exported from this ``__init__`` so the common
 imports are flat::
@@ -46,9 +49,12 @@ from .accessors import (
     available_cancer_expression_references,
     available_percentile_cohorts,
     available_representative_cohorts,
+    build_pan_cancer_expression_cache,
     cancer_enriched_genes,
+    cancer_enriched_genes_all,
     cancer_expression,
     cancer_expression_reference_status,
+    cancer_expressions,
     cancer_expression_source_candidates,
     cancer_reference_expression,
     cohort_expression_views,
@@ -63,6 +69,7 @@ from .accessors import (
     normalize_to_housekeeping,
     pan_cancer_expression,
     representative_cohort_samples,
+    set_reference_expression_cache_budget,
     technical_rna_gene_ids,
     tumor_up_vs_matched_normal,
 )
@@ -70,6 +77,9 @@ from .aggregate import (
     aggregate_gene_expression,
     extra_tx_mappings,
 )
+from .batch import discover_quant_files, normalize_quant_directory
+from .matrix import ExpressionMatrix
+from .plan import NormalizationPlan
 from .normalize import (
     add_tpm_columns_from_fpkm,
     clean_tpm_matrix,
@@ -77,6 +87,7 @@ from .normalize import (
     drop_technical_genes,
     fpkm_to_tpm,
     normalize_expression,
+    normalize_per_sample_parquet,
     normalize_technical_rna_columns,
     normalize_technical_rna_long_table,
     percentile_rank_expression,
@@ -100,21 +111,27 @@ __all__ = [
     # Reference-data accessors
     "pan_cancer_expression",
     "cancer_reference_expression",
+    "set_reference_expression_cache_budget",
     "available_cancer_expression_references",
     "cancer_expression_reference_status",
     "cancer_expression_source_candidates",
     "representative_cohort_samples",
     "cohort_expression_views",
     "CohortExpressionViews",
+    "ExpressionMatrix",
+    "NormalizationPlan",
     "available_representative_cohorts",
     "cohort_gene_percentiles",
     "available_percentile_cohorts",
     "tumor_up_vs_matched_normal",
     "heme_tumor_up_vs_matched_normal",
     "cancer_expression",
+    "cancer_expressions",
     "cancer_enriched_genes",
+    "cancer_enriched_genes_all",
     "hpa_cell_type_expression",
     "estimate_signatures",
+    "build_pan_cancer_expression_cache",
     # Rescaling primitives
     "normalize_expression",
     "fpkm_to_tpm",
@@ -127,6 +144,9 @@ __all__ = [
     "clean_tpm_matrix",
     "clean_tpm_removal_mask",
     "drop_technical_genes",
+    "normalize_per_sample_parquet",
+    "normalize_quant_directory",
+    "discover_quant_files",
     "technical_rna_mask",
     "rank_normalize",
     "zscore_normalize",
@@ -68,23 +68,37 @@ can mutate freely.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
 import warnings
-from functools import lru_cache
+import weakref
 from pathlib import Path
 from typing import Iterable, Mapping, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 
+from ..caches import _SingleFlight, cached, register_cache
 from ..gene_families import gene_family_ids
 from ..gene_ids import strip_version
 from ..gene_names import get_alias_as_list, get_reverse_alias_as_list
-from ..load_dataset import get_data
+from ..load_dataset import (
+    _cast_float_columns,
+    _FrameLRUCache,
+    _readonly_frame,
+    _resolve_float_dtype,
+    _resolve_readonly,
+    get_data,
+)
+from ..timing import span
 from ..version import DATA_VERSION
 from .normalize import (
+    _apply_clean_tpm_column_scales,
+    _biological_row_mask,
+    _clean_tpm_column_scales,
     add_tpm_columns_from_fpkm,
-    drop_technical_genes,
     normalize_expression,
     percentile_rank_expression,
     renormalize_to_million,
@@ -167,26 +181,29 @@ def _pan_normalized_col_name(col: str, normalize: str) -> str:
     return f"{col}_{suffix}"
 
 
-def _add_pan_normalized_value_cols(
+def _add_pan_derived_value_cols(
     df: pd.DataFrame,
-    normalized_df: pd.DataFrame,
+    matrix: np.ndarray,
+    positions: np.ndarray,
+    rows: Optional[np.ndarray],
     value_cols: Sequence[str],
     normalize: str,
 ) -> tuple[pd.DataFrame, list[str]]:
-    """Add normalized TPM/nTPM analysis columns without overwriting inputs.
+    """Append one precomputed ``(column, gene)`` variant as named columns.
 
-    Every derived column preserves its source column's availability mask.  In
-    particular, ``normalize_expression(..., censored_fill="fixed_fraction")``
-    fills missing inputs with zero internally; restoring the mask here keeps an
-    unavailable rollup value distinct from a measured biological zero.
+    ``positions`` / ``rows`` select the requested cells of the full-width
+    matrix; with neither subsetting anything the new columns are zero-copy
+    views of it. The stored variant already carries its source masks.
     """
-    out = df.copy()
-    target_cols = []
-    for col in value_cols:
-        target = _pan_normalized_col_name(col, normalize)
-        out[target] = normalized_df[col].mask(df[col].isna())
-        target_cols.append(target)
-    return out, target_cols
+    target_cols = [_pan_normalized_col_name(col, normalize) for col in value_cols]
+    if not np.array_equal(positions, np.arange(matrix.shape[0])):
+        matrix = matrix[positions]
+    if rows is not None:
+        matrix = matrix[:, rows]
+    derived = pd.DataFrame(
+        matrix.T, index=df.index, columns=target_cols, copy=False,
+    )
+    return pd.concat([df, derived], axis=1), target_cols
 
 
 def _pan_public_col_name(col: str) -> str:
@@ -278,7 +295,7 @@ def _oncoref_canonicalize_gene_rows(
     return out[list(df.columns)]
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _load_pan_rollup_frame() -> pd.DataFrame:
     """Read the small persisted pan-cancer rollup artifact.
 
@@ -311,18 +328,20 @@ def _pan_computed_rollup_frame() -> pd.DataFrame:
     return _load_pan_rollup_frame()
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _pan_source_reference_frame() -> pd.DataFrame:
     """Canonical raw matrix containing only independent source cohorts."""
-    raw = get_data("pan-cancer-expression", copy=False)
+    with span("load", dataset="pan-cancer-expression"):
+        raw = get_data("pan-cancer-expression", copy=False)
     id_cols = {"Ensembl_Gene_ID", "Symbol"}
     value_cols = [col for col in raw.columns if col not in id_cols]
-    raw = _oncoref_canonicalize_gene_rows(raw, value_cols=value_cols)
+    with span("canonicalize"):
+        raw = _oncoref_canonicalize_gene_rows(raw, value_cols=value_cols)
     raw, _ = add_tpm_columns_from_fpkm(raw)
     return raw
 
 
-@lru_cache(maxsize=2)
+@cached(maxsize=2)
 def _pan_reference_frame(
     include_computed_rollups: bool = False,
 ) -> pd.DataFrame:
@@ -351,6 +370,680 @@ def _pan_reference_frame(
     )
 
 
+def _pan_linear_frame(
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+    dtype=np.float64,
+) -> pd.DataFrame:
+    """Shared (uncopied) linear-space pan matrix with the proteoform bridge.
+
+    Uncollapsed rows gain the ``Proteoform_ID`` / ``Member_Ensembl_Gene_IDs``
+    bridge columns; ``collapse_wide`` emits them itself but sums whole groups
+    of rows, so it has to see the full matrix. The result is memoized for the
+    process and persisted next to the data bundle, so a fresh process
+    memory-maps it instead of re-parsing and re-canonicalizing the CSV. A
+    float32 ``dtype`` is a separately persisted down-cast of the float64
+    matrix; only the down-cast stays resident.
+    """
+    dtype = np.dtype(dtype)
+    key = (bool(include_computed_rollups), collapse_kind, dtype.name)
+    cached = _PAN_LINEAR_FRAME_CACHE.get(key)
+    if cached is not None:
+        return cached
+    with _PAN_FLIGHTS(("linear", *key)):
+        cached = _PAN_LINEAR_FRAME_CACHE.get(key)
+        if cached is not None:
+            return cached
+        stem = _pan_cache_stem(include_computed_rollups, collapse_kind, dtype)
+        sig = _pan_source_signature(include_computed_rollups, collapse_kind)
+        frame = _load_pan_linear_frame(stem, sig)
+        if frame is None:
+            if dtype == np.float64:
+                frame = _build_pan_linear_frame(
+                    include_computed_rollups, collapse_kind,
+                )
+            else:
+                frame = _cast_float_columns(
+                    _transient_pan_linear_frame64(
+                        include_computed_rollups, collapse_kind,
+                    ),
+                    dtype,
+                )
+            _store_pan_linear_frame(frame, stem, sig)
+        _PAN_LINEAR_FRAME_CACHE[key] = frame
+    return frame
+
+
+def _transient_pan_linear_frame64(
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+) -> pd.DataFrame:
+    """The float64 linear matrix a down-cast is built from, not memoized.
+
+    Prefers the memoized frame when this process already holds it, then the
+    persisted float64 artifact, and only then builds (and persists) it — so a
+    float32 process never keeps the float64 copy resident.
+    """
+    key = (bool(include_computed_rollups), collapse_kind, np.dtype(np.float64).name)
+    frame = _PAN_LINEAR_FRAME_CACHE.get(key)
+    if frame is not None:
+        return frame
+    stem = _pan_cache_stem(include_computed_rollups, collapse_kind)
+    sig = _pan_source_signature(include_computed_rollups, collapse_kind)
+    frame = _load_pan_linear_frame(stem, sig)
+    if frame is None:
+        frame = _build_pan_linear_frame(include_computed_rollups, collapse_kind)
+        _store_pan_linear_frame(frame, stem, sig)
+    return frame
+
+
+def _build_pan_linear_frame(
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+) -> pd.DataFrame:
+    from .protein_groups import add_proteoform_columns, collapse_wide
+
+    base = _pan_reference_frame(include_computed_rollups)
+    if collapse_kind is None:
+        bridge = add_proteoform_columns(base[["Ensembl_Gene_ID"]])
+        return pd.concat(
+            [base, bridge[["Proteoform_ID", "Member_Ensembl_Gene_IDs"]]],
+            axis=1,
+        )
+    linear = [c for c in base.columns if c.startswith(_VALUE_COL_PREFIXES)]
+    with span("collapse", kind=collapse_kind):
+        return collapse_wide(base, value_cols=linear, kind=collapse_kind)
+
+
+# ---------- persisted derived pan-cancer matrices ----------
+#
+# The canonical linear matrix and every derived normalize variant are written
+# once per data release under ``<bundle cache>/pan-cancer-expression-derived/``
+# (``pirlygenes data build-pan-cache`` does it eagerly; the first accessor call
+# does it lazily). Float columns are stored as ``(column, gene)`` ``.npy``
+# arrays and memory-mapped read-only on later loads; string columns go to a
+# small parquet. Every write is best-effort, and a stale or unreadable
+# artifact falls back to rebuilding from the CSV.
+
+_PAN_DERIVED_CACHE_DIR = "pan-cancer-expression-derived"
+_PAN_DERIVED_MODES = (
+    "tpm_clean", "hk", "percentile", "tpm_log1p", "tpm_clean_log1p",
+)
+_PAN_LINEAR_FRAME_CACHE: dict = {}
+_PAN_DERIVED_CACHE: dict = {}
+# One build lock per linear-frame / derived-matrix / factor key: concurrent
+# first calls wait for a single build instead of each parsing the CSV.
+_PAN_FLIGHTS = _SingleFlight()
+register_cache(
+    "expression.accessors._PAN_LINEAR_FRAME_CACHE",
+    lambda: _PAN_LINEAR_FRAME_CACHE,
+)
+register_cache(
+    "expression.accessors._PAN_DERIVED_CACHE", lambda: _PAN_DERIVED_CACHE,
+)
+
+
+def _pan_derived_cache_dir() -> Path:
+    """Version-pinned home of the persisted pan matrices, beside the bundle."""
+    from .. import data_bundle
+
+    return data_bundle.cache_dir() / _PAN_DERIVED_CACHE_DIR
+
+
+def _pan_cache_stem(
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+    dtype=np.float64,
+) -> str:
+    stem = "pan"
+    if include_computed_rollups:
+        stem += "-rollups"
+    if collapse_kind is not None:
+        stem += f"-{collapse_kind}"
+    if np.dtype(dtype) != np.float64:
+        stem += f"-{np.dtype(dtype).name}"
+    return stem
+
+
+def _pan_source_signature(
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+) -> str:
+    """Validity key for the persisted linear matrix that needs no parsing.
+
+    Covers the cache format, package + data + oncoref versions (oncoref owns
+    the canonical alias map) and the size / mtime of the source CSVs, so an
+    edited in-repo checkout invalidates the artifact too.
+    """
+    import oncoref
+
+    from ..load_dataset import _dataset_paths
+    from ..version import __version__
+
+    names = ["pan-cancer-expression"]
+    if include_computed_rollups:
+        names.append("pan-cancer-expression-rollups")
+    sources = []
+    for name in names:
+        path = _dataset_paths().get(name)
+        try:
+            stat = path.stat()
+            sources.append((str(path), stat.st_size, stat.st_mtime_ns))
+        except (AttributeError, OSError):
+            sources.append((name, None))
+    return repr((
+        _PAN_FACTOR_CACHE_FORMAT,
+        __version__,
+        DATA_VERSION,
+        str(oncoref.__version__),
+        collapse_kind,
+        tuple(sources),
+    ))
+
+
+def _save_pan_cache_array(path: Path, array: np.ndarray) -> None:
+    """Write via rename so a concurrent reader's mmap never sees a torn file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as handle:
+        np.save(handle, np.ascontiguousarray(array))
+    os.replace(tmp, path)
+
+
+def _store_pan_linear_frame(frame: pd.DataFrame, stem: str, sig: str) -> None:
+    if not frame.index.equals(pd.RangeIndex(len(frame))):
+        return
+    value_cols = [
+        c for c in frame.columns if pd.api.types.is_float_dtype(frame.dtypes[c])
+    ]
+    other_cols = [c for c in frame.columns if c not in set(value_cols)]
+    cache_dir = _pan_derived_cache_dir()
+    manifest_file = cache_dir / f"{stem}.json"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest_file.unlink(missing_ok=True)
+        frame[other_cols].to_parquet(cache_dir / f"{stem}.parquet", index=False)
+        _save_pan_cache_array(
+            cache_dir / f"{stem}.npy",
+            frame[value_cols].to_numpy().T,
+        )
+        manifest_file.write_text(json.dumps({
+            "signature": sig,
+            "columns": [str(c) for c in frame.columns],
+            "value_columns": [str(c) for c in value_cols],
+        }))
+    except Exception:
+        pass  # caching is best-effort; never fail the accessor on a write error
+
+
+def _load_pan_linear_frame(stem: str, sig: str) -> Optional[pd.DataFrame]:
+    """Memory-map a persisted linear matrix, or ``None`` if absent or stale."""
+    cache_dir = _pan_derived_cache_dir()
+    try:
+        manifest = json.loads((cache_dir / f"{stem}.json").read_text())
+        if manifest.get("signature") != sig:
+            return None
+        other = pd.read_parquet(cache_dir / f"{stem}.parquet")
+        values = np.load(cache_dir / f"{stem}.npy", mmap_mode="r")
+        numeric = pd.DataFrame(
+            values.T, columns=manifest["value_columns"], copy=False,
+        )
+        return pd.concat([other, numeric], axis=1)[manifest["columns"]]
+    except Exception:
+        return None  # any cache-read problem -> rebuild from the CSV
+
+
+def _compute_pan_derived_matrix(
+    frame: pd.DataFrame,
+    value_cols: Sequence[str],
+    mode: str,
+    *,
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+) -> np.ndarray:
+    """One full-width normalize variant of ``value_cols``.
+
+    Every derived column preserves its source column's availability mask: the
+    clean-TPM transform fills missing inputs with zero internally, and
+    restoring the mask keeps an unavailable rollup value distinct from a
+    measured biological zero.
+    """
+    cols = list(value_cols)
+    if mode == "tpm_clean_log1p":
+        # log1p of the stored (already masked) clean variant.
+        return np.log1p(_pan_derived_matrix(
+            frame, cols, "tpm_clean",
+            include_computed_rollups=include_computed_rollups,
+            collapse_kind=collapse_kind,
+        ))
+    if mode == "tpm_log1p":
+        normalized = log1p_transform(frame[cols], value_cols=cols)
+    else:
+        factors = _pan_normalization_factors(
+            frame,
+            cols,
+            mode,
+            include_computed_rollups=include_computed_rollups,
+            collapse_kind=collapse_kind,
+        )
+        normalized = _apply_pan_normalization_factors(
+            frame, cols, mode, factors, factor_cols=cols,
+        )
+    masked = normalized[cols].mask(frame[cols].isna())
+    return np.ascontiguousarray(masked.to_numpy(dtype=float).T)
+
+
+def _pan_derived_matrix(
+    frame: pd.DataFrame,
+    value_cols: Sequence[str],
+    mode: str,
+    *,
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+    dtype=np.float64,
+) -> np.ndarray:
+    """Read-only ``(column, gene)`` matrix of one normalize variant of ``frame``.
+
+    Memoized against the identity of the cached linear frame and persisted
+    beside it, keyed by the linear matrix's source signature. A float32
+    variant is computed in float64 (from the float64 linear matrix and its
+    float64 normalization factors) and stored down-cast; the float64
+    intermediate is not memoized.
+    """
+    dtype = np.dtype(dtype)
+    key = (bool(include_computed_rollups), collapse_kind, mode, dtype.name)
+    cached = _PAN_DERIVED_CACHE.get(key)
+    if cached is not None and cached[0] is frame:
+        return cached[1]
+    with _PAN_FLIGHTS(("derived", *key)):
+        cached = _PAN_DERIVED_CACHE.get(key)
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+        sig = _pan_derived_signature(
+            include_computed_rollups, collapse_kind, mode, value_cols,
+        )
+        stem = (
+            f"{_pan_cache_stem(include_computed_rollups, collapse_kind, dtype)}"
+            f"-{mode}"
+        )
+        matrix = _load_pan_derived_array(stem, sig)
+        if matrix is None:
+            if dtype == np.float64:
+                matrix = _compute_pan_derived_matrix(
+                    frame,
+                    value_cols,
+                    mode,
+                    include_computed_rollups=include_computed_rollups,
+                    collapse_kind=collapse_kind,
+                )
+            else:
+                matrix = _transient_pan_derived_matrix64(
+                    value_cols,
+                    mode,
+                    include_computed_rollups=include_computed_rollups,
+                    collapse_kind=collapse_kind,
+                ).astype(dtype)
+            _store_pan_derived_array(matrix, stem, sig)
+        _PAN_DERIVED_CACHE[key] = (frame, matrix)
+    return matrix
+
+
+def _pan_derived_signature(
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+    mode: str,
+    value_cols: Sequence[str],
+) -> str:
+    return repr((
+        _pan_source_signature(include_computed_rollups, collapse_kind),
+        mode,
+        [str(c) for c in value_cols],
+    ))
+
+
+def _load_pan_derived_array(stem: str, sig: str) -> Optional[np.ndarray]:
+    """Memory-map a persisted derived matrix, or ``None`` if absent or stale."""
+    cache_dir = _pan_derived_cache_dir()
+    cache_file = cache_dir / f"{stem}.npy"
+    sig_file = cache_dir / f"{stem}.sig"
+    try:
+        if (cache_file.exists() and sig_file.exists()
+                and sig_file.read_text() == sig):
+            return np.load(cache_file, mmap_mode="r")
+    except Exception:
+        pass  # any cache-read problem -> recompute from the frame
+    return None
+
+
+def _store_pan_derived_array(matrix: np.ndarray, stem: str, sig: str) -> None:
+    matrix.flags.writeable = False
+    cache_dir = _pan_derived_cache_dir()
+    sig_file = cache_dir / f"{stem}.sig"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        sig_file.unlink(missing_ok=True)
+        _save_pan_cache_array(cache_dir / f"{stem}.npy", matrix)
+        sig_file.write_text(sig)
+    except Exception:
+        pass  # caching is best-effort; never fail the accessor on a write error
+
+
+def _transient_pan_derived_matrix64(
+    value_cols: Sequence[str],
+    mode: str,
+    *,
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+) -> np.ndarray:
+    """Float64 derived matrix a down-cast is built from, not memoized.
+
+    Same lookup order as :func:`_transient_pan_linear_frame64`: the memoized
+    matrix if resident, the persisted float64 artifact, then a fresh
+    computation that is persisted but not kept.
+    """
+    key = (
+        bool(include_computed_rollups), collapse_kind, mode,
+        np.dtype(np.float64).name,
+    )
+    cached = _PAN_DERIVED_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
+    stem = f"{_pan_cache_stem(include_computed_rollups, collapse_kind)}-{mode}"
+    sig = _pan_derived_signature(
+        include_computed_rollups, collapse_kind, mode, value_cols,
+    )
+    matrix = _load_pan_derived_array(stem, sig)
+    if matrix is not None:
+        return matrix
+    if mode == "tpm_clean_log1p":
+        matrix = np.log1p(_transient_pan_derived_matrix64(
+            value_cols, "tpm_clean",
+            include_computed_rollups=include_computed_rollups,
+            collapse_kind=collapse_kind,
+        ))
+    else:
+        matrix = _compute_pan_derived_matrix(
+            _transient_pan_linear_frame64(include_computed_rollups, collapse_kind),
+            value_cols,
+            mode,
+            include_computed_rollups=include_computed_rollups,
+            collapse_kind=collapse_kind,
+        )
+    _store_pan_derived_array(matrix, stem, sig)
+    return matrix
+
+
+def build_pan_cancer_expression_cache(
+    include_computed_rollups: Sequence[bool] = (False, True),
+    collapse_kinds: Sequence[Optional[str]] = (None, "cdna", "protein"),
+    dtypes: Optional[Sequence] = None,
+) -> Path:
+    """Materialize every persisted pan-cancer matrix for this data release.
+
+    Writes the canonical linear matrix plus its ``tpm_clean``, ``hk``,
+    ``percentile``, ``tpm_log1p`` and ``tpm_clean_log1p`` variants for each
+    requested rollup / collapse combination, so a fresh worker's first
+    :func:`pan_cancer_expression` call memory-maps them instead of parsing the
+    CSV. :func:`pan_cancer_expression` does the same lazily on first use; run
+    this once at image build or deploy time to front-load the cost.
+    ``dtypes`` defaults to the process storage dtype
+    (:func:`pirlygenes.load_dataset.set_float_dtype_default`).
+
+    Returns
+    -------
+    Path
+        The cache directory.
+    """
+    if dtypes is None:
+        dtypes = [_resolve_float_dtype(None)]
+    for dtype in map(_resolve_float_dtype, dtypes):
+        for include in include_computed_rollups:
+            for kind in collapse_kinds:
+                frame = _pan_linear_frame(include, kind, dtype)
+                value_cols = _pan_analysis_value_cols(frame)
+                for mode in _PAN_DERIVED_MODES:
+                    _pan_derived_matrix(
+                        frame,
+                        value_cols,
+                        mode,
+                        include_computed_rollups=include,
+                        collapse_kind=kind,
+                        dtype=dtype,
+                    )
+    return _pan_derived_cache_dir()
+
+
+# ---------- pan-cancer per-column normalization factors ----------
+#
+# clean TPM, HK and percentile are column-wise transforms whose constants
+# depend on the whole column (compartment sums, the HK median-of-ratios
+# denominator, the rank distribution) but whose application is row-local. We
+# compute the constants once per canonical frame — memoized in-process and
+# persisted best-effort beside the derived matrices — and apply them only to
+# the rows a caller asked for.
+
+_PAN_FACTOR_CACHE_FORMAT = 1
+_PAN_FACTOR_CACHE: dict = {}
+register_cache(
+    "expression.accessors._PAN_FACTOR_CACHE", lambda: _PAN_FACTOR_CACHE,
+)
+
+
+def _pan_frame_fingerprint(frame: pd.DataFrame, value_cols: Sequence[str]) -> str:
+    """Content hash of the ids + analysis values the factors are derived from."""
+    hashed = pd.util.hash_pandas_object(
+        frame[["Ensembl_Gene_ID", *value_cols]], index=False,
+    )
+    digest = hashlib.sha1(hashed.to_numpy().tobytes())
+    digest.update(repr(list(value_cols)).encode())
+    return digest.hexdigest()
+
+
+def _pan_gene_table(df: pd.DataFrame) -> pd.DataFrame:
+    """``Symbol`` + ``Ensembl_Gene_ID`` gene table, as clean TPM builds it."""
+    return pd.DataFrame(
+        {
+            "Symbol": df["Symbol"].fillna("").astype(str),
+            "Ensembl_Gene_ID": df["Ensembl_Gene_ID"].fillna("").astype(str),
+        },
+        index=df.index,
+    )
+
+
+def _compute_pan_normalization_factors(
+    frame: pd.DataFrame,
+    value_cols: Sequence[str],
+    mode: str,
+) -> dict[str, np.ndarray]:
+    """Derive one mode's per-column constants from the full pan matrix."""
+    values = frame[list(value_cols)].apply(pd.to_numeric, errors="coerce")
+    if mode == "tpm_clean":
+        return {"scales": _clean_tpm_column_scales(values, _pan_gene_table(frame))}
+    if mode == "hk":
+        _, record = tpm_to_housekeeping_normalized(
+            frame, id_col="Ensembl_Gene_ID", value_cols=list(value_cols),
+        )
+        denominators = _housekeeping_column_denominators(record, value_cols)
+        return {
+            "denominators": np.array(
+                [denominators[col] for col in value_cols], dtype=float,
+            ),
+        }
+    if mode == "percentile":
+        matrix = values.to_numpy(dtype=float).T
+        return {
+            "sorted": np.sort(matrix, axis=1),
+            "counts": np.count_nonzero(~np.isnan(matrix), axis=1),
+        }
+    raise ValueError(f"no per-column normalization factors for {mode!r}")
+
+
+def _pan_normalization_factors(
+    frame: pd.DataFrame,
+    value_cols: Sequence[str],
+    mode: str,
+    *,
+    include_computed_rollups: bool,
+    collapse_kind: Optional[str],
+) -> dict[str, np.ndarray]:
+    """Per-column factors for ``mode``, computed at most once per frame.
+
+    The in-process memo is keyed on the identity of the cached linear frame.
+    The disk copy is validated by a signature over the cache format,
+    ``DATA_VERSION``, the oncoref version (which owns the clean-TPM compartments
+    and HK reference profile), and a content fingerprint of the frame; any
+    cache error silently falls back to recomputing.
+    """
+    key = (bool(include_computed_rollups), collapse_kind, mode)
+    cached = _PAN_FACTOR_CACHE.get(key)
+    if cached is not None and cached[0] is frame:
+        return cached[1]
+    with _PAN_FLIGHTS(("factors", *key)):
+        cached = _PAN_FACTOR_CACHE.get(key)
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+        import oncoref
+
+        sig = repr((
+            _PAN_FACTOR_CACHE_FORMAT,
+            DATA_VERSION,
+            str(oncoref.__version__),
+            mode,
+            _pan_frame_fingerprint(frame, value_cols),
+        ))
+        stem = (
+            f"{_pan_cache_stem(include_computed_rollups, collapse_kind)}"
+            f"-{mode}-factors"
+        )
+        cache_dir = _pan_derived_cache_dir()
+        cache_file = cache_dir / f"{stem}.npz"
+        sig_file = cache_dir / f"{stem}.sig"
+        factors = None
+        try:
+            if (cache_file.exists() and sig_file.exists()
+                    and sig_file.read_text() == sig):
+                with np.load(cache_file) as stored:
+                    factors = {name: stored[name] for name in stored.files}
+        except Exception:
+            factors = None  # any cache-read problem -> recompute from the frame
+        if factors is None:
+            factors = _compute_pan_normalization_factors(frame, value_cols, mode)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                sig_file.unlink(missing_ok=True)
+                tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp, "wb") as handle:
+                    np.savez(handle, **factors)
+                os.replace(tmp, cache_file)
+                sig_file.write_text(sig)
+            except Exception:
+                pass  # caching is best-effort; never fail the accessor on a write error
+        _PAN_FACTOR_CACHE[key] = (frame, factors)
+    return factors
+
+
+def _apply_pan_normalization_factors(
+    df: pd.DataFrame,
+    value_cols: Sequence[str],
+    mode: str,
+    factors: Mapping[str, np.ndarray],
+    *,
+    factor_cols: Sequence[str],
+) -> pd.DataFrame:
+    """Normalize ``value_cols`` of a row/column subset of the factor source
+    frame. ``factor_cols`` is the column order ``factors`` were computed in."""
+    positions = pd.Index(factor_cols).get_indexer(list(value_cols))
+    values = df[list(value_cols)].apply(pd.to_numeric, errors="coerce")
+    if mode == "tpm_clean":
+        return _apply_clean_tpm_column_scales(
+            values, _pan_gene_table(df), factors["scales"][:, positions],
+        )
+    if mode == "hk":
+        return values.div(
+            pd.Series(factors["denominators"][positions], index=values.columns),
+            axis=1,
+        )
+    if mode == "percentile":
+        ranked = {}
+        for col, i in zip(value_cols, positions):
+            count = int(factors["counts"][i])
+            reference = factors["sorted"][i, :count]
+            vals = values[col].to_numpy(dtype=float)
+            missing = np.isnan(vals)
+            if count == 0:
+                ranked[col] = np.full(len(vals), np.nan)
+                continue
+            # Average-tie rank against the full column, as Series.rank(pct=True).
+            left = np.searchsorted(reference, vals, side="left")
+            right = np.searchsorted(reference, vals, side="right")
+            pct = (left + 1 + right) / 2 / count * 100
+            ranked[col] = np.where(missing, np.nan, pct)
+        return pd.DataFrame(ranked, index=df.index, columns=list(value_cols))
+    raise ValueError(f"no per-column normalization factors for {mode!r}")
+
+
+def _pan_entity_value_cols(
+    frame: pd.DataFrame,
+    *,
+    cancer_types: Optional[str | Iterable[str]],
+    tissues: Optional[str | Iterable[str]],
+) -> Optional[list[str]]:
+    """Raw value columns selected by a ``cancer_types=`` / ``tissues=`` projection.
+
+    ``None`` when neither is given (keep every entity). Once either is given,
+    the other kind contributes no columns unless it is also named, so
+    ``cancer_types=["PRAD"]`` projects to PRAD alone. Cancer types accept pan
+    codes or registry aliases; tissue names match case-insensitively with
+    spaces treated as underscores.
+    """
+    if cancer_types is None and tissues is None:
+        return None
+    code_cols: dict[str, list[str]] = {}
+    tissue_cols: dict[str, list[str]] = {}
+    for col in frame.columns:
+        col = str(col)
+        if col.startswith("nTPM_"):
+            tissue_cols.setdefault(col[len("nTPM_"):], []).append(col)
+        elif col.startswith(("FPKM_", "TPM_")):
+            code_cols.setdefault(col.split("_", 1)[1], []).append(col)
+
+    selected: set[str] = set()
+    if cancer_types is not None:
+        from ..gene_sets_cancer import resolve_cancer_type
+
+        if isinstance(cancer_types, str):
+            cancer_types = [cancer_types]
+        for token in cancer_types:
+            raw = str(token).strip()
+            code = raw if raw in code_cols else (
+                resolve_cancer_type(raw, strict=False) or raw.upper()
+            )
+            if code not in code_cols:
+                hint = (
+                    "; computed rollups need include_computed_rollups=True"
+                    if code in _PAN_COMPUTED_ROLLUP_MEMBERS
+                    else ""
+                )
+                raise ValueError(
+                    f"no pan-cancer expression columns for cancer type "
+                    f"{token!r}{hint}"
+                )
+            selected.update(code_cols[code])
+    if tissues is not None:
+        by_key = {
+            name.lower().replace(" ", "_"): name for name in tissue_cols
+        }
+        if isinstance(tissues, str):
+            tissues = [tissues]
+        for token in tissues:
+            name = by_key.get(str(token).strip().lower().replace(" ", "_"))
+            if name is None:
+                raise ValueError(
+                    f"no pan-cancer expression column for tissue {token!r}"
+                )
+            selected.update(tissue_cols[name])
+    return [col for col in frame.columns if col in selected]
+
+
 def _resolve_id_col(df: pd.DataFrame) -> Optional[str]:
     """Find the Ensembl-ID column — wide frames use ``Ensembl_Gene_ID``,
     long frames may use ``ensembl_gene_id``."""
@@ -404,26 +1097,41 @@ def normalize_to_housekeeping(
         )
     cols = list(value_cols) if value_cols is not None else _default_value_cols(df)
     out, record = tpm_to_housekeeping_normalized(df, id_col=id_col, value_cols=cols)
+    denominators = _housekeeping_column_denominators(
+        record, [col for col in cols if col in out.columns],
+    )
+    failed_cols = [col for col, denom in denominators.items() if np.isnan(denom)]
+    if failed_cols:
+        out = out.copy()
+        out[failed_cols] = np.nan
+    return out
+
+
+def _housekeeping_column_denominators(
+    record: object,
+    cols: Sequence[str],
+) -> dict[str, float]:
+    """Per-column divisor recorded by :func:`tpm_to_housekeeping_normalized`.
+
+    ``NaN`` marks a column that could not be put on the housekeeping ratio
+    scale; ``1.0`` marks a column the delegate left untouched.
+    """
     columns = record.get("columns", {}) if isinstance(record, dict) else {}
     applied = bool(record.get("applied")) if isinstance(record, dict) else False
-    failed_cols: list[str] = []
+    out: dict[str, float] = {}
     for col in cols:
-        if col not in out.columns:
-            continue
         col_record = columns.get(col)
         if col_record is None:
-            if not applied:
-                failed_cols.append(col)
+            out[col] = 1.0 if applied else np.nan
             continue
         try:
             denominator = float(col_record.get("denominator", 0.0))
         except (TypeError, ValueError):
             denominator = 0.0
-        if col_record.get("applied") is False or denominator <= 0:
-            failed_cols.append(col)
-    if failed_cols:
-        out = out.copy()
-        out[failed_cols] = np.nan
+        if col_record.get("applied") is False or not denominator > 0:
+            out[col] = np.nan
+        else:
+            out[col] = denominator
     return out
 
 
@@ -813,6 +1521,10 @@ def _load_cancer_reference_expression() -> pd.DataFrame:
 # from it is stable until the data reloads. The gene-independent availability
 # manifest deliberately does not use this cache (#565).
 _REFERENCE_VIEW_CACHE: dict[str, tuple] = {}
+_REFERENCE_VIEW_FLIGHTS = _SingleFlight()
+register_cache(
+    "expression.accessors._REFERENCE_VIEW_CACHE", lambda: _REFERENCE_VIEW_CACHE,
+)
 
 
 def _string_id_columns(df: pd.DataFrame, *cols: str) -> pd.DataFrame:
@@ -823,14 +1535,58 @@ def _string_id_columns(df: pd.DataFrame, *cols: str) -> pd.DataFrame:
     return df
 
 
+# Identifier columns that repeat a small vocabulary on every row; Arrow results
+# carry them dictionary-encoded instead of one string per row.
+_ARROW_DICTIONARY_COLUMNS = ("cancer_code", "source_cohort", "normalization")
+_ARROW_ATTRS_METADATA_KEY = b"pirlygenes.attrs"
+
+
+def _validate_return_type(return_type: str) -> None:
+    if return_type not in {"pandas", "arrow"}:
+        raise ValueError("return_type must be 'pandas' or 'arrow'")
+
+
+def _arrow_table(df: pd.DataFrame):
+    """Convert a finished result frame to a :class:`pyarrow.Table`.
+
+    The frame is converted as-is (no defensive copy first — the table owns its
+    buffers), ``cancer_code`` / ``source_cohort`` / ``normalization`` are
+    dictionary-encoded, and ``DataFrame.attrs`` travel as JSON under the
+    ``pirlygenes.attrs`` schema-metadata key."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for name in _ARROW_DICTIONARY_COLUMNS:
+        if name not in table.column_names:
+            continue
+        position = table.column_names.index(name)
+        column = table.column(position)
+        if not pa.types.is_dictionary(column.type):
+            table = table.set_column(
+                position, name, pc.dictionary_encode(column),
+            )
+    if df.attrs:
+        metadata = dict(table.schema.metadata or {})
+        metadata[_ARROW_ATTRS_METADATA_KEY] = json.dumps(
+            df.attrs, default=str, sort_keys=True,
+        ).encode()
+        table = table.replace_schema_metadata(metadata)
+    return table
+
+
 def _reference_view(key: str, builder):
     """Return ``builder(reference_frame)``, memoized on the frame's identity."""
     df = _load_cancer_reference_expression()
     cached = _REFERENCE_VIEW_CACHE.get(key)
     if cached is not None and cached[0] is df:
         return cached[1]
-    value = builder(df)
-    _REFERENCE_VIEW_CACHE[key] = (df, value)
+    with _REFERENCE_VIEW_FLIGHTS(key):
+        cached = _REFERENCE_VIEW_CACHE.get(key)
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        value = builder(df)
+        _REFERENCE_VIEW_CACHE[key] = (df, value)
     return value
 
 
@@ -842,7 +1598,7 @@ def _reference_code_set() -> frozenset:
     )
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _oncoref_summary_reference_code_set() -> frozenset:
     """Reference codes served by oncoref's all-source summary view."""
     import oncoref
@@ -858,7 +1614,7 @@ def _oncoref_summary_reference_code_set() -> frozenset:
     )
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _oncoref_summary_source_cohort_set() -> frozenset:
     """Physical source cohorts served by oncoref's all-source summary view."""
     import oncoref
@@ -896,7 +1652,7 @@ def _is_nonphysical_reference_source_cohort(source_cohort: object) -> bool:
     return cohort == "LITERATURE_CURATED" or cohort.startswith("COMPUTED_")
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def _owner_physical_source_cohorts(source_cohort: str) -> tuple[str, ...]:
     """Resolve an owner registry source to its selected physical matrices.
 
@@ -935,7 +1691,7 @@ def _owner_physical_source_cohorts(source_cohort: str) -> tuple[str, ...]:
     return tuple(physical) or (canonical,)
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _oncoref_artifact_reference_code_set() -> frozenset:
     """Reference codes served by oncoref's canonical percentile artifacts."""
     import oncoref
@@ -950,7 +1706,7 @@ def _oncoref_artifact_reference_code_set() -> frozenset:
     )
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _oncoref_reference_code_set() -> frozenset:
     """All codes loadable through the delegated compatibility accessor."""
     return frozenset(
@@ -1197,7 +1953,7 @@ def available_cancer_expression_references() -> pd.DataFrame:
     return _load_available_reference_manifest().copy()
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _load_available_reference_manifest() -> pd.DataFrame:
     import oncoref
 
@@ -1692,7 +2448,7 @@ def _reference_record_is_microarray_proxy(record: Mapping[str, object]) -> bool:
     )
 
 
-@lru_cache(maxsize=32)
+@cached(maxsize=32)
 def _oncoref_summary_microarray_proxy_pairs(
     cancer_codes: Optional[tuple[str, ...]],
 ) -> frozenset[tuple[str, str]]:
@@ -1926,11 +2682,21 @@ def _artifact_sample_qc_by_code(codes: Sequence[str]) -> dict[str, str]:
     return policies
 
 
-def _oncoref_reference_mode(
+def _reference_delegated_mode(mode: str) -> str:
+    """The linear oncoref mode a legacy normalization mode is derived from.
+
+    Both historical log views come from delegated linear summaries. Besides
+    keeping one deterministic transform, this ensures identical-locus collapse
+    and pooling happen in linear space before log1p.
+    """
+    return mode.removesuffix("_log1p") if mode.endswith("_log1p") else mode
+
+
+def _oncoref_reference_linear(
     *,
     cancer_types: Optional[str | Iterable[str]],
     genes: Optional[Iterable[str]],
-    mode: str,
+    delegated_mode: str,
     include_provenance: bool,
     exclude_microarray_proxy: bool,
     source_kind: Optional[str | Iterable[str]],
@@ -1938,16 +2704,15 @@ def _oncoref_reference_mode(
     collapse_protein_identical: bool,
     collapse_cdna_identical: bool,
     pool: bool,
-) -> pd.DataFrame:
-    """Delegate one legacy normalization mode and adapt its labels/schema."""
+) -> tuple[pd.DataFrame, dict, list[str]]:
+    """Fetch, filter, pool and code-constrain one delegated linear mode.
+
+    Returns the linear rows, their merged attrs and the compatibility
+    transforms applied so far; :func:`_reference_mode_view` labels (and for
+    log modes, transforms) them without mutating the shared inputs.
+    """
     import oncoref
 
-    # Derive both historical log views from delegated linear summaries. Besides
-    # keeping one deterministic transform, this ensures identical-locus collapse
-    # and pooling happen in linear space before log1p.
-    delegated_mode = (
-        mode.removesuffix("_log1p") if mode.endswith("_log1p") else mode
-    )
     requested_genes = (
         None
         if genes is None
@@ -2088,7 +2853,6 @@ def _oncoref_reference_mode(
         )
     if pool:
         delegated = _pool_reference_compatibility_rows(delegated)
-    label = _REFERENCE_VALUE_COLUMNS[mode][3]
     delegated = delegated.copy()
     compatibility_transforms: list[str] = []
     if compatibility_genes != requested_genes:
@@ -2142,6 +2906,23 @@ def _oncoref_reference_mode(
                 for record in attrs.get(attr_name, [])
                 if str(record.get("cancer_code", "")) in allowed_codes
             ]
+    return delegated, attrs, compatibility_transforms
+
+
+def _reference_mode_view(
+    delegated: pd.DataFrame,
+    attrs: Mapping,
+    compatibility_transforms: Sequence[str],
+    *,
+    mode: str,
+    include_provenance: bool,
+    pool: bool,
+) -> pd.DataFrame:
+    """Label one legacy mode's view of a shared delegated linear fetch."""
+    label = _REFERENCE_VALUE_COLUMNS[mode][3]
+    delegated = delegated.copy()
+    attrs = dict(attrs)
+    compatibility_transforms = list(compatibility_transforms)
     delegated["normalization"] = label
     # Collapse/pool in linear space before deriving the historical raw-log view.
     if mode.endswith("_log1p"):
@@ -2159,11 +2940,12 @@ def _oncoref_reference_mode(
             "source_project",
         ] = "pooled"
 
-    out = _project_oncoref_reference_schema(
-        delegated,
-        include_provenance=include_provenance,
-        pool=pool,
-    )
+    with span("project", mode=mode):
+        out = _project_oncoref_reference_schema(
+            delegated,
+            include_provenance=include_provenance,
+            pool=pool,
+        )
     out.attrs.update(attrs)
     availability = _compatibility_availability_records(
         attrs.get("availability", []), label=label
@@ -2242,6 +3024,41 @@ def _reference_wide_from_delegated_long(
     return wide
 
 
+# Identical reference queries (an API layer replays a handful of them) are
+# served from a byte-bounded LRU of finished results instead of redoing the
+# delegation, projection, pooling and wide pivot.
+_REFERENCE_RESULT_CACHE_ENV_VAR = "PIRLYGENES_REFERENCE_CACHE_BYTES"
+_REFERENCE_RESULT_CACHE_DEFAULT_BYTES = 256 * 2**20
+
+
+def _reference_result_cache_budget() -> int:
+    try:
+        return int(os.environ[_REFERENCE_RESULT_CACHE_ENV_VAR])
+    except (KeyError, ValueError):
+        return _REFERENCE_RESULT_CACHE_DEFAULT_BYTES
+
+
+_REFERENCE_RESULT_CACHE = _FrameLRUCache(_reference_result_cache_budget())
+register_cache(
+    "expression.accessors._REFERENCE_RESULT_CACHE",
+    lambda: _REFERENCE_RESULT_CACHE,
+)
+
+
+def _reference_result_key(request: Mapping) -> tuple:
+    """Hashable cache key: the normalized request plus the data versions."""
+    import oncoref
+
+    def freeze(value):
+        return tuple(value) if isinstance(value, (list, tuple)) else value
+
+    return (
+        DATA_VERSION,
+        str(oncoref.__version__),
+        *((name, freeze(value)) for name, value in sorted(request.items())),
+    )
+
+
 def cancer_reference_expression(
     cancer_types: Optional[str | Iterable[str]] = None,
     genes: Optional[Iterable[str]] = None,
@@ -2255,6 +3072,7 @@ def cancer_reference_expression(
     collapse_protein_identical: bool = False,
     collapse_cdna_identical: bool = False,
     pool: bool = False,
+    return_type: str = "pandas",
 ) -> pd.DataFrame:
     """Source-agnostic tumor expression references delegated to oncoref.
 
@@ -2317,44 +3135,116 @@ def cancer_reference_expression(
         gene contribute. ``source_cohort`` becomes ``"POOLED"``; ``q1`` and
         ``q3`` are ``NaN`` because quantiles cannot be reconstructed from cohort
         summaries. Pool only pipeline-comparable sources.
+    return_type
+        ``"pandas"`` (default) or ``"arrow"`` for a :class:`pyarrow.Table`
+        with dictionary-encoded ``cancer_code`` / ``source_cohort`` /
+        ``normalization`` columns and ``attrs`` as JSON schema metadata
+        (``pirlygenes.attrs``).
 
     Returns
     -------
     pd.DataFrame
-        Defensive copy suitable for downstream mutation. ``attrs`` records the
-        delegation target, availability, missing requests, and compatibility
-        transforms.
+        Defensive copy suitable for downstream mutation (a zero-copy read-only
+        view under :func:`pirlygenes.load_dataset.set_readonly_default`).
+        ``attrs`` records the delegation target, availability, missing
+        requests, and compatibility transforms. A ``pyarrow.Table`` when
+        ``return_type="arrow"``.
+
+    Notes
+    -----
+    Results are memoized in a process-wide LRU keyed on the normalized
+    request plus ``DATA_VERSION`` and the oncoref version, bounded by a byte
+    budget (``PIRLYGENES_REFERENCE_CACHE_BYTES``, default 256 MiB; see
+    :func:`set_reference_expression_cache_budget`). Inspect it with
+    ``cancer_reference_expression.cache_info()`` and reset it with
+    ``cancer_reference_expression.cache_clear()``.
     """
     modes = _resolve_reference_normalize_modes(normalize)
     _validate_reference_format(format)
-    # Every mode is one delegated call. Materialize one-shot iterables once so
-    # generators select the same request for every normalization stage.
+    _validate_return_type(return_type)
+    # Every distinct linear mode is one delegated call. Materialize one-shot
+    # iterables once so generators select the same request for every stage.
     def materialize(value):
         return value if value is None or isinstance(value, str) else list(value)
 
-    cancer_types = materialize(cancer_types)
-    genes = materialize(genes)
-    source_kind = materialize(source_kind)
-    source_cohort = materialize(source_cohort)
+    request = dict(
+        cancer_types=materialize(cancer_types),
+        genes=materialize(genes),
+        modes=modes,
+        format=format,
+        include_provenance=include_provenance,
+        exclude_microarray_proxy=exclude_microarray_proxy,
+        source_kind=materialize(source_kind),
+        source_cohort=materialize(source_cohort),
+        collapse_protein_identical=collapse_protein_identical,
+        collapse_cdna_identical=collapse_cdna_identical,
+        pool=pool,
+    )
+    try:
+        key = _reference_result_key(request)
+        cached = _REFERENCE_RESULT_CACHE.get(key)
+    except TypeError:  # unhashable request values: serve uncached
+        key = cached = None
+    if cached is None:
+        with span("cancer_reference_expression", format=format, pool=pool):
+            cached = _cancer_reference_expression(**request)
+        if key is not None:
+            _REFERENCE_RESULT_CACHE.put(key, cached)
+    if return_type == "arrow":
+        return _arrow_table(cached)
+    if _resolve_readonly(None):
+        return _readonly_frame(cached)
+    with span("copy"):
+        return cached.copy()
+
+
+def _cancer_reference_expression(
+    *,
+    cancer_types: Optional[str | list[str]],
+    genes: Optional[str | list[str]],
+    modes: Sequence[str],
+    format: str,
+    include_provenance: bool,
+    exclude_microarray_proxy: bool,
+    source_kind: Optional[str | list[str]],
+    source_cohort: Optional[str | list[str]],
+    collapse_protein_identical: bool,
+    collapse_cdna_identical: bool,
+    pool: bool,
+) -> pd.DataFrame:
+    """Uncached body of :func:`cancer_reference_expression`."""
     requested_codes = _resolve_cancer_types(
         cancer_types,
         expand_aggregates=True,
     )
-    parts = [
-        _oncoref_reference_mode(
-            cancer_types=requested_codes,
-            genes=genes,
-            mode=mode,
-            include_provenance=include_provenance,
-            exclude_microarray_proxy=exclude_microarray_proxy,
-            source_kind=source_kind,
-            source_cohort=source_cohort,
-            collapse_protein_identical=collapse_protein_identical,
-            collapse_cdna_identical=collapse_cdna_identical,
-            pool=pool,
-        )
-        for mode in modes
-    ]
+    # One delegated fetch (with its filtering and pooling) per distinct linear
+    # mode; log views are derived from the shared linear rows in memory.
+    linear_by_mode: dict[str, tuple] = {}
+    parts = []
+    for mode in modes:
+        delegated_mode = _reference_delegated_mode(mode)
+        if delegated_mode not in linear_by_mode:
+            with span("load", mode=delegated_mode):
+                linear_by_mode[delegated_mode] = _oncoref_reference_linear(
+                    cancer_types=requested_codes,
+                    genes=genes,
+                    delegated_mode=delegated_mode,
+                    include_provenance=include_provenance,
+                    exclude_microarray_proxy=exclude_microarray_proxy,
+                    source_kind=source_kind,
+                    source_cohort=source_cohort,
+                    collapse_protein_identical=collapse_protein_identical,
+                    collapse_cdna_identical=collapse_cdna_identical,
+                    pool=pool,
+                )
+        with span("normalize", mode=mode):
+            parts.append(_reference_mode_view(
+                *linear_by_mode[delegated_mode],
+                mode=mode,
+                include_provenance=include_provenance,
+                pool=pool,
+            ))
+    del linear_by_mode
     if parts:
         long = pd.concat(parts, ignore_index=True)
     else:
@@ -2386,12 +3276,26 @@ def cancer_reference_expression(
             if code in _oncoref_reference_code_set()
         ]
     )
-    return _reference_wide_from_delegated_long(
-        long,
-        modes=modes,
-        parts=parts,
-        requested_codes=wide_requested_codes,
-    )
+    with span("pivot"):
+        return _reference_wide_from_delegated_long(
+            long,
+            modes=modes,
+            parts=parts,
+            requested_codes=wide_requested_codes,
+        )
+
+
+cancer_reference_expression.cache_info = _REFERENCE_RESULT_CACHE.info
+cancer_reference_expression.cache_clear = _REFERENCE_RESULT_CACHE.clear
+
+
+def set_reference_expression_cache_budget(maxbytes: int) -> int:
+    """Set the :func:`cancer_reference_expression` result-cache byte budget.
+
+    Evicts least-recently-used results down to the new budget; ``0`` disables
+    caching. Returns the previous budget.
+    """
+    return _REFERENCE_RESULT_CACHE.resize(maxbytes)
 
 
 # ---------- accessors: unified normalization views (#319) ----------
@@ -2405,6 +3309,10 @@ _COHORT_VIEW_VALUE_FILES = {
 }
 _COHORT_VIEW_PROVENANCE_FILE = "provenance.parquet"
 _ARTIFACT_MANIFEST_FILE = "_manifest.json"
+# Rows per parquet row group in the value matrices. Rows are written sorted by
+# Ensembl ID, so each group covers a narrow ENSG range and its min/max
+# statistics let a gene-filtered read skip every group that cannot match.
+_COHORT_VIEW_ROW_GROUP_SIZE = 1024
 
 
 class CohortExpressionViews:
@@ -2429,18 +3337,101 @@ class CohortExpressionViews:
     here — only recorded in ``provenance.processing_pipeline``. All three value
     views are on the TPM scale; the only differences are the censoring stage,
     so they are directly comparable and can't be accidentally re-normalized.
+
+    Each stage is computed on first access and cached, so a consumer that only
+    reads ``tpm`` never materializes the clean stages. Constructor arguments
+    may be DataFrames or zero-argument callables returning one. When
+    ``clean_tpm_biological`` is ``None`` it is a row mask over ``clean_tpm``:
+    the mask is computed once and each access takes those rows, so no second
+    gene × cohort frame stays resident. Stages are built at most once
+    even under concurrent first access, and a stage whose build raised is
+    rebuilt on the next access. Stages may also be
+    :class:`pyarrow.Table` objects (``cohort_expression_views(...,
+    return_type="arrow")``).
     """
 
-    __slots__ = ("tpm", "clean_tpm", "clean_tpm_biological", "provenance")
+    __slots__ = ("_sources", "_frames", "_lock")
 
     def __init__(self, tpm, clean_tpm, clean_tpm_biological, provenance):
-        self.tpm = _object_column_index(tpm)
-        self.clean_tpm = _object_column_index(clean_tpm)
-        self.clean_tpm_biological = _object_column_index(clean_tpm_biological)
-        self.provenance = _object_column_index(provenance)
+        self._sources = {
+            "tpm": tpm,
+            "clean_tpm": clean_tpm,
+            "clean_tpm_biological": clean_tpm_biological,
+            "provenance": provenance,
+        }
+        self._frames = {}
+        # Re-entrant: the derived biological stage builds clean_tpm under it.
+        self._lock = threading.RLock()
+
+    def _stage(self, name: str) -> pd.DataFrame:
+        frame = self._frames.get(name)
+        if frame is not None:
+            return frame
+        with self._lock:
+            frame = self._frames.get(name)
+            if frame is None:
+                frame = self._build_stage(name)
+                self._frames[name] = frame
+                # Drop the source only once its frame is safely cached, so a
+                # failed build can be retried.
+                self._sources.pop(name, None)
+        return frame
+
+    def _build_stage(self, name: str) -> pd.DataFrame:
+        if name == "biological_rows":
+            return _biological_row_mask(self.clean_tpm)
+        source = self._sources[name]
+        frame = source() if callable(source) else source
+        if isinstance(frame, pd.DataFrame):
+            frame = _object_column_index(frame)
+        return frame
+
+    @property
+    def tpm(self) -> pd.DataFrame:
+        return self._stage("tpm")
+
+    @property
+    def clean_tpm(self) -> pd.DataFrame:
+        return self._stage("clean_tpm")
+
+    @property
+    def clean_tpm_biological(self) -> pd.DataFrame:
+        if (
+            "clean_tpm_biological" in self._frames
+            or self._sources.get("clean_tpm_biological") is not None
+        ):
+            return self._stage("clean_tpm_biological")
+        # Derived: only the row mask is cached, never a second frame.
+        clean = self.clean_tpm
+        if clean.empty:
+            return clean
+        return clean.loc[self._stage("biological_rows")].reset_index(drop=True)
+
+    @property
+    def provenance(self) -> pd.DataFrame:
+        return self._stage("provenance")
+
+    def matrix(self, stage: str = "clean_tpm", *, dtype=np.float64):
+        """One value stage as a dense :class:`ExpressionMatrix` (genes ×
+        cohorts, labelled with the stage name) for numerical consumers."""
+        from .matrix import ExpressionMatrix
+
+        if stage not in ("tpm", "clean_tpm", "clean_tpm_biological"):
+            raise ValueError(
+                "stage must be 'tpm', 'clean_tpm' or 'clean_tpm_biological'"
+            )
+        frame = getattr(self, stage)
+        if not isinstance(frame, pd.DataFrame):
+            frame = frame.to_pandas()
+        return ExpressionMatrix.from_frame(
+            frame,
+            value_cols=_cohort_value_cols(frame),
+            normalization=stage,
+            dtype=dtype,
+        )
 
     def __repr__(self):
-        cohorts = list(self.provenance["source_cohort"]) if len(
+        cohorts = [str(c) for c in self.provenance["source_cohort"]] if len(
             self.provenance) else []
         return (f"CohortExpressionViews(genes={self.tpm.shape[0]}, "
                 f"cohorts={self.provenance.shape[0]}, "
@@ -2472,20 +3463,197 @@ def _cohort_views_present(root: Path) -> bool:
     )
 
 
-@lru_cache(maxsize=4)
-def _load_precomputed_cohort_views(root_text: str) -> tuple[pd.DataFrame, ...]:
+def _write_cohort_view_parquet(wide: pd.DataFrame, path: Path) -> None:
+    """Serialize one canonical value matrix in the pushdown-friendly layout:
+    rows sorted by ``Ensembl_Gene_ID`` in bounded row groups (with column
+    statistics), one column chunk per cohort. A reader can then project just
+    the requested cohorts and skip row groups outside the requested genes."""
+    (wide.sort_values("Ensembl_Gene_ID", kind="stable")
+     .reset_index(drop=True)
+     .to_parquet(path, index=False, compression="zstd",
+                 row_group_size=_COHORT_VIEW_ROW_GROUP_SIZE))
+
+
+@cached(maxsize=4)
+def _load_precomputed_cohort_views(
+    root_text: str,
+    dtype_name: str = "float64",
+) -> tuple[pd.DataFrame, ...]:
     root = Path(root_text)
-    tpm = _object_column_index(
-        pd.read_parquet(root / _COHORT_VIEW_VALUE_FILES["tpm"])
+    stamps = _cohort_view_stamps(root)
+    tpm, clean = (
+        _object_column_index(_cast_float_columns(
+            pd.read_parquet(root / _COHORT_VIEW_VALUE_FILES[name]), dtype_name,
+        ))
+        for name in ("tpm", "clean_tpm")
     )
-    clean = _object_column_index(
-        pd.read_parquet(root / _COHORT_VIEW_VALUE_FILES["clean_tpm"])
+    frames = (tpm, clean, _load_precomputed_cohort_view_provenance(root_text))
+    _RESIDENT_COHORT_VIEWS[(root_text, dtype_name)] = (
+        stamps, tuple(weakref.ref(frame) for frame in frames),
     )
-    provenance = _refresh_cohort_view_provenance(
-        _object_column_index(
-            pd.read_parquet(root / _COHORT_VIEW_PROVENANCE_FILE)
-        )
+    return frames
+
+
+# (root, dtype) -> (artifact stamps, weak refs to the memoized full frames),
+# so a filtered request can slice the full views when they are already
+# resident instead of re-reading the artifact. Weak references never keep an
+# evicted entry alive, clearing the loader's cache forgets every entry, and
+# the stamps reject a regenerated artifact.
+_RESIDENT_COHORT_VIEWS: dict = {}
+_clear_precomputed_cohort_views = _load_precomputed_cohort_views.cache_clear
+
+
+def _clear_resident_cohort_views() -> None:
+    _RESIDENT_COHORT_VIEWS.clear()
+    _clear_precomputed_cohort_views()
+
+
+_load_precomputed_cohort_views.cache_clear = _clear_resident_cohort_views
+
+
+def _cohort_view_stamps(root: Path) -> tuple:
+    """``(size, mtime_ns)`` of every precomputed cohort-view file."""
+    stamps = []
+    for name in (*_COHORT_VIEW_VALUE_FILES.values(), _COHORT_VIEW_PROVENANCE_FILE):
+        stat = (root / name).stat()
+        stamps.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(stamps)
+
+
+def _resident_cohort_views(
+    root: Path,
+    dtype=np.float64,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None:
+    """The memoized full views for ``root`` / ``dtype`` if still resident and
+    current, else ``None`` (never triggers a load)."""
+    entry = _RESIDENT_COHORT_VIEWS.get((str(root), np.dtype(dtype).name))
+    if entry is None:
+        return None
+    stamps, refs = entry
+    frames = tuple(ref() for ref in refs)
+    if any(frame is None for frame in frames):
+        return None
+    try:
+        if _cohort_view_stamps(root) != stamps:
+            return None
+    except OSError:
+        return None
+    return frames
+
+
+def _load_precomputed_cohort_view_provenance(root_text: str) -> pd.DataFrame:
+    path = Path(root_text) / _COHORT_VIEW_PROVENANCE_FILE
+    stat = path.stat()
+    return _cohort_view_provenance(str(path), (stat.st_size, stat.st_mtime_ns))
+
+
+@cached(maxsize=4)
+def _cohort_view_provenance(
+    path_text: str,
+    _stamp: tuple[int, int],
+) -> pd.DataFrame:
+    """The refreshed provenance sidecar, keyed on its (size, mtime) stamp so
+    filtered requests neither re-read it nor re-merge the owner manifest."""
+    return _refresh_cohort_view_provenance(
+        _object_column_index(pd.read_parquet(path_text))
+    )
+
+
+@cached(maxsize=8)
+def _cohort_view_gene_index(
+    path_text: str,
+    _stamp: tuple[int, int],
+) -> pd.DataFrame:
+    """The id columns of one precomputed value matrix — the only full-height
+    read a filtered request needs. Keyed on the file's (size, mtime) stamp so a
+    regenerated artifact is never served from a stale index."""
+    return _object_column_index(
+        pd.read_parquet(path_text, columns=list(_COHORT_VIEW_ID_COLS))
     )
+
+
+def _read_cohort_view_slice(
+    path: Path,
+    codes: list[str] | None,
+    genes: list[str] | None,
+    dtype=np.float64,
+) -> pd.DataFrame | None:
+    """Read only the cohort columns and gene rows a request can touch.
+
+    Cohort selection is pushed down as a column projection; the gene list is
+    resolved against the cached id columns (so symbols, aliases and retired
+    IDs match exactly as the in-memory filter would) and pushed down as an
+    ``Ensembl_Gene_ID`` predicate, which prunes whole row groups by their
+    statistics. Returns ``None`` when the file lacks the id columns, so the
+    caller can take the validated full-read path instead."""
+    import pyarrow.parquet as pq
+
+    names = pq.read_schema(path).names
+    if not set(_COHORT_VIEW_ID_COLS) <= set(names):
+        return None
+    columns = None
+    if codes is not None:
+        columns = [
+            *_COHORT_VIEW_ID_COLS,
+            *(c for c in dict.fromkeys(codes)
+              if c in names and c not in _COHORT_VIEW_ID_COLS),
+        ]
+    filters = None
+    if genes is not None:
+        stat = path.stat()
+        index = _cohort_view_gene_index(str(path), (stat.st_size, stat.st_mtime_ns))
+        gene_ids = sorted(set(
+            _filter_canonical_view_genes(index, genes)["Ensembl_Gene_ID"]
+            .astype(str)
+        ))
+        if not gene_ids:
+            return index.iloc[0:0].reset_index(drop=True)
+        filters = [("Ensembl_Gene_ID", "in", gene_ids)]
+    return _object_column_index(_cast_float_columns(
+        pd.read_parquet(path, columns=columns, filters=filters), dtype,
+    ))
+
+
+def _precomputed_cohort_views_slice(
+    cancer_types: Optional[str | Iterable[str]],
+    genes: Optional[Iterable[str]],
+    dtype=np.float64,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None:
+    """Pre-narrowed (tpm, clean_tpm, provenance) frames for a filtered request,
+    read straight from the precomputed artifact with projection and predicate
+    pushdown, so a single-cohort or few-gene query never decodes every
+    cohort's column chunks. When the full views are already memoized they
+    are returned as-is instead — slicing resident frames beats any disk
+    read. The frames are a superset of what
+    :func:`_apply_cohort_view_filters` keeps, which then runs unchanged.
+
+    ``None`` means "use the full canonical views": no usable artifact, or a
+    file that cannot be read this way — the full path re-validates it and
+    warns about corruption there."""
+    root = Path(_cohort_views_root())
+    if not _cohort_views_usable(root):
+        return None
+    resident = _resident_cohort_views(root, dtype)
+    if resident is not None:
+        return resident
+    import pyarrow as pa
+
+    codes = _resolve_cancer_types(cancer_types, expand_aggregates=True)
+    gene_list = None if genes is None else list(genes)
+    try:
+        tpm, clean = (
+            _read_cohort_view_slice(
+                root / _COHORT_VIEW_VALUE_FILES[name], codes, gene_list, dtype,
+            )
+            for name in ("tpm", "clean_tpm")
+        )
+    except (OSError, pa.ArrowException):  # corrupt or unreadable parquet
+        return None
+    if tpm is None or clean is None:
+        return None
+    # Provenance failures (oncoref manifest, network) are real errors, not a
+    # reason to rebuild the views from the long reference.
+    provenance = _load_precomputed_cohort_view_provenance(str(root))
     return tpm, clean, provenance
 
 
@@ -2617,11 +3785,13 @@ def _drop_unmeasured_gene_rows(wide: pd.DataFrame) -> pd.DataFrame:
 def _select_cohort_columns(
     wide: pd.DataFrame,
     codes: list[str] | None,
+    *,
+    readonly: bool = False,
 ) -> pd.DataFrame:
-    if codes is None:
-        return wide.copy()
-    selected = [c for c in dict.fromkeys(codes) if c in wide.columns]
-    return wide[[*_COHORT_VIEW_ID_COLS, *selected]].copy()
+    if codes is not None:
+        selected = [c for c in dict.fromkeys(codes) if c in wide.columns]
+        wide = wide[[*_COHORT_VIEW_ID_COLS, *selected]]
+    return _readonly_frame(wide) if readonly else wide.copy()
 
 
 def _select_cohort_view_rows(
@@ -2734,7 +3904,9 @@ def _pivot_views_long(
     return wide
 
 
-def _rebuild_full_canonical_views() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def _rebuild_full_canonical_views(
+    dtype=np.float64,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Build the **full** canonical wide matrices (every gene × every cohort)
     plus a provenance table that still carries ``cancer_code``.
 
@@ -2744,15 +3916,20 @@ def _rebuild_full_canonical_views() -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
     ``scripts/generate_cohort_expression_views.py``), so the read path can treat
     "load artifact" and "rebuild" as interchangeable and apply one identical
     filter to either. Memoized on the reference-frame identity so a process that
-    has no artifact pays this rebuild at most once, not per query.
+    has no artifact pays this rebuild at most once, not per query. Each storage
+    ``dtype`` is memoized on its own, so a float32 process never holds the
+    float64 matrices.
     """
+    dtype = np.dtype(dtype)
 
     def _build(_df: pd.DataFrame):
         long = _reference_long_from_summary_frame(_df)
         long = _canonicalize_views_long(long)
         index_cols = ["Ensembl_Gene_ID"]
-        tpm = _pivot_views_long(long, "TPM", index_cols)
-        clean = _pivot_views_long(long, "TPM_clean", index_cols)
+        tpm = _cast_float_columns(_pivot_views_long(long, "TPM", index_cols), dtype)
+        clean = _cast_float_columns(
+            _pivot_views_long(long, "TPM_clean", index_cols), dtype,
+        )
         # Keep the full public availability metadata in future sidecars. The
         # lightweight reader remains compatible with older four-column
         # sidecars by filling these fields from registries (#565).
@@ -2763,7 +3940,10 @@ def _rebuild_full_canonical_views() -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
                       .drop_duplicates().reset_index(drop=True))
         return tpm, clean, provenance
 
-    return _reference_view("full_canonical_views", _build)
+    key = "full_canonical_views"
+    if dtype != np.float64:
+        key += f"-{dtype.name}"
+    return _reference_view(key, _build)
 
 
 def _valid_full_views(frames: tuple[pd.DataFrame, ...]) -> bool:
@@ -2780,7 +3960,9 @@ def _valid_full_views(frames: tuple[pd.DataFrame, ...]) -> bool:
     return True
 
 
-def _full_canonical_views() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def _full_canonical_views(
+    dtype=np.float64,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """The full canonical (tpm, clean_tpm, provenance) frames, served from the
     precomputed artifact when it is present and usable, else rebuilt from the
     reference. Both branches return the identical schema so a single filter
@@ -2789,7 +3971,9 @@ def _full_canonical_views() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     root = Path(_cohort_views_root())
     if _cohort_views_usable(root):
         try:
-            frames = _load_precomputed_cohort_views(str(root))
+            frames = _load_precomputed_cohort_views(
+                str(root), np.dtype(dtype).name,
+            )
         except Exception as exc:  # noqa: BLE001 — corrupt parquet / missing engine
             warnings.warn(
                 f"Precomputed cohort views at {root} could not be read "
@@ -2811,7 +3995,7 @@ def _full_canonical_views() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
                 frames = None
         if frames is not None:
             return frames
-    return _rebuild_full_canonical_views()
+    return _rebuild_full_canonical_views(dtype)
 
 
 def _apply_cohort_view_filters(
@@ -2823,6 +4007,7 @@ def _apply_cohort_view_filters(
     *,
     protein_coding: bool,
     min_cohort_coverage: Optional[float],
+    readonly: bool = False,
 ) -> CohortExpressionViews:
     """Slice the full canonical matrices down to a request. This is the **one**
     canonical-views filter, shared by the precomputed-artifact fast path and the
@@ -2831,46 +4016,51 @@ def _apply_cohort_view_filters(
     Order: select cohort columns → (optional) gene filter → drop cohorts and
     genes left all-missing by the narrowing → protein-coding / coverage row
     filter → biology-only view. Provenance is reduced to the public three
-    columns and aligned to whichever cohorts survive.
+    columns and aligned to whichever cohorts survive. Each stage runs only
+    when the returned views object first reads it.
 
     Whenever ``cancer_types`` or ``genes`` narrows the matrix we prune the
     NaN-only rows and columns the narrowing exposes, so a sliced view contains
     exactly the genes measured in the requested cohorts (matching a pivot of
     that slice) rather than the full all-cohort gene union (#474 review)."""
     codes = _resolve_cancer_types(cancer_types, expand_aggregates=True)
-    tpm = _select_cohort_columns(tpm_full, codes)
-    clean = _select_cohort_columns(clean_full, codes)
+    gene_list = None if genes is None else list(genes)
+    narrowed = codes is not None or gene_list is not None
+
+    def _stage(full: pd.DataFrame) -> pd.DataFrame:
+        wide = _select_cohort_columns(full, codes, readonly=readonly)
+        if gene_list is not None:
+            wide = _filter_canonical_view_genes(wide, gene_list)
+        if narrowed:
+            wide = _drop_unmeasured_gene_rows(
+                _drop_all_missing_cohort_columns(wide)
+            )
+        return _select_cohort_view_rows(
+            wide,
+            protein_coding=protein_coding,
+            min_cohort_coverage=min_cohort_coverage,
+        )
 
-    provenance_codes = codes
-    if genes is not None:
-        gene_list = list(genes)
-        tpm = _filter_canonical_view_genes(tpm, gene_list)
-        clean = _filter_canonical_view_genes(clean, gene_list)
-
-    if codes is not None or genes is not None:
-        tpm = _drop_unmeasured_gene_rows(_drop_all_missing_cohort_columns(tpm))
-        clean = _drop_unmeasured_gene_rows(_drop_all_missing_cohort_columns(clean))
-        provenance_codes = list(dict.fromkeys(
-            _cohort_value_cols(tpm) + _cohort_value_cols(clean)
-        ))
+    def _provenance() -> pd.DataFrame:
+        provenance_codes = codes
+        if narrowed:
+            # Row filters never drop cohort columns, so the surviving cohorts
+            # are exactly those left after the narrowing prune.
+            provenance_codes = list(dict.fromkeys(
+                _cohort_value_cols(views.tpm)
+                + _cohort_value_cols(views.clean_tpm)
+            ))
+        return _filter_cohort_view_provenance(
+            provenance_full, codes=provenance_codes,
+        )
 
-    tpm = _select_cohort_view_rows(
-        tpm,
-        protein_coding=protein_coding,
-        min_cohort_coverage=min_cohort_coverage,
-    )
-    clean = _select_cohort_view_rows(
-        clean,
-        protein_coding=protein_coding,
-        min_cohort_coverage=min_cohort_coverage,
-    )
-    biological = drop_technical_genes(clean) if not clean.empty else clean
-    return CohortExpressionViews(
-        tpm,
-        clean,
-        biological,
-        _filter_cohort_view_provenance(provenance_full, codes=provenance_codes),
+    views = CohortExpressionViews(
+        lambda: _stage(tpm_full),
+        lambda: _stage(clean_full),
+        None,
+        _provenance,
     )
+    return views
 
 
 def _cohort_expression_views_from_reference(
@@ -2880,6 +4070,7 @@ def _cohort_expression_views_from_reference(
     canonicalize_genes: bool = True,
     protein_coding: bool = False,
     min_cohort_coverage: Optional[float] = None,
+    dtype=np.float64,
 ) -> "CohortExpressionViews":
     """Build the views straight from the long reference, filtering during the
     pivot. This is an **independent** implementation of the same contract as the
@@ -2897,19 +4088,20 @@ def _cohort_expression_views_from_reference(
                   else ["Ensembl_Gene_ID", "Symbol"])
 
     tpm = _select_cohort_view_rows(
-        _pivot_views_long(long, "TPM", index_cols),
+        _cast_float_columns(_pivot_views_long(long, "TPM", index_cols), dtype),
         protein_coding=protein_coding,
         min_cohort_coverage=min_cohort_coverage,
     )
     clean = _select_cohort_view_rows(
-        _pivot_views_long(long, "TPM_clean", index_cols),
+        _cast_float_columns(
+            _pivot_views_long(long, "TPM_clean", index_cols), dtype,
+        ),
         protein_coding=protein_coding,
         min_cohort_coverage=min_cohort_coverage,
     )
     # biological inherits clean's gene selection, then drops technical genes.
-    biological = drop_technical_genes(clean) if not clean.empty else clean
     provenance = _filter_cohort_view_provenance(long, codes=None)
-    return CohortExpressionViews(tpm, clean, biological, provenance)
+    return CohortExpressionViews(tpm, clean, None, provenance)
 
 
 def cohort_expression_views(
@@ -2919,6 +4111,9 @@ def cohort_expression_views(
     canonicalize_genes: bool = True,
     protein_coding: bool = False,
     min_cohort_coverage: Optional[float] = None,
+    readonly: Optional[bool] = None,
+    return_type: str = "pandas",
+    dtype=None,
 ) -> "CohortExpressionViews":
     """Bundle a cohort's normalization stages into one
     :class:`CohortExpressionViews` (tpm / clean_tpm / clean_tpm_biological +
@@ -2933,7 +4128,9 @@ def cohort_expression_views(
     That full matrix is served from the precomputed
     ``cancer-reference-expression-views/`` artifact when present, and otherwise
     rebuilt from the reference once and memoized; either way the *same* filter
-    runs, so the fast path and the fallback return identical results.
+    runs, so the fast path and the fallback return identical results. A
+    request narrowed by ``cancer_types`` or ``genes`` reads only the matching
+    cohort columns and gene row groups of the artifact.
     ``canonicalize_genes=False`` opts out of canonicalization entirely and builds
     directly from the long reference (no precomputed artifact applies).
 
@@ -2941,11 +4138,49 @@ def cohort_expression_views(
     authority biotype), and ``min_cohort_coverage`` (0..1) keeps only genes
     measured in at least that fraction of cohorts — together they yield the dense
     coding core and skip the mostly-zero non-coding tail.
+
+    ``readonly=True`` slices the canonical matrices as zero-copy views
+    (non-writeable NumPy buffers under pandas Copy-on-Write) instead of
+    defensive copies; ``None`` follows
+    :func:`pirlygenes.load_dataset.set_readonly_default`. Views built from the
+    long reference (``canonicalize_genes=False``) are always fresh frames.
+
+    ``return_type="arrow"`` makes every stage a :class:`pyarrow.Table`, each
+    converted from the zero-copy slice on first access.
+
+    ``dtype="float32"`` stores and serves the value matrices in float32 (the
+    full canonical matrices are cached once per dtype); ``None`` follows
+    :func:`pirlygenes.load_dataset.set_float_dtype_default`.
     """
     if min_cohort_coverage is not None and not 0 <= min_cohort_coverage <= 1:
         raise ValueError("min_cohort_coverage must be between 0 and 1")
+    _validate_return_type(return_type)
+    dtype = _resolve_float_dtype(dtype)
+    if return_type == "arrow":
+        views = cohort_expression_views(
+            cancer_types,
+            genes,
+            canonicalize_genes=canonicalize_genes,
+            protein_coding=protein_coding,
+            min_cohort_coverage=min_cohort_coverage,
+            readonly=True,
+            dtype=dtype,
+        )
+        return CohortExpressionViews(
+            lambda: _arrow_table(views.tpm),
+            lambda: _arrow_table(views.clean_tpm),
+            lambda: _arrow_table(views.clean_tpm_biological),
+            lambda: _arrow_table(views.provenance),
+        )
     if canonicalize_genes:
-        tpm_full, clean_full, provenance_full = _full_canonical_views()
+        frames = None
+        if cancer_types is not None or genes is not None:
+            frames = _precomputed_cohort_views_slice(
+                cancer_types, genes, dtype,
+            )
+        if frames is None:
+            frames = _full_canonical_views(dtype)
+        tpm_full, clean_full, provenance_full = frames
         return _apply_cohort_view_filters(
             tpm_full,
             clean_full,
@@ -2954,6 +4189,7 @@ def cohort_expression_views(
             genes,
             protein_coding=protein_coding,
             min_cohort_coverage=min_cohort_coverage,
+            readonly=_resolve_readonly(readonly),
         )
     return _cohort_expression_views_from_reference(
         cancer_types,
@@ -2961,6 +4197,7 @@ def cohort_expression_views(
         canonicalize_genes=False,
         protein_coding=protein_coding,
         min_cohort_coverage=min_cohort_coverage,
+        dtype=dtype,
     )
 
 
@@ -3144,6 +4381,11 @@ def pan_cancer_expression(
     drop_technical_rna: bool = False,
     collapse_cdna_identical: bool = False,
     collapse_protein_identical: bool = False,
+    cancer_types: Optional[str | Iterable[str]] = None,
+    tissues: Optional[str | Iterable[str]] = None,
+    readonly: Optional[bool] = None,
+    return_type: str = "pandas",
+    dtype=None,
 ) -> pd.DataFrame:
     """Wide-form expression across HPA normal tissues + TCGA cancer types.
 
@@ -3231,21 +4473,44 @@ def pan_cancer_expression(
         bridge columns ``Proteoform_ID`` (the proteoform each gene folds to — group
         by it to roll up) and ``Member_Ensembl_Gene_IDs`` (constituent ENSGs), so
         the gene/proteoform duality is uniform across accessors.
+    cancer_types / tissues
+        Optional column projection: cancer codes or aliases (``"PRAD"``,
+        ``"prostate"``, ``"NSCLC"`` with ``include_computed_rollups=True``)
+        and HPA tissue names (``"liver"``). Only the named entities' raw and
+        derived columns are normalized, renamed and returned. When either is
+        given the other kind defaults to none, so ``cancer_types=["PRAD"]``
+        returns PRAD alone; leave both ``None`` (default) for every entity.
+        Derived values are identical to the full-width view — normalization
+        constants are always computed over the whole column.
+    readonly
+        Return a zero-copy view instead of a defensive copy: unnormalized
+        columns share the cached matrix's buffers (non-writeable NumPy arrays
+        under pandas Copy-on-Write), and an unfiltered request's derived
+        columns are views of the memory-mapped normalize variants.
+        ``None`` (default) follows
+        :func:`pirlygenes.load_dataset.set_readonly_default`.
+    return_type
+        ``"pandas"`` (default) or ``"arrow"`` for a :class:`pyarrow.Table`
+        converted straight from the assembled view, skipping the defensive
+        copy; ``attrs`` travel as JSON schema metadata (``pirlygenes.attrs``).
+    dtype
+        ``"float32"`` or ``"float64"`` storage for every value column, served
+        from a separately cached (and persisted) matrix per dtype; derived
+        columns are computed in float64 before the down-cast. ``None``
+        (default) follows :func:`pirlygenes.load_dataset.set_float_dtype_default`.
 
     Returns
     -------
     pd.DataFrame
-        Defensive copy — safe to mutate.
+        Defensive copy — safe to mutate — unless ``readonly``. A
+        ``pyarrow.Table`` when ``return_type="arrow"``.
     """
+    _validate_return_type(return_type)
+    dtype = _resolve_float_dtype(dtype)
     normalize_modes = _resolve_pan_normalize_modes(normalize)
     if "tpm" not in normalize_modes:
         normalize_modes.insert(0, "tpm")
 
-    # The cached compatibility view already contains deterministic TPM
-    # companions for every FPKM cohort. Copy it before adding bridge and
-    # normalization columns so callers can mutate independently.
-    df = _pan_reference_frame(include_computed_rollups).copy()
-
     # Proteoform duality (uniform with cancer_reference_expression): always add the
     # gene-view Proteoform_ID / Member_Ensembl_Gene_IDs bridge columns; optionally
     # collapse identical loci in LINEAR space here, BEFORE any clean/log/percentile
@@ -3255,84 +4520,114 @@ def pan_cancer_expression(
                          "collapse_protein_identical")
     _collapse_kind = ("cdna" if collapse_cdna_identical
                       else "protein" if collapse_protein_identical else None)
-    if _collapse_kind:
-        from .protein_groups import collapse_wide, fold_ids, fold_symbols
-        _linear = [c for c in df.columns if c.startswith(_VALUE_COL_PREFIXES)]
-        df = collapse_wide(df, value_cols=_linear, kind=_collapse_kind)
-        if genes is not None:   # fold the gene filter so a member-named panel hits
-            genes = sorted(set(map(str, genes))
-                           | set(fold_symbols(genes, kind=_collapse_kind))
-                           | set(fold_ids(genes, kind=_collapse_kind)))
-    else:
-        from .protein_groups import add_proteoform_columns
-        df = add_proteoform_columns(df)
-    analysis_value_cols = _pan_analysis_value_cols(df)
+    # The cached compatibility view already contains deterministic TPM
+    # companions for every FPKM cohort (and, when collapsing, is summed per
+    # proteoform over the full matrix).
+    with span("load", collapse=_collapse_kind, dtype=dtype.name):
+        frame = _pan_linear_frame(include_computed_rollups, _collapse_kind, dtype)
+    if _collapse_kind and genes is not None:
+        from .protein_groups import fold_ids, fold_symbols
+        # fold the gene filter so a member-named panel hits
+        genes = sorted(set(map(str, genes))
+                       | set(fold_symbols(genes, kind=_collapse_kind))
+                       | set(fold_ids(genes, kind=_collapse_kind)))
+    factor_value_cols = _pan_analysis_value_cols(frame)
+    projected_cols = _pan_entity_value_cols(
+        frame, cancer_types=cancer_types, tissues=tissues,
+    )
 
+    # Row filters and the column projection run first, against the shared
+    # frame: every normalize variant below is precomputed full-width, so
+    # gathering the requested cells gives the same values as normalizing
+    # everything. The filters run on the narrow id columns and select rows by
+    # position, so the wide matrix is gathered once.
+    df = frame
+    if projected_cols is not None:
+        keep = set(projected_cols)
+        df = frame[[
+            col for col in frame.columns
+            if not str(col).startswith(_VALUE_COL_PREFIXES) or col in keep
+        ]]
+    analysis_value_cols = _pan_analysis_value_cols(df)
+    rows = None
+    if drop_technical_rna or genes is not None:
+        id_cols = [
+            col for col in df.columns
+            if not str(col).startswith(_VALUE_COL_PREFIXES)
+        ]
+        selected = df[id_cols].assign(_pan_row=np.arange(len(df)))
+        if drop_technical_rna:
+            selected = filter_technical_rna(selected)
+        if genes is not None:
+            selected = filter_to_genes(selected, genes)
+        rows = selected["_pan_row"].to_numpy()
+        df = df.take(rows).reset_index(drop=True)
+
+    positions = pd.Index(factor_value_cols).get_indexer(analysis_value_cols)
     generated_value_cols: list[str] = []
     value_cols_by_mode: dict[str, list[str]] = {}
     for mode in normalize_modes:
-        if mode == "tpm":
+        if mode not in _PAN_DERIVED_MODES:
             continue
-        if mode == "tpm_clean":
-            # ONE clean TPM everywhere: the fixed_fraction 16/9/75 contract,
-            # identical to cancer_reference_expression. (Was the legacy zero
-            # drop-and-renormalize, which kept ribosomal proteins in biology and
-            # inflated the biological budget to 1e6 — a different, non-comparable
-            # "clean" than the reference table used.)
-            normalized_df, _ = normalize_expression(
-                df,
-                label_col="Symbol",
-                id_col="Ensembl_Gene_ID",
-                value_cols=analysis_value_cols,
-                censored_fill="fixed_fraction",
+        # tpm_clean is the ONE clean TPM everywhere: the fixed_fraction
+        # 16/9/75 contract, identical to cancer_reference_expression and to
+        # normalize_expression(..., censored_fill="fixed_fraction"). HK and
+        # percentile match normalize_to_housekeeping and
+        # percentile_rank_expression over the full matrix.
+        with span("normalize", mode=mode):
+            matrix = _pan_derived_matrix(
+                frame,
+                factor_value_cols,
+                mode,
+                include_computed_rollups=include_computed_rollups,
+                collapse_kind=_collapse_kind,
+                dtype=dtype,
             )
-            source_cols = analysis_value_cols
-        elif mode == "tpm_log1p":
-            normalized_df = log1p_transform(
-                df, value_cols=analysis_value_cols,
+            source_cols = (
+                value_cols_by_mode.get("tpm_clean", [])
+                if mode == "tpm_clean_log1p" else analysis_value_cols
             )
-            source_cols = analysis_value_cols
-        elif mode == "tpm_clean_log1p":
-            clean_value_cols = value_cols_by_mode.get("tpm_clean", [])
-            normalized_df = log1p_transform(
-                df, value_cols=clean_value_cols,
+            df, new_cols = _add_pan_derived_value_cols(
+                df, matrix, positions, rows, source_cols, mode,
             )
-            source_cols = clean_value_cols
-        elif mode == "hk":
-            normalized_df = normalize_to_housekeeping(
-                df, value_cols=analysis_value_cols,
-            )
-            source_cols = analysis_value_cols
-        elif mode == "percentile":
-            normalized_df, _ = percentile_rank_expression(
-                df, value_cols=analysis_value_cols,
-            )
-            source_cols = analysis_value_cols
-        else:  # pragma: no cover - guarded by _resolve_pan_normalize_modes
-            continue
-        df, new_cols = _add_pan_normalized_value_cols(
-            df, normalized_df, source_cols, mode,
-        )
         value_cols_by_mode[mode] = new_cols
         generated_value_cols.extend(new_cols)
     pipeline_value_cols = generated_value_cols or analysis_value_cols
     df = _apply_pipeline(
         df,
-        drop_technical_rna=drop_technical_rna,
-        genes=genes,
         log_transform=log_transform,
         percentile=False,
         value_cols=pipeline_value_cols,
     )
-    out = _rename_pan_expression_columns_entity_first(df)
+    out = _rename_pan_expression_columns_entity_first(
+        _cast_float_columns(df, dtype)
+    )
+    readonly = return_type == "arrow" or _resolve_readonly(readonly)
+    if readonly:
+        out = _readonly_frame(out)
+    else:
+        with span("copy"):
+            out = out.copy()
     out.attrs["computed_rollups_included"] = bool(include_computed_rollups)
     out.attrs["computed_rollup_members"] = {
         code: tuple(members)
         for code, members in _PAN_COMPUTED_ROLLUP_MEMBERS.items()
     }
+    if return_type == "arrow":
+        return _arrow_table(out)
     return out
 
 
+_CANCER_EXPRESSION_PAN_SUFFIXES = {
+    "tpm": "TPM",
+    "tpm_clean": "TPM_clean",
+    "tpm_log1p": "TPM_log1p",
+    "tpm_clean_log1p": "TPM_clean_log1p",
+    "hk": "TPM_hk",
+    "percentile": "TPM_percentile",
+}
+
+
 def cancer_expression(
     cancer_type: str,
     genes: Optional[Iterable[str]] = None,
@@ -3379,6 +4674,9 @@ def cancer_expression(
         )
 
     pan_mode = _canonical_pan_normalize_token(str(normalize))
+    pan_columns = _pan_linear_frame(
+        True, None, _resolve_float_dtype(None),
+    ).columns
     df = pan_cancer_expression(
         genes=genes,
         normalize=pan_mode,
@@ -3386,20 +4684,17 @@ def cancer_expression(
         # columns cannot leak into a comparison population.
         include_computed_rollups=True,
         drop_technical_rna=False,
+        # Project to that entity; an unknown code projects to nothing and is
+        # reported below.
+        cancer_types=(
+            [reference_code] if f"TPM_{reference_code}" in pan_columns else []
+        ),
     )
-    suffix_by_mode = {
-        "tpm": "TPM",
-        "tpm_clean": "TPM_clean",
-        "tpm_log1p": "TPM_log1p",
-        "tpm_clean_log1p": "TPM_clean_log1p",
-        "hk": "TPM_hk",
-        "percentile": "TPM_percentile",
-    }
-    if pan_mode not in suffix_by_mode:
+    if pan_mode not in _CANCER_EXPRESSION_PAN_SUFFIXES:
         raise ValueError(
             f"unsupported normalize mode for cancer_expression: {normalize!r}"
         )
-    col = f"{reference_code}_{suffix_by_mode[pan_mode]}"
+    col = f"{reference_code}_{_CANCER_EXPRESSION_PAN_SUFFIXES[pan_mode]}"
     if col not in df.columns:
         raise ValueError(
             f"no {normalize!r} expression column for {cancer_type!r} "
@@ -3410,6 +4705,205 @@ def cancer_expression(
     )
 
 
+def cancer_expressions(
+    cancer_types: str | Iterable[str],
+    genes: Optional[Iterable[str]] = None,
+    normalize: str = "tpm_clean",
+) -> pd.DataFrame:
+    """:func:`cancer_expression` for several cancer types as one gene × code
+    matrix.
+
+    Codes are grouped by backing source: every TCGA-backed code is read from a
+    single :func:`pan_cancer_expression` pass projected to the requested
+    entities, and every delegated reference code from a single
+    :func:`cancer_reference_expression` call, instead of one rebuild or
+    request per code.
+
+    Parameters
+    ----------
+    cancer_types
+        Registry codes or aliases (e.g. ``["PRAD", "CLL", "lung"]``).
+    genes
+        Optional gene-symbol / Ensembl-ID subset.
+    normalize
+        Normalization mode, as for :func:`cancer_expression`.
+
+    Returns
+    -------
+    pd.DataFrame
+        ``Ensembl_Gene_ID``, ``Symbol``, then one column per resolved code in
+        request order (duplicates dropped). Genes are the union over sources;
+        a gene a source does not measure is ``NaN`` for its codes. A code with
+        several delegated source rows per gene keeps the first, as in
+        ``cancer_reference_expression(format="wide")``.
+    """
+    from ..gene_sets_cancer import cancer_type_registry, resolve_cancer_type
+
+    if isinstance(cancer_types, str):
+        cancer_types = [cancer_types]
+    if genes is not None:
+        genes = list(genes)
+
+    ref_modes = set(_REFERENCE_NORMALIZE_ALIASES.values())
+    ref_mode = _REFERENCE_NORMALIZE_ALIASES.get(normalize)
+    if ref_mode is None:
+        ref_mode = _REFERENCE_NORMALIZE_ALIASES.get(str(normalize).lower())
+    registry = cancer_type_registry().set_index("code")
+    reference_codes = _oncoref_reference_code_set()
+    pan_codes = _pan_expression_codes()
+
+    requested: dict[str, str] = {}
+    reference_group: dict[str, str] = {}
+    pan_group: dict[str, str] = {}
+    for cancer_type in cancer_types:
+        code = resolve_cancer_type(cancer_type)
+        if code in requested:
+            continue
+        requested[code] = cancer_type
+        reference_code = _resolve_expression_reference_code_from_lookups(
+            code,
+            registry=registry,
+            reference_codes=reference_codes,
+            pan_codes=pan_codes,
+        ) or code
+        if ref_mode in ref_modes and reference_code in reference_codes:
+            reference_group[code] = reference_code
+        else:
+            pan_group[code] = reference_code
+
+    parts = []
+    if pan_group:
+        pan_mode = _canonical_pan_normalize_token(str(normalize))
+        pan_columns = _pan_linear_frame(
+            True, None, _resolve_float_dtype(None),
+        ).columns
+        df = pan_cancer_expression(
+            genes=genes,
+            normalize=pan_mode,
+            include_computed_rollups=True,
+            drop_technical_rna=False,
+            cancer_types=[
+                reference_code
+                for reference_code in dict.fromkeys(pan_group.values())
+                if f"TPM_{reference_code}" in pan_columns
+            ],
+        )
+        if pan_mode not in _CANCER_EXPRESSION_PAN_SUFFIXES:
+            raise ValueError(
+                f"unsupported normalize mode for cancer_expression: {normalize!r}"
+            )
+        suffix = _CANCER_EXPRESSION_PAN_SUFFIXES[pan_mode]
+        part = df[["Ensembl_Gene_ID", "Symbol"]].copy()
+        for code, reference_code in pan_group.items():
+            col = f"{reference_code}_{suffix}"
+            if col not in df.columns:
+                raise ValueError(
+                    f"no {normalize!r} expression column for "
+                    f"{requested[code]!r} (resolved to {code!r})"
+                )
+            part[code] = df[col]
+        parts.append(part)
+    if reference_group:
+        ref = cancer_reference_expression(
+            cancer_types=list(dict.fromkeys(reference_group.values())),
+            genes=genes,
+            normalize=ref_mode,
+            include_provenance=False,
+        )
+        ref_codes = ref["cancer_code"].astype(str)
+        part = ref[["Ensembl_Gene_ID", "Symbol"]].drop_duplicates(
+            subset=["Ensembl_Gene_ID"],
+        )
+        for code, reference_code in reference_group.items():
+            # Aggregate references come back as their member codes' rows.
+            members = _resolve_cancer_types(reference_code, expand_aggregates=True)
+            values = ref.loc[
+                ref_codes.isin(members), ["Ensembl_Gene_ID", "expression"]
+            ].drop_duplicates(subset=["Ensembl_Gene_ID"])
+            part = part.merge(
+                values.rename(columns={"expression": code}),
+                on="Ensembl_Gene_ID",
+                how="left",
+            )
+        parts.append(part)
+
+    if not parts:
+        return pd.DataFrame(columns=["Ensembl_Gene_ID", "Symbol"])
+    out = parts[0]
+    for part in parts[1:]:
+        out = out.merge(
+            part,
+            on="Ensembl_Gene_ID",
+            how="outer",
+            sort=False,
+            suffixes=("", "_other"),
+        )
+        out["Symbol"] = out["Symbol"].fillna(out.pop("Symbol_other"))
+    return out[["Ensembl_Gene_ID", "Symbol", *requested]].reset_index(drop=True)
+
+
+def _enrichment_source_cols(df: pd.DataFrame) -> list[str]:
+    """Clean-TPM columns of the 33 independent source cohorts.
+
+    Paired FPKM provenance distinguishes the source cohorts from the TPM-only
+    computed rollups. Including rollups in a background would count source
+    cohorts more than once (for example LUAD both directly and via NSCLC).
+    """
+    return [
+        col
+        for col in df.columns
+        if col.endswith("_TPM_clean")
+        and f"{col[:-len('_TPM_clean')]}_FPKM" in df.columns
+    ]
+
+
+def _enrichment_table(
+    df: pd.DataFrame,
+    expression: pd.Series,
+    other_median: pd.Series,
+    min_fold: float,
+    min_expression: float,
+) -> pd.DataFrame:
+    result = df[["Ensembl_Gene_ID", "Symbol"]].copy()
+    result["expression"] = expression
+    result["other_median"] = other_median
+    result["fold_change"] = (result["expression"] + 0.001) / (
+        result["other_median"] + 0.001
+    )
+    result = result[
+        (result["expression"] >= min_expression)
+        & (result["fold_change"] >= min_fold)
+    ].sort_values("fold_change", ascending=False)
+    return result.reset_index(drop=True)
+
+
+def _leave_one_out_row_medians(values: np.ndarray) -> np.ndarray:
+    """``out[i, j]``: NaN-skipping median of row ``i`` without column ``j``.
+
+    Each row is sorted once; dropping column ``j`` shifts the sorted positions
+    at or above its rank down by one, so every leave-one-out median is two
+    gathers from the same sorted matrix.
+    """
+    n_rows, n_cols = values.shape
+    order = np.argsort(values, axis=1, kind="stable")  # NaN sorts last
+    ordered = np.take_along_axis(values, order, axis=1)
+    rank = np.empty_like(order)
+    np.put_along_axis(
+        rank, order, np.broadcast_to(np.arange(n_cols), order.shape), axis=1,
+    )
+    present = ~np.isnan(values)
+    remaining = present.sum(axis=1, keepdims=True) - present
+
+    def gather(q):
+        position = np.where(present & (q >= rank), q + 1, q)
+        return np.take_along_axis(
+            ordered, np.clip(position, 0, n_cols - 1), axis=1,
+        )
+
+    medians = (gather((remaining - 1) // 2) + gather(remaining // 2)) / 2
+    return np.where(remaining > 0, medians, np.nan)
+
+
 def cancer_enriched_genes(
     cancer_type: str,
     min_fold: float = 3.0,
@@ -3436,6 +4930,10 @@ def cancer_enriched_genes(
     pd.DataFrame
         Columns: ``Ensembl_Gene_ID``, ``Symbol``, ``expression``,
         ``other_median``, ``fold_change``. Sorted by fold_change desc.
+
+    See Also
+    --------
+    cancer_enriched_genes_all : every cancer type from one matrix.
     """
     from ..gene_sets_cancer import resolve_cancer_type
 
@@ -3453,32 +4951,87 @@ def cancer_enriched_genes(
             f"no clean-TPM column for {cancer_type!r} "
             f"(resolved to {code!r})"
         )
-    # Paired FPKM provenance distinguishes the 33 source cohorts from the
-    # TPM-only computed rollups. Including rollups here would count source
-    # cohorts more than once (for example LUAD both directly and via NSCLC).
-    source_cols = [
-        col
-        for col in df.columns
-        if col.endswith("_TPM_clean")
-        and f"{col[:-len('_TPM_clean')]}_FPKM" in df.columns
-    ]
     excluded_codes = {code, *_PAN_COMPUTED_ROLLUP_MEMBERS.get(code, ())}
     other_cols = [
         col
-        for col in source_cols
+        for col in _enrichment_source_cols(df)
         if col[:-len("_TPM_clean")] not in excluded_codes
     ]
-    result = df[["Ensembl_Gene_ID", "Symbol"]].copy()
-    result["expression"] = df[target_col].astype(float)
-    result["other_median"] = df[other_cols].astype(float).median(axis=1)
-    result["fold_change"] = (result["expression"] + 0.001) / (
-        result["other_median"] + 0.001
+    return _enrichment_table(
+        df,
+        df[target_col].astype(float),
+        df[other_cols].astype(float).median(axis=1),
+        min_fold,
+        min_expression,
     )
-    result = result[
-        (result["expression"] >= min_expression)
-        & (result["fold_change"] >= min_fold)
-    ].sort_values("fold_change", ascending=False)
-    return result.reset_index(drop=True)
+
+
+def cancer_enriched_genes_all(
+    min_fold: float = 3.0,
+    min_expression: float = 0.01,
+) -> pd.DataFrame:
+    """:func:`cancer_enriched_genes` for every cancer type in one pass.
+
+    Builds the clean pan matrix once and derives every source cohort's
+    leave-one-out background median from a single row-wise sort, so the
+    per-type tables cost one matrix instead of one rebuild each. Computed
+    rollups are targets too; their backgrounds exclude their member cohorts,
+    exactly as in :func:`cancer_enriched_genes`.
+
+    Parameters
+    ----------
+    min_fold
+        Minimum fold-change over the median of all other cancer types.
+    min_expression
+        Minimum clean-TPM expression in the target cancer.
+
+    Returns
+    -------
+    pd.DataFrame
+        Long table with columns ``cancer_code``, ``Ensembl_Gene_ID``,
+        ``Symbol``, ``expression``, ``other_median``, ``fold_change``. Each
+        code's rows equal ``cancer_enriched_genes(code, ...)`` (sorted by
+        fold_change desc); codes follow pan-matrix column order.
+    """
+    df = pan_cancer_expression(
+        normalize="tpm_clean",
+        include_computed_rollups=True,
+        drop_technical_rna=True,
+    )
+    source_cols = _enrichment_source_cols(df)
+    source_values = df[source_cols].astype(float).to_numpy()
+    loo_medians = _leave_one_out_row_medians(source_values)
+    source_codes = [col[:-len("_TPM_clean")] for col in source_cols]
+
+    tables = []
+    for col in df.columns:
+        if not col.endswith("_TPM_clean"):
+            continue
+        code = col[:-len("_TPM_clean")]
+        if code in source_codes:
+            other_median = pd.Series(
+                loo_medians[:, source_codes.index(code)], index=df.index,
+            )
+        else:
+            # Rollup target: a handful of member-excluding backgrounds.
+            excluded_codes = {code, *_PAN_COMPUTED_ROLLUP_MEMBERS.get(code, ())}
+            other_cols = [
+                source_col
+                for source_col, source_code in zip(source_cols, source_codes)
+                if source_code not in excluded_codes
+            ]
+            other_median = df[other_cols].astype(float).median(axis=1)
+        table = _enrichment_table(
+            df, df[col].astype(float), other_median, min_fold, min_expression,
+        )
+        table.insert(0, "cancer_code", code)
+        tables.append(table)
+    if not tables:
+        return pd.DataFrame(columns=[
+            "cancer_code", "Ensembl_Gene_ID", "Symbol",
+            "expression", "other_median", "fold_change",
+        ])
+    return pd.concat(tables, ignore_index=True)
 
 
 # ---------- accessors: HPA cell-type + ESTIMATE signatures ----------
@@ -3510,13 +5063,16 @@ __all__ = [
     # accessors
     "pan_cancer_expression",
     "cancer_reference_expression",
+    "set_reference_expression_cache_budget",
     "available_cancer_expression_references",
     "cancer_expression_reference_status",
     "cancer_expression_source_candidates",
     "tumor_up_vs_matched_normal",
     "heme_tumor_up_vs_matched_normal",
     "cancer_expression",
+    "cancer_expressions",
     "cancer_enriched_genes",
+    "cancer_enriched_genes_all",
     "hpa_cell_type_expression",
     "estimate_signatures",
     # normalization
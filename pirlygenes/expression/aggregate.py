@@ -22,6 +22,7 @@ from pathlib import Path
 import pandas as pd
 from tqdm import tqdm
 
+from pirlygenes.caches import cached
 from pirlygenes.gene_ids import (
     _build_indexes,
     find_gene_and_ensembl_release_by_name,
@@ -48,7 +49,7 @@ def find_column(df: pd.DataFrame, candidates: list[str], column_name: str) -> st
     )
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _load_extra_tx_mappings() -> dict[str, str]:
     """Return ``{transcript_id: gene_symbol}`` from
     ``pirlygenes/data/extra-tx-mappings.csv`` — the back-compat
@@ -80,6 +81,34 @@ def _expanded_tx_map(tx_to_gene_name: dict[str, str]) -> dict[str, str]:
     return out
 
 
+@cached(maxsize=None)
+def _lookup_gene_meta(gene_name: str) -> tuple:
+    """``(gene_id, ensembl_release)`` of a gene symbol, ``(None, -1)`` if
+    no installed release knows it."""
+    pair = find_gene_and_ensembl_release_by_name(gene_name)
+    if pair is None:
+        return (None, -1)
+    ensembl_genome, gene = pair
+    return (gene.id, ensembl_genome.release)
+
+
+def _lookup_gene_metas(genes, progress: bool = False) -> tuple[list, list]:
+    """Gene IDs and Ensembl releases for ``genes``, in order.
+
+    Each symbol costs a handful of pyensembl SQLite queries the first time;
+    :func:`_lookup_gene_meta` remembers it for the rest of the process.
+    """
+    iterator = tqdm(
+        list(genes),
+        desc="Resolving Ensembl gene IDs",
+        disable=not progress,
+    )
+    metas = [_lookup_gene_meta(gene_name) for gene_name in iterator]
+    gene_ids = [gene_id for gene_id, _ in metas]
+    releases = [-1 if release is None else int(release) for _, release in metas]
+    return gene_ids, releases
+
+
 def aggregate_gene_expression(
     df: pd.DataFrame,
     tx_to_gene_name: dict[str, str] = extra_tx_mappings,
@@ -89,6 +118,7 @@ def aggregate_gene_expression(
     tpm_column_candidates: list[str] = ("tpm",),
     verbose: bool = False,
     progress: bool = False,
+    resolve_gene_ids: bool = True,
 ) -> pd.DataFrame:
     """
     Aggregate transcript-level TPM values to gene-level TPM values.
@@ -98,6 +128,10 @@ def aggregate_gene_expression(
       - TPM
       - gene_id
       - ensembl_release
+
+    ``resolve_gene_ids=False`` stops after the roll-up and leaves out the
+    last two columns, for callers that look the IDs up once over many
+    samples (see :func:`_lookup_gene_metas`).
     """
     if verbose:
         print(f"[aggregate] Starting transcript->gene aggregation for {len(df)} rows")
@@ -202,32 +236,14 @@ def aggregate_gene_expression(
             f"{unknown_genes_tpm:.2f} to unknown gene names; {pct_known:.4f}% known"
         )
 
-    @lru_cache(maxsize=None)
-    def _lookup_gene_meta(gene_name: str):
-        pair = find_gene_and_ensembl_release_by_name(gene_name)
-        if pair is None:
-            return (None, -1)
-        ensembl_genome, gene = pair
-        return (gene.id, ensembl_genome.release)
-
-    genes = list(df_gene_expr["gene"])
-    metas = []
-    iterator = tqdm(
-        genes,
-        desc="Resolving Ensembl gene IDs",
-        disable=not progress,
-    )
-    for gene_name in iterator:
-        metas.append(_lookup_gene_meta(gene_name))
-
-    if metas:
-        gene_ids, releases = zip(*metas)
-    else:
-        gene_ids, releases = (), ()
-    df_gene_expr["gene_id"] = list(gene_ids)
-    df_gene_expr["ensembl_release"] = (
-        pd.Series(releases, index=df_gene_expr.index).fillna(-1).astype(int)
-    )
+    if resolve_gene_ids:
+        gene_ids, releases = _lookup_gene_metas(
+            df_gene_expr["gene"], progress=progress,
+        )
+        df_gene_expr["gene_id"] = gene_ids
+        df_gene_expr["ensembl_release"] = pd.Series(
+            releases, index=df_gene_expr.index, dtype=int,
+        )
 
     if verbose:
         print(f"[aggregate] Completed aggregation with {len(df_gene_expr)} genes")
@@ -0,0 +1,221 @@
+"""Batch normalization of per-sample quantification outputs.
+
+An intake batch is a directory of salmon-style runs — one
+``<sample>/quant.sf`` per sample, or flat ``<sample>.sf`` files.
+:func:`normalize_quant_directory` rolls every sample up to genes with
+:func:`~pirlygenes.expression.aggregate_gene_expression` in a process pool,
+joins them into one gene × sample matrix and normalizes it with a single
+compiled :class:`~pirlygenes.expression.NormalizationPlan`.
+
+The transcript → gene resolution is the expensive, per-sample step, so that
+is what the pool parallelizes. The Ensembl index is loaded once in the
+parent before the pool starts; on platforms with ``fork`` the workers share
+it copy-on-write instead of each rebuilding it. Workers return symbol-keyed
+TPM only: the symbol → Ensembl gene ID lookup runs once in the parent over
+the union of genes after the pool has finished, rather than once per sample
+in every worker. The parent's pyensembl SQLite connections are closed before
+the pool forks so no worker reuses one. Normalization is per column,
+so running it once over the joined matrix gives the same values as
+normalizing each sample on its own, without re-deriving the gene-side state
+per sample.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Union
+
+import pandas as pd
+
+from ..cohorts import ID_COLS
+from .aggregate import (
+    _lookup_gene_metas,
+    aggregate_gene_expression,
+    extra_tx_mappings,
+)
+from .plan import NormalizationPlan
+
+
+_QUANT_FILE = "quant.sf"
+_QUANT_SUFFIX = ".sf"
+# Entity-first value-column suffix per normalization mode, as in
+# pan_cancer_expression's public columns.
+_MODE_COLUMN_SUFFIXES = {
+    "tpm": "_TPM",
+    "tpm_clean": "_TPM_clean",
+    "tpm_log1p": "_TPM_log1p",
+    "tpm_clean_log1p": "_TPM_clean_log1p",
+    "hk": "_TPM_hk",
+    "percentile": "_TPM_percentile",
+}
+
+# Transcript → gene map handed to pool workers once, by the initializer,
+# rather than pickled with every task.
+_WORKER_TX_MAP: Optional[Mapping[str, str]] = None
+
+
+def discover_quant_files(
+    input_dir: Union[str, Path],
+    *,
+    quant_file: str = _QUANT_FILE,
+) -> dict[str, Path]:
+    """``{sample: path}`` for every quantification output in ``input_dir``.
+
+    A subdirectory holding ``quant_file`` is one sample named after the
+    directory; a top-level ``*.sf`` file is one sample named after its stem.
+    Samples are returned sorted by name.
+    """
+    input_dir = Path(input_dir)
+    if not input_dir.is_dir():
+        raise FileNotFoundError(f"input directory not found: {input_dir}")
+    found: dict[str, Path] = {}
+    for child in sorted(input_dir.iterdir()):
+        if child.is_dir() and (child / quant_file).is_file():
+            sample = child.name
+            path = child / quant_file
+        elif child.is_file() and child.suffix == _QUANT_SUFFIX:
+            sample = child.stem
+            path = child
+        else:
+            continue
+        if sample in found:
+            raise ValueError(
+                f"sample {sample!r} appears twice in {input_dir}: "
+                f"{found[sample]} and {path}"
+            )
+        found[sample] = path
+    return found
+
+
+def _init_worker(tx_to_gene_name) -> None:
+    global _WORKER_TX_MAP
+    _WORKER_TX_MAP = tx_to_gene_name
+
+
+def _aggregate_sample(task: tuple[str, Path]) -> tuple[str, pd.Series]:
+    """Gene-level TPM of one sample, keyed on gene symbol."""
+    sample, path = task
+    quant = pd.read_csv(path, sep="\t")
+    genes = aggregate_gene_expression(
+        quant,
+        tx_to_gene_name=(
+            extra_tx_mappings if _WORKER_TX_MAP is None else _WORKER_TX_MAP
+        ),
+        resolve_gene_ids=False,
+    )
+    return sample, pd.Series(
+        genes["TPM"].to_numpy(dtype=float),
+        index=pd.Index(genes["gene"].astype(str), name="Symbol"),
+    )
+
+
+def _pool_context():
+    """``fork`` where available so workers inherit the loaded index."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def normalize_quant_directory(
+    input_dir: Union[str, Path],
+    output: Union[str, Path],
+    *,
+    modes: Union[str, Iterable[str]] = ("tpm_clean",),
+    jobs: Optional[int] = 1,
+    quant_file: str = _QUANT_FILE,
+    tx_to_gene_name: Optional[Mapping[str, str]] = None,
+    dtype=None,
+) -> Path:
+    """Aggregate and normalize every sample under ``input_dir`` into one parquet.
+
+    Parameters
+    ----------
+    input_dir
+        Directory of quantification outputs (see :func:`discover_quant_files`).
+    output
+        Destination parquet: ``Ensembl_Gene_ID``, ``Symbol``, then one
+        ``<sample><suffix>`` column per sample and mode — ``_TPM``,
+        ``_TPM_clean``, ``_TPM_log1p``, ``_TPM_clean_log1p``, ``_TPM_hk``,
+        ``_TPM_percentile``. Genes are the union across samples; a gene absent
+        from a sample's quantification is ``NaN`` there.
+    modes
+        :class:`NormalizationPlan` modes; dependencies (``tpm_clean`` for
+        ``tpm_clean_log1p``) are written too.
+    jobs
+        Worker processes for the transcript → gene roll-up. ``1`` runs in
+        process; ``None`` or ``0`` uses every CPU.
+    quant_file
+        File name looked for inside each sample directory.
+    tx_to_gene_name
+        Transcript → gene-symbol map forwarded to
+        :func:`aggregate_gene_expression` (defaults to its own).
+    dtype
+        Storage dtype of the value columns; ``None`` follows
+        :func:`pirlygenes.load_dataset.set_float_dtype_default`.
+
+    Returns
+    -------
+    Path
+        ``output``.
+    """
+    from ..gene_ids import _build_indexes, _close_genome_databases
+    from ..load_dataset import _resolve_float_dtype
+
+    samples = discover_quant_files(input_dir, quant_file=quant_file)
+    if not samples:
+        raise ValueError(
+            f"no {quant_file} sample directories or *{_QUANT_SUFFIX} files "
+            f"in {input_dir}"
+        )
+    if jobs is not None and int(jobs) < 0:
+        raise ValueError("jobs must be a positive number of processes")
+    jobs = int(jobs) if jobs else (os.cpu_count() or 1)
+    # Fail on a bad mode before paying for any aggregation.
+    NormalizationPlan.compile([], modes=modes)
+    dtype = _resolve_float_dtype(dtype)
+
+    tasks = list(samples.items())
+    _build_indexes()
+    if jobs == 1 or len(tasks) == 1:
+        _init_worker(tx_to_gene_name)
+        try:
+            results = dict(map(_aggregate_sample, tasks))
+        finally:
+            _init_worker(None)
+    else:
+        _close_genome_databases()
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(tasks)),
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(tx_to_gene_name,),
+        ) as pool:
+            results = dict(pool.map(_aggregate_sample, tasks))
+
+    matrix = pd.concat(
+        [results[sample] for sample in samples], axis=1, keys=list(samples),
+    )
+    gene_ids, _ = _lookup_gene_metas(matrix.index)
+    matrix.index = pd.MultiIndex.from_arrays(
+        [pd.Index(gene_ids).fillna("").astype(str), matrix.index],
+        names=list(ID_COLS),
+    )
+    matrix = matrix.sort_index()
+    genes = matrix.index.to_frame(index=False)
+    plan = NormalizationPlan.compile(genes, modes=modes)
+    normalized = plan.apply(matrix.to_numpy(dtype=float))
+
+    columns = {col: genes[col].to_numpy() for col in ID_COLS}
+    for mode in plan.modes:
+        suffix = _MODE_COLUMN_SUFFIXES[mode]
+        for j, sample in enumerate(samples):
+            columns[f"{sample}{suffix}"] = normalized[mode][:, j].astype(dtype)
+    output = Path(output)
+    pd.DataFrame(columns).to_parquet(output, index=False)
+    return output
+
+
+__all__ = ["discover_quant_files", "normalize_quant_directory"]
@@ -0,0 +1,254 @@
+"""Dense gene × cohort expression matrix with O(1) label lookup.
+
+Scoring loops over :func:`~pirlygenes.expression.pan_cancer_expression` or a
+:class:`~pirlygenes.expression.CohortExpressionViews` stage only need the
+numbers and two label maps. :class:`ExpressionMatrix` holds exactly that —
+one C-contiguous float ndarray, the ``Ensembl_Gene_ID`` row labels, the cohort
+column labels and the normalization label — so the gene/cohort lookup dicts
+are built once and slices are NumPy views rather than new DataFrames. A
+contiguous slice shares its parent's lookup dicts through an offset; any other
+sub-matrix builds its own on the first label lookup.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+_ID_COL = "Ensembl_Gene_ID"
+
+
+def _label_positions(labels: tuple[str, ...], kind: str) -> dict[str, int]:
+    positions = {label: i for i, label in enumerate(labels)}
+    if len(positions) != len(labels):
+        index = pd.Index(labels)
+        dupes = sorted(set(index[index.duplicated()]))
+        raise ValueError(f"duplicate {kind} labels: {dupes[:5]}")
+    return positions
+
+
+class _LabelIndex:
+    """Label → position dict over one label tuple, built on first lookup and
+    shared by every contiguous slice of that tuple (each with its offset)."""
+
+    __slots__ = ("labels", "_positions")
+
+    def __init__(self, labels: tuple[str, ...], positions=None):
+        self.labels = labels
+        self._positions = positions
+
+    def positions(self) -> dict[str, int]:
+        if self._positions is None:
+            self._positions = {label: i for i, label in enumerate(self.labels)}
+        return self._positions
+
+
+def _sub_axis(labels: tuple[str, ...], index: _LabelIndex, offset: int, sel):
+    """``(labels, index, offset)`` of the axis selected by ``sel``: a step-1
+    slice keeps ``index`` and moves the offset, anything else gets a fresh
+    lazily built index."""
+    if isinstance(sel, slice):
+        start, stop, step = sel.indices(len(labels))
+        if step == 1:
+            return labels[start:stop], index, offset + start
+        return labels[start:stop:step], _LabelIndex(labels[start:stop:step]), 0
+    positions = np.asarray(sel)
+    if positions.dtype == bool:
+        positions = np.flatnonzero(positions)
+    picked = tuple(labels[i] for i in positions.tolist())
+    return picked, _LabelIndex(picked), 0
+
+
+def _positions_as_slice(positions: np.ndarray):
+    """A ``slice`` when ``positions`` is one ascending run (so indexing with it
+    is a view), else the positions themselves (a gather)."""
+    if len(positions) and np.array_equal(
+        positions, np.arange(positions[0], positions[0] + len(positions))
+    ):
+        return slice(int(positions[0]), int(positions[0]) + len(positions))
+    return positions
+
+
+class ExpressionMatrix:
+    """Gene × cohort expression values backed by one contiguous ndarray.
+
+    Attributes
+    ----------
+    values
+        ``(n_genes, n_cohorts)`` float ndarray — C-contiguous when built,
+        possibly a strided view of the parent after slicing.
+    genes
+        Row labels (canonical ``Ensembl_Gene_ID``), a tuple of str.
+    cohorts
+        Column labels, a tuple of str.
+    normalization
+        Label of the value scale (``"tpm"``, ``"clean_tpm"``, ``"TPM_clean"``,
+        …) or ``None``.
+
+    :meth:`gene_position` / :meth:`cohort_position` are dict lookups;
+    :meth:`row`, :meth:`column` and :meth:`iloc` return views of ``values``,
+    and :meth:`select` does too whenever the requested labels are one
+    contiguous run. :meth:`to_frame` converts back to the public wide layout.
+    """
+
+    __slots__ = (
+        "values", "genes", "cohorts", "normalization",
+        "_gene_index", "_gene_offset", "_cohort_index", "_cohort_offset",
+    )
+
+    def __init__(
+        self,
+        values,
+        genes: Iterable[str],
+        cohorts: Iterable[str],
+        normalization: Optional[str] = None,
+    ):
+        values = np.ascontiguousarray(values)
+        if values.ndim != 2:
+            raise ValueError("ExpressionMatrix values must be 2-dimensional")
+        if values.dtype.kind != "f":
+            values = values.astype(np.float64)
+        genes = tuple(str(g) for g in genes)
+        cohorts = tuple(str(c) for c in cohorts)
+        if values.shape != (len(genes), len(cohorts)):
+            raise ValueError(
+                f"values shape {values.shape} does not match "
+                f"{len(genes)} genes × {len(cohorts)} cohorts"
+            )
+        self.values = values
+        self.genes = genes
+        self.cohorts = cohorts
+        self.normalization = normalization
+        self._gene_index = _LabelIndex(genes, _label_positions(genes, "gene"))
+        self._gene_offset = 0
+        self._cohort_index = _LabelIndex(
+            cohorts, _label_positions(cohorts, "cohort"),
+        )
+        self._cohort_offset = 0
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        *,
+        value_cols: Optional[Iterable[str]] = None,
+        suffix: Optional[str] = None,
+        normalization: Optional[str] = None,
+        dtype=np.float64,
+    ) -> "ExpressionMatrix":
+        """Build from a wide frame keyed on ``Ensembl_Gene_ID``.
+
+        ``value_cols`` picks the cohort columns explicitly; otherwise every
+        float column is used. ``suffix`` instead selects the columns ending in
+        it and strips it from the cohort labels — ``suffix="_TPM_clean"`` on a
+        :func:`pan_cancer_expression` frame gives a tumor × ``TPM_clean``
+        matrix labelled ``LUAD``, ``PRAD``, … and, unless ``normalization`` is
+        given, labels the matrix with the suffix itself.
+        """
+        if _ID_COL not in df.columns:
+            raise ValueError(f"ExpressionMatrix.from_frame needs an {_ID_COL!r} column")
+        if value_cols is not None:
+            cols = list(value_cols)
+            labels = cols
+        elif suffix is not None:
+            cols = [c for c in df.columns if str(c).endswith(suffix)]
+            labels = [str(c)[: -len(suffix)] for c in cols]
+            if normalization is None:
+                normalization = suffix.lstrip("_")
+        else:
+            cols = [
+                c for c in df.columns
+                if c != _ID_COL and pd.api.types.is_float_dtype(df[c])
+            ]
+            labels = cols
+        values = (
+            df[cols].to_numpy(dtype=dtype) if cols
+            else np.empty((len(df), 0), dtype=dtype)
+        )
+        return cls(values, df[_ID_COL].astype(str), labels, normalization)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    def gene_position(self, gene: str) -> int:
+        position = self._gene_index.positions()[gene] - self._gene_offset
+        if not 0 <= position < len(self.genes):
+            raise KeyError(gene)
+        return position
+
+    def cohort_position(self, cohort: str) -> int:
+        position = self._cohort_index.positions()[cohort] - self._cohort_offset
+        if not 0 <= position < len(self.cohorts):
+            raise KeyError(cohort)
+        return position
+
+    def row(self, gene: str) -> np.ndarray:
+        """All cohorts for one gene — a view of ``values``."""
+        return self.values[self.gene_position(gene)]
+
+    def column(self, cohort: str) -> np.ndarray:
+        """All genes for one cohort — a strided view of ``values``."""
+        return self.values[:, self.cohort_position(cohort)]
+
+    def iloc(self, rows=slice(None), cols=slice(None)) -> "ExpressionMatrix":
+        """Positional sub-matrix; ``slice`` arguments give a zero-copy view."""
+        values = self.values[rows, cols]
+        if values.ndim != 2:
+            raise ValueError("iloc takes slices or position arrays, not scalars")
+        out = ExpressionMatrix.__new__(ExpressionMatrix)
+        # Slices keep the parent's buffer: skip __init__'s contiguity copy.
+        out.values = values
+        out.normalization = self.normalization
+        out.genes, out._gene_index, out._gene_offset = _sub_axis(
+            self.genes, self._gene_index, self._gene_offset, rows,
+        )
+        out.cohorts, out._cohort_index, out._cohort_offset = _sub_axis(
+            self.cohorts, self._cohort_index, self._cohort_offset, cols,
+        )
+        return out
+
+    def select(
+        self,
+        genes: Optional[Iterable[str]] = None,
+        cohorts: Optional[Iterable[str]] = None,
+    ) -> "ExpressionMatrix":
+        """Sub-matrix by label (``KeyError`` on unknown labels). Labels that
+        form one contiguous, in-order run are sliced as a view; any other
+        selection is gathered into a copy."""
+        rows = slice(None)
+        if genes is not None:
+            rows = _positions_as_slice(np.fromiter(
+                (self.gene_position(g) for g in genes), dtype=np.intp,
+            ))
+        cols = slice(None)
+        if cohorts is not None:
+            cols = _positions_as_slice(np.fromiter(
+                (self.cohort_position(c) for c in cohorts), dtype=np.intp,
+            ))
+        if isinstance(rows, np.ndarray) and isinstance(cols, np.ndarray):
+            return self.iloc(rows).iloc(slice(None), cols)
+        return self.iloc(rows, cols)
+
+    def to_frame(self, *, copy: bool = False) -> pd.DataFrame:
+        """Wide frame (``Ensembl_Gene_ID`` + one column per cohort). The value
+        block shares ``values`` unless ``copy=True``."""
+        values = pd.DataFrame(
+            self.values.copy() if copy else self.values,
+            columns=pd.Index(list(self.cohorts), dtype=object),
+            copy=False,
+        )
+        values.insert(0, _ID_COL, list(self.genes))
+        return values
+
+    def __len__(self) -> int:
+        return len(self.genes)
+
+    def __repr__(self):
+        return (f"ExpressionMatrix(genes={len(self.genes)}, "
+                f"cohorts={len(self.cohorts)}, "
+                f"normalization={self.normalization!r}, "
+                f"dtype={self.values.dtype})")
@@ -21,6 +21,9 @@ convert between common quantification scales:
   putting the sample on the reference-profile scale.
 - :func:`renormalize_to_million` — bare utility: rescale columns to
   sum to 10⁶ without dropping anything.
+- :func:`normalize_per_sample_parquet` — out-of-core clean TPM,
+  ``log1p`` and percentile views of a per-sample cohort parquet, read and
+  transformed a batch of sample columns at a time.
 
 The technical-RNA group definition lives in :mod:`.qc` and is imported
 from there; this module never reclassifies genes.
@@ -28,7 +31,6 @@ from there; this module never reclassifies genes.
 
 from __future__ import annotations
 
-import functools
 from typing import Iterable
 
 from oncoref.gene_families import (
@@ -39,6 +41,7 @@ from oncoref.normalization import (
     tpm_to_housekeeping_normalized as _oncoref_tpm_to_housekeeping_normalized,
 )
 
+from ..caches import cached
 from .qc import (
     OTHER_TECHNICAL_FRACTION,
     RIBOSOMAL_PROTEIN_FRACTION,
@@ -155,7 +158,11 @@ def _clean_tpm_normalize(
     ``(out, info)``. Each value column is a per-gene vector; treating it as a
     one-sample gene×sample matrix lets the runtime path reuse the identical
     builder transform so the result lands on the clean-TPM basis (biological 750k).
+
+    All groups are rescaled in one pass (:func:`_clean_tpm_grouped`) rather
+    than by calling :func:`clean_tpm_matrix` once per group.
     """
+    import numpy as np
     import pandas as pd
 
     # Clean-TPM censoring is ENSG-keyed (the canonical censored-gene list). A
@@ -182,20 +189,9 @@ def _clean_tpm_normalize(
             "clean-TPM normalization has one canonical 16/9/75 contract; "
             "protect overrides are only supported by technical-drop helpers")
 
-    def _apply(indices):
-        idx = list(indices)
-        block = out.loc[idx, value_cols].apply(pd.to_numeric, errors="coerce")
-        cleaned = clean_tpm_matrix(
-            block,
-            gene_table=gene_table.loc[idx],
-            censored_fill=censored_fill,
-            technical_fraction=technical_fraction,
-        )
-        out.loc[idx, value_cols] = cleaned
-
     resolved_group_cols: list[str] = []
     if group_cols is None:
-        _apply(out.index)
+        codes = np.zeros(len(out), dtype=np.int64)
     else:
         resolved_group_cols = [str(c) for c in group_cols if str(c) in out.columns]
         if not resolved_group_cols:
@@ -205,8 +201,23 @@ def _clean_tpm_normalize(
                 "columns": {},
                 "groups": {},
             }
-        for _key, idx in out.groupby(resolved_group_cols, dropna=False).groups.items():
-            _apply(idx)
+        codes = (
+            out.groupby(resolved_group_cols, dropna=False, sort=False)
+            .ngroup()
+            .to_numpy(dtype=np.int64)
+        )
+    _check_clean_tpm_contract(censored_fill, technical_fraction)
+
+    values = (
+        out[list(value_cols)]
+        .apply(pd.to_numeric, errors="coerce")
+        .to_numpy(dtype=float)
+    )
+    compartment, reference = _clean_tpm_compartments(gene_table)
+    for col, column in zip(value_cols, _clean_tpm_grouped(
+        values, codes, compartment, reference,
+    ).T):
+        out[col] = column
 
     return out, {
         "applied": True,
@@ -517,7 +528,7 @@ _RIBOSOMAL_PROTEIN_GROUPS = frozenset(
 )
 
 
-@functools.lru_cache(maxsize=2)
+@cached(maxsize=2)
 def _clean_tpm_censored_ids(include_ribosomal: bool) -> frozenset:
     """Unversioned ENSGs censored by oncoref's canonical clean-TPM contract.
 
@@ -548,7 +559,7 @@ def technical_rna_mask(gene_table):
     return _ensg_unversioned(gene_table).isin(_clean_tpm_censored_ids(False))
 
 
-@functools.lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _default_protected_symbols():
     """Curated cancer-target symbols that must NEVER be censored even if their
     symbol matches a censored QC group — they are signal we score on. The
@@ -626,6 +637,16 @@ def drop_technical_genes(df, *, label_col: str = "Symbol",
     computed. (Distinct from :func:`pirlygenes.expression.filter_technical_rna`,
     which drops only the strict curated technical-RNA family set.)
     """
+    keep = _biological_row_mask(df, label_col=label_col, id_col=id_col,
+                                protect=protect)
+    return df.loc[keep].reset_index(drop=True)
+
+
+def _biological_row_mask(df, *, label_col: str = "Symbol",
+                         id_col: str = "Ensembl_Gene_ID",
+                         protect=None):
+    """Boolean NumPy row mask of the genes :func:`drop_technical_genes` keeps,
+    so a caller can hold the mask instead of a second filtered frame."""
     import pandas as pd
 
     if id_col not in df.columns:
@@ -640,7 +661,35 @@ def drop_technical_genes(df, *, label_col: str = "Symbol",
     )
     removable = clean_tpm_removal_mask(
         gene_table, protect=protect)
-    return df.loc[~removable.to_numpy()].reset_index(drop=True)
+    return ~removable.to_numpy(dtype=bool)
+
+
+def _check_clean_tpm_contract(
+    censored_fill,
+    technical_fraction,
+    *,
+    ribosomal_protein_fraction=RIBOSOMAL_PROTEIN_FRACTION,
+    other_technical_fraction=OTHER_TECHNICAL_FRACTION,
+):
+    """Reject anything but the canonical 16/9/75 ``fixed_fraction`` options."""
+    if censored_fill != "fixed_fraction":
+        raise ValueError(
+            "clean_tpm_matrix only supports the single clean-TPM contract "
+            f"censored_fill='fixed_fraction' (got {censored_fill!r}); the legacy "
+            "zero / reference / typical modes were removed.")
+    if technical_fraction != TECHNICAL_FRACTION:
+        raise ValueError(
+            "clean_tpm_matrix technical_fraction is deprecated: clean TPM always "
+            "uses the canonical 16% ribosomal / 9% other-technical / 75% "
+            "biological budget")
+    if (
+        ribosomal_protein_fraction != RIBOSOMAL_PROTEIN_FRACTION
+        or other_technical_fraction != OTHER_TECHNICAL_FRACTION
+    ):
+        raise ValueError(
+            "clean_tpm_matrix fraction knobs are deprecated: clean TPM always "
+            "uses the canonical 16% ribosomal / 9% other-technical / 75% "
+            "biological budget")
 
 
 def clean_tpm_matrix(values, removable=None, *, gene_table=None,
@@ -671,11 +720,12 @@ def clean_tpm_matrix(values, removable=None, *, gene_table=None,
     clean-TPM semantics. Strict technical-RNA masks still live in
     :func:`technical_rna_mask`, which is a different operation.
     """
-    if censored_fill != "fixed_fraction":
-        raise ValueError(
-            "clean_tpm_matrix only supports the single clean-TPM contract "
-            f"censored_fill='fixed_fraction' (got {censored_fill!r}); the legacy "
-            "zero / reference / typical modes were removed.")
+    _check_clean_tpm_contract(
+        censored_fill,
+        technical_fraction,
+        ribosomal_protein_fraction=ribosomal_protein_fraction,
+        other_technical_fraction=other_technical_fraction,
+    )
     if removable is not None:
         raise ValueError(
             "clean_tpm_matrix no longer accepts an explicit removable mask; "
@@ -683,22 +733,156 @@ def clean_tpm_matrix(values, removable=None, *, gene_table=None,
             "derived from the shared censored-gene table")
     if gene_table is None:
         raise ValueError("clean_tpm_matrix needs a gene_table")
-    if technical_fraction != TECHNICAL_FRACTION:
-        raise ValueError(
-            "clean_tpm_matrix technical_fraction is deprecated: clean TPM always "
-            "uses the canonical 16% ribosomal / 9% other-technical / 75% "
-            "biological budget")
-    if (
-        ribosomal_protein_fraction != RIBOSOMAL_PROTEIN_FRACTION
-        or other_technical_fraction != OTHER_TECHNICAL_FRACTION
-    ):
-        raise ValueError(
-            "clean_tpm_matrix fraction knobs are deprecated: clean TPM always "
-            "uses the canonical 16% ribosomal / 9% other-technical / 75% "
-            "biological budget")
     return _oncoref_clean_tpm(values, gene_table)
 
 
+
+# Row order of the per-column scale matrix returned by
+# :func:`_clean_tpm_column_scales`.
+_CLEAN_TPM_COMPARTMENTS = ("ribosomal_protein", "other_technical", "biological")
+
+
+def _clean_tpm_compartments(gene_table):
+    """``(compartment, reference)`` arrays row-aligned to ``gene_table``.
+
+    ``compartment`` indexes :data:`_CLEAN_TPM_COMPARTMENTS`; ``reference`` is
+    the Treehouse PolyA weight oncoref assigns each censored row (only read for
+    censored rows). Same membership tables as :func:`clean_tpm_matrix`.
+    """
+    import numpy as np
+    from oncoref.gene_families import (
+        clean_tpm_censored_reference_tpm,
+        clean_tpm_other_technical_gene_ids,
+        clean_tpm_ribosomal_gene_ids,
+    )
+
+    ids = _ensg_unversioned(gene_table)
+    compartment = np.full(len(ids), 2, dtype=np.int8)
+    compartment[ids.isin(clean_tpm_other_technical_gene_ids()).to_numpy()] = 1
+    compartment[ids.isin(clean_tpm_ribosomal_gene_ids()).to_numpy()] = 0
+    reference = ids.map(clean_tpm_censored_reference_tpm()).fillna(0.0)
+    return compartment, reference.to_numpy(dtype=float)
+
+
+def _clean_tpm_column_scales(values, gene_table):
+    """Per-column clean-TPM scale factors for a gene×sample matrix.
+
+    Returns a ``(3, n_columns)`` array (rows ordered as
+    :data:`_CLEAN_TPM_COMPARTMENTS`). The censored rows scale the reference
+    composition, the biological row scales the measured values; together with
+    :func:`_apply_clean_tpm_column_scales` this reproduces
+    :func:`clean_tpm_matrix` on any row subset of ``values`` without seeing the
+    other rows again.
+    """
+    import numpy as np
+    import pandas as pd
+
+    compartment, reference = _clean_tpm_compartments(gene_table)
+    scales = np.zeros((len(_CLEAN_TPM_COMPARTMENTS), values.shape[1]))
+    for code, fraction in (
+        (0, RIBOSOMAL_PROTEIN_FRACTION),
+        (1, OTHER_TECHNICAL_FRACTION),
+    ):
+        mask = compartment == code
+        if not mask.any():
+            continue
+        selected = values.loc[mask]
+        weights = pd.DataFrame(
+            np.broadcast_to(reference[mask][:, None], selected.shape),
+            index=selected.index,
+            columns=selected.columns,
+        ).where(selected.notna())
+        totals = weights.sum(axis=0, skipna=True)
+        positive = (totals > 0).to_numpy()
+        scales[code, positive] = (
+            fraction * 1_000_000.0 / totals.loc[positive]
+        ).to_numpy()
+    mask = compartment == 2
+    if mask.any():
+        bio_fraction = 1.0 - RIBOSOMAL_PROTEIN_FRACTION - OTHER_TECHNICAL_FRACTION
+        comp_sum = values.loc[mask].sum(axis=0)
+        positive = (comp_sum > 0).to_numpy()
+        scales[2, positive] = (
+            bio_fraction * 1_000_000.0 / comp_sum.loc[positive]
+        ).to_numpy()
+    return scales
+
+
+def _apply_clean_tpm_column_scales(values, gene_table, scales):
+    """Apply :func:`_clean_tpm_column_scales` output to (a row subset of) a
+    gene×sample matrix. Missing inputs stay ``NaN``."""
+    import numpy as np
+    import pandas as pd
+
+    compartment, reference = _clean_tpm_compartments(gene_table)
+    clean = values.astype(float).copy()
+    for code in range(len(_CLEAN_TPM_COMPARTMENTS)):
+        mask = compartment == code
+        if not mask.any():
+            continue
+        selected = values.loc[mask]
+        scale = pd.Series(scales[code], index=values.columns)
+        if code == 2:
+            clean.loc[mask] = selected.mul(scale, axis=1)
+            continue
+        weights = pd.DataFrame(
+            np.broadcast_to(reference[mask][:, None], selected.shape),
+            index=selected.index,
+            columns=selected.columns,
+        ).where(selected.notna())
+        clean.loc[mask] = weights.mul(scale, axis=1).where(selected.notna())
+    return clean
+
+
+def _clean_tpm_grouped(values, codes, compartment, reference):
+    """Clean-TPM every group of rows of a gene×column array in one pass.
+
+    ``codes`` labels each row's group (any non-negative ints); ``compartment``
+    and ``reference`` come from :func:`_clean_tpm_compartments`. Equivalent to
+    :func:`clean_tpm_matrix` applied to each group's rows separately: rows are
+    sorted once by ``(group, compartment)``, every segment's column sums are
+    taken with a single ``np.add.reduceat``, and the per-segment scales are
+    gathered back onto the rows. Missing inputs stay ``NaN``.
+    """
+    import numpy as np
+
+    n_rows, n_cols = values.shape
+    if n_rows == 0:
+        return values.astype(float, copy=True)
+    fractions = np.array([
+        RIBOSOMAL_PROTEIN_FRACTION,
+        OTHER_TECHNICAL_FRACTION,
+        1.0 - RIBOSOMAL_PROTEIN_FRACTION - OTHER_TECHNICAL_FRACTION,
+    ]) * 1_000_000.0
+    measured = ~np.isnan(values)
+    biological = compartment == 2
+    # Censored rows contribute their reference weight wherever the input is
+    # measured; biological rows contribute the measured value itself.
+    contribution = np.where(
+        biological[:, None],
+        np.where(measured, values, 0.0),
+        reference[:, None] * measured,
+    )
+
+    key = np.asarray(codes, dtype=np.int64) * len(fractions) + compartment
+    order = np.argsort(key, kind="stable")
+    sorted_key = key[order]
+    starts = np.flatnonzero(np.r_[True, sorted_key[1:] != sorted_key[:-1]])
+    totals = np.add.reduceat(contribution[order], starts, axis=0)
+    segment_fraction = fractions[sorted_key[starts] % len(fractions)]
+    scales = np.zeros_like(totals)
+    np.divide(
+        segment_fraction[:, None], totals, out=scales, where=totals > 0,
+    )
+
+    segment = np.empty(n_rows, dtype=np.int64)
+    segment[order] = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n_rows]))
+    base = np.where(biological[:, None], values, reference[:, None])
+    clean = base * scales[segment]
+    clean[~measured] = np.nan
+    return clean
+
+
 # ---------- cross-source transforms (#293) ----------
 #
 # Absolute clean TPM is NOT comparable across quantification pipelines (Toil/
@@ -752,10 +936,62 @@ def zscore_normalize(values, *, log: bool = True):
 # ---------- conversions ----------
 
 
+def _transform_target(df, *, inplace: bool, out):
+    """Frame a column transform writes into: ``df`` itself when ``inplace``,
+    the caller's row-aligned ``out`` frame, or else a fresh copy of ``df``."""
+    if inplace and out is not None:
+        raise ValueError("pass inplace=True or out=, not both")
+    if inplace:
+        return df
+    if out is None:
+        return df.copy()
+    if len(out) != len(df):
+        raise ValueError(
+            f"out= has {len(out)} rows; the input table has {len(df)}")
+    return out
+
+
+def _numeric_block(df, value_cols):
+    """``df[value_cols]`` as one 2-D float array (non-numeric cells → NaN).
+
+    Columns that are already numeric are converted as a single block; only
+    object/string columns go through :func:`pandas.to_numeric`. An
+    all-float32 selection stays float32, anything else is float64.
+    """
+    import numpy as np
+    import pandas as pd
+
+    block = df[list(value_cols)]
+    if not all(pd.api.types.is_numeric_dtype(t) for t in block.dtypes):
+        block = block.apply(pd.to_numeric, errors="coerce")
+    dtype = (
+        np.float32
+        if len(block.columns) and all(t == np.float32 for t in block.dtypes)
+        else np.float64
+    )
+    return block.to_numpy(dtype=dtype, na_value=np.nan)
+
+
+def _million_scales(values):
+    """Per-column ``(input_sums, scales)`` that pin a 2-D block to 10⁶.
+
+    Sums skip NaN and accumulate in float64; a column whose sum is not
+    positive gets a ``NaN`` scale and is left untouched by callers.
+    """
+    import numpy as np
+
+    sums = np.nansum(values, axis=0, dtype=np.float64)
+    scales = np.full(sums.shape, np.nan)
+    np.divide(1e6, sums, out=scales, where=sums > 0)
+    return sums, scales
+
+
 def renormalize_to_million(
     df,
     *,
     value_cols: Iterable[str] | None = None,
+    inplace: bool = False,
+    out=None,
 ):
     """Rescale each expression column so its non-NaN sum equals 10⁶.
 
@@ -765,37 +1001,48 @@ def renormalize_to_million(
     technical-RNA normalization preserves the *input* total, which may
     or may not already be 10⁶ depending on how the upstream quantifier
     handled denominator features.
-    """
-    import pandas as pd
 
+    The result is a copy of ``df`` unless ``inplace=True`` (rescale ``df``
+    itself) or ``out=`` names a row-aligned frame to write every selected
+    column into (columns without a positive sum unscaled); either skips the
+    whole-frame copy when chaining stages.
+    """
     if df is None:
         return None, {"applied": False, "reason": "no table", "columns": {}}
-    out = df.copy()
+    result = _transform_target(df, inplace=inplace, out=out)
     if value_cols is None:
-        value_cols = [c for c in out.columns if _is_expression_value_col(c)]
-    value_cols = [str(c) for c in value_cols if str(c) in out.columns]
+        value_cols = [c for c in df.columns if _is_expression_value_col(c)]
+    value_cols = [str(c) for c in value_cols if str(c) in df.columns]
     if not value_cols:
-        return out, {
+        return result, {
             "applied": False,
             "reason": "no expression value columns",
             "columns": {},
         }
 
+    values = _numeric_block(df, value_cols)
+    sums, scales = _million_scales(values)
+    positive = scales > 0
+    if positive.any():
+        scaled = [col for col, keep in zip(value_cols, positive) if keep]
+        result[scaled] = values[:, positive] * scales[positive].astype(values.dtype)
+    if result is not df and out is not None:
+        # Every selected column lands in ``out``; a non-positive column is
+        # copied through unscaled, as add_tpm_columns_from_fpkm does.
+        for col, keep in zip(value_cols, positive):
+            if not keep:
+                result[col] = df[col].to_numpy(copy=True)
+
     columns = {}
-    any_applied = False
-    for col in value_cols:
-        vals = pd.to_numeric(out[col], errors="coerce")
-        col_sum = float(vals.sum())
-        columns[col] = {"input_sum": col_sum}
-        if col_sum <= 0:
+    for col, col_sum, scale, keep in zip(value_cols, sums, scales, positive):
+        columns[col] = {"input_sum": float(col_sum)}
+        if not keep:
             columns[col]["scale"] = 1.0
             continue
-        scale = 1e6 / col_sum
-        out[col] = vals * scale
-        columns[col]["scale"] = scale
+        columns[col]["scale"] = float(scale)
         columns[col]["output_sum"] = 1e6
-        any_applied = True
-    return out, {
+    any_applied = bool(positive.any())
+    return result, {
         "applied": any_applied,
         "reason": "rescaled to TPM convention (sum = 1e6)" if any_applied else "no positive column sums",
         "columns": columns,
@@ -807,6 +1054,8 @@ def fpkm_to_tpm(
     df,
     *,
     value_cols: Iterable[str] | None = None,
+    inplace: bool = False,
+    out=None,
 ):
     """Convert FPKM-scale expression columns to TPM by per-column rescaling.
 
@@ -825,10 +1074,13 @@ def fpkm_to_tpm(
            post-filter total at exactly 10⁶.
 
     This is mathematically identical to :func:`renormalize_to_million`
-    but takes an FPKM-named argument and exists as a self-documenting
-    entry point in the pipeline.
+    (including its ``inplace=`` / ``out=`` options) but takes an
+    FPKM-named argument and exists as a self-documenting entry point in
+    the pipeline.
     """
-    return renormalize_to_million(df, value_cols=value_cols)
+    return renormalize_to_million(
+        df, value_cols=value_cols, inplace=inplace, out=out,
+    )
 
 
 def _default_fpkm_value_cols(
@@ -867,6 +1119,8 @@ def add_tpm_columns_from_fpkm(
     source_suffix: str = "_FPKM",
     target_suffix: str = "_TPM",
     overwrite: bool = False,
+    inplace: bool = False,
+    out=None,
 ):
     """Append TPM-scale companion columns for FPKM columns.
 
@@ -880,29 +1134,33 @@ def add_tpm_columns_from_fpkm(
     This is useful for reference tables where raw FPKM should remain
     available for provenance, while downstream analysis wants a
     deterministic TPM-scale view. Existing target columns are left
-    unchanged unless ``overwrite=True``.
+    unchanged unless ``overwrite=True``. As with
+    :func:`renormalize_to_million`, ``inplace=True`` appends the columns to
+    ``df`` itself and ``out=`` writes them into another row-aligned frame.
     """
     if df is None:
         return None, {"applied": False, "reason": "no table", "columns": {}}
 
-    out = df.copy()
+    result = _transform_target(df, inplace=inplace, out=out)
     if value_cols is None:
         value_cols = _default_fpkm_value_cols(
-            out,
+            df,
             source_prefix=source_prefix,
             source_suffix=source_suffix,
         )
-    value_cols = [str(c) for c in value_cols if str(c) in out.columns]
+    value_cols = [str(c) for c in value_cols if str(c) in df.columns]
     if not value_cols:
-        return out, {
+        return result, {
             "applied": False,
             "reason": "no FPKM expression value columns",
             "columns": {},
         }
 
-    converted, record = fpkm_to_tpm(out, value_cols=value_cols)
+    values = _numeric_block(df, value_cols)
+    sums, scales = _million_scales(values)
     columns = {}
-    for source_col in value_cols:
+    targets: dict[str, object] = {}
+    for i, source_col in enumerate(value_cols):
         target_col = _tpm_target_col_from_fpkm(
             source_col,
             source_prefix=source_prefix,
@@ -910,20 +1168,26 @@ def add_tpm_columns_from_fpkm(
             source_suffix=source_suffix,
             target_suffix=target_suffix,
         )
-        if target_col in out.columns and not overwrite:
+        if target_col in result.columns and not overwrite:
             columns[source_col] = {
                 "target_column": target_col,
                 "skipped": True,
                 "reason": "target column already exists",
             }
             continue
-        out[target_col] = converted[source_col]
-        columns[source_col] = {
-            "target_column": target_col,
-            **record.get("columns", {}).get(source_col, {}),
-        }
-
-    return out, {
+        record = {"input_sum": float(sums[i]), "scale": 1.0}
+        if scales[i] > 0:
+            targets[target_col] = values[:, i] * values.dtype.type(scales[i])
+            record.update(scale=float(scales[i]), output_sum=1e6)
+        else:
+            # Like renormalize_to_million, a non-positive column is copied
+            # through unscaled.
+            targets[target_col] = df[source_col].to_numpy(copy=True)
+        columns[source_col] = {"target_column": target_col, **record}
+
+    for target_col, column in targets.items():
+        result[target_col] = column
+    return result, {
         "applied": bool(columns),
         "reason": "added TPM companion columns from FPKM columns",
         "columns": columns,
@@ -938,34 +1202,52 @@ def percentile_rank_expression(
     df,
     *,
     value_cols: Iterable[str] | None = None,
+    inplace: bool = False,
+    out=None,
 ):
-    """Map expression columns to within-column percentile ranks (0–100)."""
+    """Map expression columns to within-column percentile ranks (0–100).
+
+    Ties share their average rank and missing values stay ``NaN``, as in
+    ``Series.rank(pct=True)``; all columns are ranked in one pass over the
+    2-D block. ``inplace=`` / ``out=`` behave as in
+    :func:`renormalize_to_million`.
+    """
+    import numpy as np
     import pandas as pd
 
     if df is None:
         return None, {"applied": False, "reason": "no table", "columns": {}}
-    out = df.copy()
+    result = _transform_target(df, inplace=inplace, out=out)
     if value_cols is None:
-        value_cols = [c for c in out.columns if _is_expression_value_col(c)]
-    value_cols = [str(c) for c in value_cols if str(c) in out.columns]
+        value_cols = [c for c in df.columns if _is_expression_value_col(c)]
+    value_cols = [str(c) for c in value_cols if str(c) in df.columns]
     if not value_cols:
-        return out, {
+        return result, {
             "applied": False,
             "reason": "no expression value columns",
             "columns": {},
         }
 
-    columns = {}
-    for col in value_cols:
-        vals = pd.to_numeric(out[col], errors="coerce")
-        out[col] = vals.rank(pct=True) * 100
-        ranked = out[col].dropna()
-        columns[col] = {
-            "n_ranked": int(ranked.shape[0]),
-            "min": float(ranked.min()) if not ranked.empty else None,
-            "max": float(ranked.max()) if not ranked.empty else None,
+    ranked = (
+        pd.DataFrame(_numeric_block(df, value_cols).astype(float, copy=False))
+        .rank(pct=True)
+        .to_numpy()
+        * 100
+    )
+    result[value_cols] = ranked
+    counts = np.count_nonzero(~np.isnan(ranked), axis=0)
+    filled = np.where(np.isnan(ranked), np.inf, ranked)
+    lows = filled.min(axis=0, initial=np.inf)
+    highs = np.where(np.isnan(ranked), -np.inf, ranked).max(axis=0, initial=-np.inf)
+    columns = {
+        col: {
+            "n_ranked": int(n),
+            "min": float(low) if n else None,
+            "max": float(high) if n else None,
         }
-    return out, {
+        for col, n, low, high in zip(value_cols, counts, lows, highs)
+    }
+    return result, {
         "applied": True,
         "reason": "converted expression columns to percentile ranks",
         "columns": columns,
@@ -982,6 +1264,190 @@ def _housekeeping_panel_ensembl_ids(panel: Iterable[str] | None = None) -> set[s
     return {str(s).split(".", 1)[0].strip() for s in housekeeping_gene_ids() if str(s).strip()}
 
 
+def _housekeeping_reference_tpm(reference_profile=None) -> dict[str, float]:
+    """``{unversioned ENSG: reference TPM}`` for median-of-ratios.
+
+    oncoref's own reference-map builder, so the vectorized path here reads a
+    profile exactly as :func:`oncoref.normalization.tpm_to_housekeeping_normalized`
+    does: ``None`` is the default HPA-derived clean-TPM housekeeping profile,
+    otherwise a profile frame (``Ensembl_Gene_ID`` + ``reference_tpm``), a
+    Series or a mapping keyed on ENSG.
+    """
+    from oncoref.normalization import _housekeeping_reference_map
+
+    return _housekeeping_reference_map(
+        reference_profile,
+        reference_id_col="Ensembl_Gene_ID",
+        reference_value_col="reference_tpm",
+    )
+
+
+def _housekeeping_gate(panel_values, *, min_hk_positive_genes, min_hk_positive_fraction):
+    """Vector form of the positive-housekeeping-gene gate.
+
+    ``panel_values`` holds the panel rows of a gene×sample array. Returns
+    ``(n_measured, n_positive, required, passed)`` per column: a column
+    passes when it has a measured panel value and at least ``min(measured,
+    max(min_hk_positive_genes, ceil(measured × min_hk_positive_fraction)))``
+    positive ones.
+    """
+    import numpy as np
+
+    measured = ~np.isnan(panel_values)
+    n_measured = measured.sum(axis=0)
+    n_positive = (measured & (panel_values > 0)).sum(axis=0)
+    required = np.minimum(
+        n_measured,
+        np.maximum(
+            int(min_hk_positive_genes),
+            np.ceil(n_measured * float(min_hk_positive_fraction)).astype(int),
+        ),
+    )
+    passed = (n_measured > 0) & (n_positive >= required)
+    return n_measured, n_positive, required, passed
+
+
+def _median_of_ratios(ratio_values, reference):
+    """Per-column median of ``sample_tpm / reference_tpm`` over measured rows.
+
+    ``ratio_values`` are the panel rows that carry a reference TPM and
+    ``reference`` those TPMs. Unmeasured or non-finite ratios are masked out
+    of a single ``nanmedian`` along the gene axis; a column with no usable
+    ratio gets ``0.0``, like oncoref's empty-panel denominator.
+    """
+    import numpy as np
+
+    ratios = ratio_values / np.asarray(reference, dtype=float)[:, None]
+    ratios[~np.isfinite(ratios)] = np.nan
+    usable = (~np.isnan(ratios)).any(axis=0)
+    medians = np.zeros(ratios.shape[1])
+    if usable.any():
+        medians[usable] = np.nanmedian(ratios[:, usable], axis=0)
+    return medians
+
+
+def _housekeeping_size_factors(
+    values,
+    gate_rows,
+    ratio_rows,
+    ratio_reference,
+    *,
+    min_hk_positive_genes: int = 5,
+    min_hk_positive_fraction: float = 0.5,
+):
+    """Median-of-ratios size factor for every column of a gene×sample array.
+
+    ``gate_rows`` are the housekeeping-panel rows the positivity gate
+    (:func:`_housekeeping_gate`) counts; ``ratio_rows`` / ``ratio_reference``
+    the panel rows that also have a reference TPM, and that TPM. Columns
+    that fail the gate or whose median ratio is not positive get ``NaN``.
+    """
+    import numpy as np
+
+    *_, passed = _housekeeping_gate(
+        values[gate_rows],
+        min_hk_positive_genes=min_hk_positive_genes,
+        min_hk_positive_fraction=min_hk_positive_fraction,
+    )
+    factors = _median_of_ratios(values[ratio_rows], ratio_reference)
+    return np.where(passed & (factors > 0), factors, np.nan)
+
+
+def _median_of_ratios_normalized(
+    df,
+    values,
+    row_ids,
+    panel_rows,
+    *,
+    value_cols,
+    passed,
+    oncoref_kwargs,
+):
+    """Matrix-wide median-of-ratios for the columns that passed the HK gate.
+
+    Gathers the panel rows that carry a reference TPM once, takes every
+    passing column's size factor in one :func:`_median_of_ratios` call and
+    divides those columns by it; a passing column whose factor is not
+    positive is blanked to ``NaN``. Columns that failed the gate are left
+    as they are.
+
+    The records are oncoref's: ``oncoref_kwargs`` (the arguments the caller
+    would delegate with) run
+    :func:`oncoref.normalization.tpm_to_housekeeping_normalized` once over
+    the panel rows of the first passing column, and every column's record
+    is that template with its own counts, denominator and reason filled in.
+    Returns ``(None, None)`` when no panel gene has a reference TPM so the
+    caller can defer to oncoref.
+    """
+    import numpy as np
+
+    reference_tpm = _housekeeping_reference_tpm(
+        oncoref_kwargs.get("reference_profile"),
+    )
+    ratio_rows = np.flatnonzero(
+        panel_rows & row_ids.isin(reference_tpm.keys()).to_numpy()
+    )
+    if not len(ratio_rows):
+        return None, None
+    cols = [col for col, ok in zip(value_cols, passed) if ok]
+    id_cols = [
+        c for c in (oncoref_kwargs.get("label_col"), oncoref_kwargs.get("id_col"))
+        if c and c in df.columns
+    ]
+    _, template = _oncoref_tpm_to_housekeeping_normalized(
+        df.iloc[ratio_rows][[*id_cols, cols[0]]],
+        **{**oncoref_kwargs, "value_cols": [cols[0]]},
+    )
+    column_template = template.get("columns", {}).get(cols[0])
+    if column_template is None:
+        return None, None
+
+    ratio_values = values[ratio_rows][:, passed]
+    denominators = _median_of_ratios(
+        ratio_values,
+        row_ids.iloc[ratio_rows].map(reference_tpm).to_numpy(dtype=float),
+    )
+    n_measured = (~np.isnan(ratio_values)).sum(axis=0)
+    n_detected = (ratio_values > 0).sum(axis=0)
+    n_zero = (ratio_values == 0).sum(axis=0)
+    applied = denominators > 0
+
+    out = df.copy()
+    if applied.any():
+        scaled_cols = [col for col, ok in zip(cols, applied) if ok]
+        block = values[:, passed][:, applied]
+        out[scaled_cols] = (block / denominators[applied]).astype(
+            block.dtype, copy=False,
+        )
+    failed_cols = [col for col, ok in zip(cols, applied) if not ok]
+    if failed_cols:
+        out[failed_cols] = np.nan
+
+    # oncoref's reason strings for an applied / a blanked column.
+    applied_reason = "divided by housekeeping median-of-ratios size factor"
+    failed_reason = "panel denominator <= 0"
+    columns = {
+        col: {
+            **column_template,
+            "denominator": float(denominators[i]),
+            "panel_genes_present": template["panel_genes_present"],
+            "panel_genes_measured": int(n_measured[i]),
+            "panel_genes_detected": int(n_detected[i]),
+            "panel_genes_zero": int(n_zero[i]),
+            "reason": applied_reason if applied[i] else failed_reason,
+        }
+        for i, col in enumerate(cols)
+    }
+    any_applied = bool(applied.any())
+    return out, {
+        **template,
+        "applied": any_applied,
+        "reason": applied_reason if any_applied else failed_reason,
+        "columns": columns,
+        "value_cols": cols,
+    }
+
+
 def tpm_to_housekeeping_normalized(
     df,
     *,
@@ -1001,8 +1467,11 @@ def tpm_to_housekeeping_normalized(
 
     This is a compatibility wrapper over
     :func:`oncoref.normalization.tpm_to_housekeeping_normalized`. pirlygenes keeps
-    the public function name and active-panel data API, but the normalization
-    arithmetic and record schema live in oncoref. Matching is ENSG-first: the
+    the public function name and active-panel data API; the method, reference
+    profile and record schema are oncoref's. The default median-of-ratios path
+    runs matrix-wide here (one gather of the panel rows, one masked ``nanmedian``
+    over all columns, the ``min_hk_positive_*`` gates as vector masks) and
+    defers to oncoref for ``legacy_geomean``. Matching is ENSG-first: the
     default panel is :func:`pirlygenes.housekeeping_gene_ids`, and custom panels
     should be passed as ``panel_ids``.
 
@@ -1053,9 +1522,6 @@ def tpm_to_housekeeping_normalized(
             **_oncoref_extra,
         )
 
-    import numpy as np
-    import pandas as pd
-
     if not 0 <= float(min_hk_positive_fraction) <= 1:
         raise ValueError("min_hk_positive_fraction must be between 0 and 1")
     if int(min_hk_positive_genes) < 0:
@@ -1074,10 +1540,8 @@ def tpm_to_housekeeping_normalized(
             **_oncoref_extra,
         )
 
-    panel_rows = (
-        df[id_col].fillna("").astype(str).str.split(".").str[0].str.strip()
-        .isin(effective_panel_ids)
-    )
+    row_ids = df[id_col].fillna("").astype(str).str.split(".").str[0].str.strip()
+    panel_rows = row_ids.isin(effective_panel_ids).to_numpy()
     n_panel_present = int(panel_rows.sum())
     if n_panel_present == 0:
         return _oncoref_tpm_to_housekeeping_normalized(
@@ -1091,79 +1555,255 @@ def tpm_to_housekeeping_normalized(
             **_oncoref_extra,
         )
 
-    delegate_cols: list[str] = []
-    skipped_columns: dict[str, dict] = {}
-    for col in value_cols:
-        hk_vals = pd.to_numeric(df.loc[panel_rows, col], errors="coerce").dropna()
-        required_positive = min(
-            int(len(hk_vals)),
-            max(
-                int(min_hk_positive_genes),
-                int(np.ceil(int(len(hk_vals)) * float(min_hk_positive_fraction))),
+    values = _numeric_block(df, value_cols)
+    hk_values = values[panel_rows]
+    n_measured, n_positive, required, passed = _housekeeping_gate(
+        hk_values,
+        min_hk_positive_genes=min_hk_positive_genes,
+        min_hk_positive_fraction=min_hk_positive_fraction,
+    )
+    n_zero = (hk_values == 0).sum(axis=0)
+    delegate_cols = [col for col, ok in zip(value_cols, passed) if ok]
+    skipped_columns = {
+        col: {
+            "applied": False,
+            "denominator": 0.0,
+            "panel_genes_present": n_panel_present,
+            "panel_genes_measured": int(n_measured[i]),
+            "panel_genes_detected": int(n_positive[i]),
+            "panel_genes_zero": int(n_zero[i]),
+            "min_hk_positive_required": int(required[i]),
+            "reason": (
+                "no measured HK values"
+                if n_measured[i] == 0
+                else "insufficient positive HK genes"
+            ),
+        }
+        for i, col in enumerate(value_cols)
+        if not passed[i]
+    }
+
+    out = record = None
+    if delegate_cols and method in (None, "median_of_ratios"):
+        out, record = _median_of_ratios_normalized(
+            df,
+            values,
+            row_ids,
+            panel_rows,
+            value_cols=value_cols,
+            passed=passed,
+            oncoref_kwargs=dict(
+                label_col=label_col,
+                id_col=id_col,
+                panel_ids=effective_panel_ids,
+                panel_name=effective_panel_name,
+                pseudocount=pseudocount,
+                **_oncoref_extra,
             ),
         )
-        positive_hk = hk_vals[hk_vals > 0]
-        n_positive = int(len(positive_hk))
-        if hk_vals.empty or n_positive < required_positive:
-            skipped_columns[col] = {
+    if record is None:
+        # legacy_geomean, or no panel gene carries a reference TPM: oncoref
+        # owns those paths and their records.
+        if not skipped_columns:
+            return _oncoref_tpm_to_housekeeping_normalized(
+                df,
+                label_col=label_col,
+                id_col=id_col,
+                value_cols=value_cols,
+                panel_ids=effective_panel_ids,
+                panel_name=effective_panel_name,
+                pseudocount=pseudocount,
+                **_oncoref_extra,
+            )
+        if delegate_cols:
+            out, record = _oncoref_tpm_to_housekeeping_normalized(
+                df,
+                label_col=label_col,
+                id_col=id_col,
+                value_cols=delegate_cols,
+                panel_ids=effective_panel_ids,
+                panel_name=effective_panel_name,
+                pseudocount=pseudocount,
+                **_oncoref_extra,
+            )
+        else:
+            out = df.copy()
+            record = {
                 "applied": False,
-                "denominator": 0.0,
+                "reason": "insufficient positive HK genes",
+                "panel": effective_panel_name,
+                "columns": {},
+                "value_cols": [],
                 "panel_genes_present": n_panel_present,
-                "panel_genes_measured": int(len(hk_vals)),
-                "panel_genes_detected": n_positive,
-                "panel_genes_zero": int((hk_vals == 0).sum()),
-                "min_hk_positive_required": required_positive,
-                "reason": (
-                    "no measured HK values"
-                    if hk_vals.empty
-                    else "insufficient positive HK genes"
-                ),
             }
-            continue
-        delegate_cols.append(col)
-
     if not skipped_columns:
-        return _oncoref_tpm_to_housekeeping_normalized(
-            df,
-            label_col=label_col,
-            id_col=id_col,
-            value_cols=value_cols,
-            panel_ids=effective_panel_ids,
-            panel_name=effective_panel_name,
-            pseudocount=pseudocount,
-            **_oncoref_extra,
-        )
-
-    if delegate_cols:
-        out, record = _oncoref_tpm_to_housekeeping_normalized(
-            df,
-            label_col=label_col,
-            id_col=id_col,
-            value_cols=delegate_cols,
-            panel_ids=effective_panel_ids,
-            panel_name=effective_panel_name,
-            pseudocount=pseudocount,
-            **_oncoref_extra,
-        )
-    else:
-        out = df.copy()
-        record = {
-            "applied": False,
-            "reason": "insufficient positive HK genes",
-            "panel": effective_panel_name,
-            "columns": {},
-            "value_cols": [],
-            "panel_genes_present": n_panel_present,
-        }
+        return out, record
 
     record = dict(record)
     record["columns"] = {**record.get("columns", {}), **skipped_columns}
     record["value_cols"] = value_cols
-    if skipped_columns and not delegate_cols:
+    if not delegate_cols:
         record["reason"] = "insufficient positive HK genes"
     return out, record
 
 
+# ---------- out-of-core per-sample matrices ----------
+
+
+_STREAM_NORMALIZE_MODES = ("tpm_clean", "tpm_clean_log1p", "percentile")
+
+
+def _stream_normalize_batch(values, compartment, reference, modes):
+    """``{mode: array}`` for one gene × sample column batch.
+
+    ``tpm_clean_log1p`` is ``log1p`` of the clean-TPM block; ``percentile``
+    is the within-column percentile rank of the input TPM (average ties,
+    ``NaN`` kept), as in :func:`percentile_rank_expression` and
+    :class:`~pirlygenes.expression.NormalizationPlan`.
+    """
+    import numpy as np
+    import pandas as pd
+
+    out = {}
+    if "tpm_clean" in modes or "tpm_clean_log1p" in modes:
+        clean = _clean_tpm_grouped(
+            values, np.zeros(len(values), dtype=np.int64), compartment,
+            reference,
+        )
+        if "tpm_clean" in modes:
+            out["tpm_clean"] = clean
+        if "tpm_clean_log1p" in modes:
+            out["tpm_clean_log1p"] = np.log1p(clean)
+    if "percentile" in modes:
+        out["percentile"] = pd.DataFrame(values).rank(pct=True).to_numpy() * 100
+    return out
+
+
+def normalize_per_sample_parquet(
+    source,
+    outputs,
+    *,
+    batch_size: int = 256,
+    row_group_size: int = 8192,
+    dtype=None,
+    spill_dir=None,
+):
+    """Stream-normalize a gene × sample parquet without loading it whole.
+
+    ``source`` is a parquet path in oncoref's per-sample layout
+    (``Ensembl_Gene_ID``, ``Symbol``, one column per sample) or a
+    :class:`pirlygenes.cohorts.Cohort`, fetched on first use like
+    :func:`pirlygenes.cohorts.read_per_sample`. ``outputs`` maps each
+    requested mode to its destination parquet:
+
+    - ``"tpm_clean"`` — the 16/9/75 :func:`clean_tpm_matrix` transform;
+    - ``"tpm_clean_log1p"`` — ``log1p`` of clean TPM;
+    - ``"percentile"`` — within-sample percentile rank (0–100) of the input
+      TPM, matching :class:`~pirlygenes.expression.NormalizationPlan`.
+
+    Every transform is per sample, so the source is read ``batch_size``
+    sample columns at a time and the clean-TPM compartments are derived once
+    from the gene columns. Each batch is written into an on-disk,
+    sample-major spill array (under ``spill_dir``, default the first
+    output's directory). Row groups are then handed to Arrow straight from
+    that spill without a copy, each holding at most ``row_group_size`` genes
+    and no more values than one ``batch_size`` batch, so peak memory is
+    bounded by the batch, not the cohort width. Outputs keep the source's gene rows
+    and sample order; sample columns are stored as ``dtype`` (``None``
+    follows :func:`pirlygenes.load_dataset.set_float_dtype_default`).
+
+    Returns ``{mode: Path}`` of the files written.
+    """
+    import tempfile
+    from pathlib import Path
+
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from ..cohorts import ID_COLS, Cohort
+    from ..load_dataset import _resolve_float_dtype
+
+    outputs = {str(mode): Path(path) for mode, path in dict(outputs).items()}
+    unknown = sorted(set(outputs) - set(_STREAM_NORMALIZE_MODES))
+    if unknown or not outputs:
+        raise ValueError(
+            f"outputs must map modes in {_STREAM_NORMALIZE_MODES!r} to "
+            f"parquet paths; got {sorted(outputs)!r}")
+    if int(batch_size) < 1 or int(row_group_size) < 1:
+        raise ValueError("batch_size and row_group_size must be positive")
+    if isinstance(source, Cohort):
+        from oncoref import source_matrices
+
+        source = source_matrices.ensure(source.code)
+    dtype = _resolve_float_dtype(dtype)
+
+    parquet = pq.ParquetFile(source)
+    names = parquet.schema_arrow.names
+    missing = [col for col in ID_COLS if col not in names]
+    if missing:
+        raise ValueError(
+            f"per-sample parquet {source} is missing gene columns {missing!r}")
+    samples = [col for col in names if col not in ID_COLS]
+    genes = parquet.read(columns=list(ID_COLS)).to_pandas()
+    gene_table = pd.DataFrame({
+        "Symbol": genes["Symbol"].fillna("").astype(str),
+        "Ensembl_Gene_ID": genes["Ensembl_Gene_ID"].fillna("").astype(str),
+    })
+    compartment, reference = _clean_tpm_compartments(gene_table)
+    n_genes, n_samples = len(gene_table), len(samples)
+    # A row group holds no more values than one sample batch does.
+    rows_per_group = max(1, min(
+        int(row_group_size), n_genes * int(batch_size) // max(1, n_samples),
+    ))
+
+    with tempfile.TemporaryDirectory(
+        dir=spill_dir or next(iter(outputs.values())).parent,
+    ) as tmp:
+        # Sample-major, so one sample's gene range is contiguous and Arrow
+        # wraps it without a copy.
+        spills = {
+            mode: np.lib.format.open_memmap(
+                Path(tmp) / f"{mode}.npy", mode="w+", dtype=dtype,
+                shape=(n_samples, n_genes),
+            )
+            for mode in outputs
+        }
+        for start in range(0, n_samples, int(batch_size)):
+            batch = samples[start:start + int(batch_size)]
+            values = (
+                parquet.read(columns=batch).to_pandas()
+                .apply(pd.to_numeric, errors="coerce")
+                .to_numpy(dtype=float)
+            )
+            transformed = _stream_normalize_batch(
+                values, compartment, reference, outputs,
+            )
+            for mode, block in transformed.items():
+                spills[mode][start:start + len(batch)] = block.T
+
+        arrow_type = pa.from_numpy_dtype(dtype)
+        schema = pa.schema(
+            [(col, pa.string()) for col in ID_COLS]
+            + [(name, arrow_type) for name in samples]
+        )
+        for mode, path in outputs.items():
+            spill = spills[mode]
+            with pq.ParquetWriter(path, schema) as writer:
+                for lo in range(0, n_genes, rows_per_group):
+                    hi = min(lo + rows_per_group, n_genes)
+                    arrays = [
+                        pa.array(genes[col].iloc[lo:hi].to_numpy(), pa.string())
+                        for col in ID_COLS
+                    ] + [pa.array(spill[j, lo:hi]) for j in range(n_samples)]
+                    writer.write_table(
+                        pa.Table.from_arrays(arrays, schema=schema))
+        # Release the memmaps before the spill directory is removed.
+        del spills, spill
+    return outputs
+
+
 __all__ = [
     "normalize_expression",
     "normalize_technical_rna_columns",
@@ -1176,4 +1816,5 @@ __all__ = [
     "technical_rna_mask",
     "clean_tpm_removal_mask",
     "clean_tpm_matrix",
+    "normalize_per_sample_parquet",
 ]
@@ -0,0 +1,337 @@
+"""Precompiled normalization for a fixed gene universe.
+
+:func:`~pirlygenes.expression.normalize_expression`,
+:func:`~pirlygenes.expression.clean_tpm_matrix` and
+:func:`~pirlygenes.expression.tpm_to_housekeeping_normalized` re-derive the
+gene-side state on every call: the ``gene_table``, the clean-TPM
+ribosomal / other-technical / biological compartments, the housekeeping
+panel IDs and their reference-profile TPMs. When many samples are quantified
+against the same gene universe (one Salmon index, one GTF) that state never
+changes. :class:`NormalizationPlan` derives it once —
+:meth:`NormalizationPlan.compile` — and :meth:`NormalizationPlan.apply` then
+only runs array arithmetic on each gene × sample matrix.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .normalize import (
+    _clean_tpm_compartments,
+    _housekeeping_panel_ensembl_ids,
+    _housekeeping_reference_tpm,
+    _housekeeping_size_factors,
+)
+from .qc import OTHER_TECHNICAL_FRACTION, RIBOSOMAL_PROTEIN_FRACTION
+
+
+_ID_COL = "Ensembl_Gene_ID"
+# Modes a plan can produce, with the mode each one is computed from ("tpm"
+# is the input matrix). Same vocabulary and dependencies as
+# pan_cancer_expression(normalize=...).
+_PLAN_MODE_SOURCES = {
+    "tpm": None,
+    "tpm_clean": "tpm",
+    "tpm_log1p": "tpm",
+    "tpm_clean_log1p": "tpm_clean",
+    "hk": "tpm",
+    "percentile": "tpm",
+}
+_PLAN_MODE_ALIASES = {"housekeeping": "hk"}
+_CLEAN_TPM_BUDGETS = (
+    RIBOSOMAL_PROTEIN_FRACTION * 1_000_000.0,
+    OTHER_TECHNICAL_FRACTION * 1_000_000.0,
+    (1.0 - RIBOSOMAL_PROTEIN_FRACTION - OTHER_TECHNICAL_FRACTION) * 1_000_000.0,
+)
+
+
+def _resolve_plan_modes(modes) -> tuple[str, ...]:
+    """Canonical, dependency-ordered tuple of the requested modes."""
+    requested = [modes] if isinstance(modes, str) else list(modes)
+    out: list[str] = []
+
+    def add(mode: str) -> None:
+        source = _PLAN_MODE_SOURCES[mode]
+        if source is not None and source != "tpm":
+            add(source)
+        if mode not in out:
+            out.append(mode)
+
+    for token in requested:
+        mode = _PLAN_MODE_ALIASES.get(str(token).lower(), str(token).lower())
+        if mode not in _PLAN_MODE_SOURCES:
+            raise ValueError(
+                f"modes must be drawn from {tuple(_PLAN_MODE_SOURCES)!r} "
+                f"(or 'housekeeping'); got {token!r}"
+            )
+        add(mode)
+    if not out:
+        raise ValueError("NormalizationPlan needs at least one mode")
+    return tuple(out)
+
+
+def _gene_table(gene_index) -> pd.DataFrame:
+    """``Symbol`` + ``Ensembl_Gene_ID`` table for a frame or an ID sequence."""
+    if isinstance(gene_index, pd.DataFrame):
+        if _ID_COL not in gene_index.columns:
+            raise ValueError(
+                f"NormalizationPlan.compile needs an {_ID_COL!r} column"
+            )
+        ids = gene_index[_ID_COL]
+        symbols = (
+            gene_index["Symbol"] if "Symbol" in gene_index.columns
+            else pd.Series("", index=gene_index.index)
+        )
+    else:
+        ids = pd.Series(list(gene_index))
+        symbols = pd.Series("", index=ids.index)
+    return pd.DataFrame({
+        "Symbol": symbols.fillna("").astype(str).to_numpy(),
+        _ID_COL: ids.fillna("").astype(str).to_numpy(),
+    })
+
+
+class NormalizationPlan:
+    """Gene-side normalization state compiled for one gene universe.
+
+    Attributes
+    ----------
+    genes
+        Row labels (``Ensembl_Gene_ID`` as given), a tuple of str. Every
+        matrix passed to :meth:`apply` must have these rows, in this order.
+    modes
+        Canonical, dependency-ordered modes :meth:`apply` returns.
+    compartment_rows
+        Row positions of the ribosomal-protein, other-technical and
+        biological clean-TPM compartments.
+    compartment_reference
+        Treehouse PolyA reference weight of each censored compartment row.
+    hk_gate_rows
+        Housekeeping-panel rows counted by the positivity gate.
+    hk_rows, hk_reference
+        Panel rows that also carry a reference-profile TPM, and that TPM —
+        the median-of-ratios denominator terms.
+    """
+
+    __slots__ = (
+        "genes", "modes", "compartment_rows", "compartment_reference",
+        "hk_gate_rows", "hk_rows", "hk_reference",
+        "min_hk_positive_genes", "min_hk_positive_fraction",
+    )
+
+    def __init__(
+        self,
+        genes,
+        modes,
+        compartment_rows,
+        compartment_reference,
+        hk_gate_rows,
+        hk_rows,
+        hk_reference,
+        *,
+        min_hk_positive_genes: int = 5,
+        min_hk_positive_fraction: float = 0.5,
+    ):
+        self.genes = tuple(genes)
+        self.modes = tuple(modes)
+        self.compartment_rows = tuple(compartment_rows)
+        self.compartment_reference = tuple(compartment_reference)
+        self.hk_gate_rows = hk_gate_rows
+        self.hk_rows = hk_rows
+        self.hk_reference = hk_reference
+        self.min_hk_positive_genes = int(min_hk_positive_genes)
+        self.min_hk_positive_fraction = float(min_hk_positive_fraction)
+
+    @classmethod
+    def compile(
+        cls,
+        gene_index,
+        modes: Iterable[str] = ("tpm_clean",),
+        *,
+        panel_ids: Optional[Iterable[str]] = None,
+        reference_profile=None,
+        min_hk_positive_genes: int = 5,
+        min_hk_positive_fraction: float = 0.5,
+    ) -> "NormalizationPlan":
+        """Precompute every gene-side constant for ``gene_index``.
+
+        ``gene_index`` is a gene table with an ``Ensembl_Gene_ID`` column
+        (``Symbol`` optional) or a sequence of Ensembl IDs; versioned IDs
+        match their unversioned form. ``modes`` draws from ``"tpm"``,
+        ``"tpm_clean"``, ``"tpm_log1p"``, ``"tpm_clean_log1p"``, ``"hk"``
+        (alias ``"housekeeping"``) and ``"percentile"``, with the same
+        meaning as in :func:`pan_cancer_expression`. ``panel_ids``,
+        ``reference_profile`` and the ``min_hk_positive_*`` gates match
+        :func:`tpm_to_housekeeping_normalized`.
+        """
+        if not 0 <= float(min_hk_positive_fraction) <= 1:
+            raise ValueError("min_hk_positive_fraction must be between 0 and 1")
+        if int(min_hk_positive_genes) < 0:
+            raise ValueError("min_hk_positive_genes must be non-negative")
+        modes = _resolve_plan_modes(modes)
+        gene_table = _gene_table(gene_index)
+
+        compartment, reference = _clean_tpm_compartments(gene_table)
+        compartment_rows = [
+            np.flatnonzero(compartment == code) for code in range(3)
+        ]
+        compartment_reference = [
+            reference[rows] for rows in compartment_rows[:2]
+        ]
+
+        ids = gene_table[_ID_COL].str.split(".").str[0].str.strip()
+        empty = np.array([], dtype=np.int64)
+        hk_gate_rows, hk_rows, hk_reference = empty, empty, np.array([])
+        if "hk" in modes:
+            panel = _housekeeping_panel_ensembl_ids(panel_ids)
+            reference_tpm = _housekeeping_reference_tpm(reference_profile)
+            hk_gate_rows = np.flatnonzero(ids.isin(panel).to_numpy())
+            hk_rows = hk_gate_rows[
+                ids.iloc[hk_gate_rows].isin(reference_tpm.keys()).to_numpy()
+            ]
+            hk_reference = ids.iloc[hk_rows].map(reference_tpm).to_numpy(
+                dtype=float,
+            )
+        return cls(
+            gene_table[_ID_COL],
+            modes,
+            compartment_rows,
+            compartment_reference,
+            hk_gate_rows,
+            hk_rows,
+            hk_reference,
+            min_hk_positive_genes=min_hk_positive_genes,
+            min_hk_positive_fraction=min_hk_positive_fraction,
+        )
+
+    def __len__(self) -> int:
+        return len(self.genes)
+
+    def __repr__(self) -> str:
+        return (
+            f"NormalizationPlan({len(self.genes)} genes, "
+            f"modes={list(self.modes)!r}, "
+            f"{len(self.hk_rows)} housekeeping genes)"
+        )
+
+    def clean_tpm(self, values: np.ndarray) -> np.ndarray:
+        """The 16/9/75 clean-TPM transform of a gene × sample float array.
+
+        Same arithmetic as :func:`clean_tpm_matrix`: censored rows take the
+        reference composition scaled to their compartment budget wherever
+        they are measured; biological rows are rescaled to 750k. Missing
+        inputs stay ``NaN``; a compartment with no positive mass is zeroed.
+        """
+        measured = ~np.isnan(values)
+        clean = np.empty(values.shape, dtype=float)
+        for code, rows in enumerate(self.compartment_rows):
+            if not len(rows):
+                continue
+            if code < 2:
+                weights = self.compartment_reference[code]
+                totals = weights @ measured[rows]
+                base = np.broadcast_to(weights[:, None], (len(rows), values.shape[1]))
+            else:
+                base = values[rows]
+                totals = np.nansum(base, axis=0)
+            scales = np.zeros(values.shape[1])
+            np.divide(
+                _CLEAN_TPM_BUDGETS[code], totals, out=scales, where=totals > 0,
+            )
+            clean[rows] = base * scales
+        clean[~measured] = np.nan
+        return clean
+
+    def housekeeping_size_factors(self, values: np.ndarray) -> np.ndarray:
+        """Per-sample median-of-ratios size factors (``NaN`` = gate failed)."""
+        return _housekeeping_size_factors(
+            values,
+            self.hk_gate_rows,
+            self.hk_rows,
+            self.hk_reference,
+            min_hk_positive_genes=self.min_hk_positive_genes,
+            min_hk_positive_fraction=self.min_hk_positive_fraction,
+        )
+
+    def _check_gene_index(self, index: pd.Index) -> None:
+        """Reject a gene-ID-labelled frame whose rows are not :attr:`genes`.
+
+        The index counts as gene IDs when it is named ``Ensembl_Gene_ID`` (or
+        has such a level) or mostly holds :attr:`genes` labels; it must then
+        list them in order, versioned IDs matching their unversioned form.
+        Positional and symbol indexes are trusted as-is.
+        """
+        named = _ID_COL in (index.names or [])
+        if isinstance(index, pd.MultiIndex):
+            if not named:
+                return
+            index = index.get_level_values(_ID_COL)
+        if len(index) != len(self.genes):
+            return  # reported by apply()'s shape check
+        given = pd.Index(index.astype(str)).str.split(".").str[0]
+        expected = pd.Index(self.genes).str.split(".").str[0]
+        if given.equals(expected):
+            return
+        # Symbol-labelled rows can still hold a few ENSG-named genes, so only
+        # an index made mostly of plan genes counts as gene IDs.
+        if named or given.isin(expected).mean() > 0.5:
+            mismatch = int(np.flatnonzero(given != expected)[0])
+            raise ValueError(
+                "matrix rows are not in the plan's gene order: row "
+                f"{mismatch} is {index[mismatch]!r}, the plan expects "
+                f"{self.genes[mismatch]!r}; reindex the matrix to plan.genes"
+            )
+
+    def apply(self, matrix) -> dict:
+        """Normalize a gene × sample matrix into every compiled mode.
+
+        ``matrix`` is a 2-D array or a DataFrame whose rows follow
+        :attr:`genes` and whose columns are all sample values. A DataFrame
+        indexed by gene ID must list :attr:`genes` in the same order, or
+        ``ValueError`` is raised. Returns
+        ``{mode: result}`` in :attr:`modes` order; results are float64 arrays
+        for array input and DataFrames with ``matrix``'s index and columns for
+        DataFrame input.
+        """
+        frame = matrix if isinstance(matrix, pd.DataFrame) else None
+        if frame is not None:
+            self._check_gene_index(frame.index)
+            values = frame.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = np.asarray(matrix, dtype=float)
+        if values.ndim != 2 or values.shape[0] != len(self.genes):
+            raise ValueError(
+                f"matrix shape {values.shape} does not match the plan's "
+                f"{len(self.genes)} genes"
+            )
+        results = {"tpm": values}
+        for mode in self.modes:
+            if mode == "tpm":
+                results[mode] = values.copy()
+                continue
+            source = values if _PLAN_MODE_SOURCES[mode] == "tpm" else (
+                results[_PLAN_MODE_SOURCES[mode]]
+            )
+            if mode == "tpm_clean":
+                results[mode] = self.clean_tpm(source)
+            elif mode in ("tpm_log1p", "tpm_clean_log1p"):
+                results[mode] = np.log1p(source)
+            elif mode == "hk":
+                results[mode] = source / self.housekeeping_size_factors(source)
+            elif mode == "percentile":
+                results[mode] = (
+                    pd.DataFrame(source).rank(pct=True).to_numpy() * 100
+                )
+        out = {mode: results[mode] for mode in self.modes}
+        if frame is not None:
+            out = {
+                mode: pd.DataFrame(block, index=frame.index, columns=frame.columns)
+                for mode, block in out.items()
+            }
+        return out
+
+
+__all__ = ["NormalizationPlan"]
@@ -88,10 +88,10 @@ from __future__ import annotations
 import os
 import re
 from collections import defaultdict
-from functools import lru_cache
 
 import pandas as pd
 
+from pirlygenes.caches import cached
 from pirlygenes.load_dataset import get_data
 
 def _natural_key(s):
@@ -144,7 +144,7 @@ def proteoform_id(member_symbols):
     return "/".join(syms)
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def protein_identical_groups() -> pd.DataFrame:
     """The derived protein-identical gene-group table (one row per member)."""
     return get_data("protein-identical-gene-groups")
@@ -195,7 +195,7 @@ def _space_groups(kind: str) -> pd.DataFrame:
     return cdna_identical_groups() if kind == "cdna" else protein_identical_groups()
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def member_to_canonical(kind: str = "cdna") -> dict[str, str]:
     """``{member_ensg: canonical_ensg}`` for a proteoform space. The 'cdna' space
     applies the curated overrides last (they force-collapse a whole protein group,
@@ -215,7 +215,7 @@ def member_to_canonical(kind: str = "cdna") -> dict[str, str]:
     return m
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def canonical_to_symbol(kind: str = "cdna") -> dict[str, str]:
     """``{canonical_ensg: proteoform_symbol}`` for a space (the 'cdna' space
     applies the override's symbol)."""
@@ -229,7 +229,7 @@ def canonical_to_symbol(kind: str = "cdna") -> dict[str, str]:
     return out
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def symbol_to_canonical(kind: str = "cdna") -> dict[str, str]:
     """``{member_symbol_upper: proteoform_symbol}`` (+ display aliases) for a
     space — fold a symbol-keyed panel/matrix onto its proteoform symbols. The
@@ -436,7 +436,7 @@ def collapse_protein_identical_loci_long(
 # MAGEA6) stay separate.
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def cdna_identical_groups() -> pd.DataFrame:
     """The derived cDNA-identical gene-group table (one row per member)."""
     return get_data("cdna-identical-gene-groups")
@@ -525,7 +525,7 @@ def collapse_cdna_identical_loci_long(
         canonical_to_symbol=_cdna_canonical_to_symbol())
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def members_by_canonical(kind: str = "cdna") -> dict:
     """``{canonical_ensg: ";".join(sorted member ENSGs)}`` for a space — the real
     constituent ENSGs of each fold group (for ``Member_Ensembl_Gene_IDs``)."""
@@ -616,7 +616,7 @@ def add_proteoform_columns(df: pd.DataFrame, *, kind: str = "cdna",
 # a collapsed expression matrix's key; use these to *annotate* what was grouped.)
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def _ensg_to_symbol() -> dict[str, str]:
     """``{member_ensg: symbol}`` across BOTH group tables — a member's symbol lives
     in whichever table it came from, and the protein table carries the cdna-space
@@ -630,7 +630,7 @@ def _ensg_to_symbol() -> dict[str, str]:
     return out
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def _canonical_to_member_ensgs(kind: str = "protein") -> dict[str, list[str]]:
     """``{canonical_ensg: [member ENSGs, sorted]}`` for a space. Derived by
     inverting :func:`member_to_canonical` — the single override-aware source of
@@ -644,7 +644,7 @@ def _canonical_to_member_ensgs(kind: str = "protein") -> dict[str, list[str]]:
     return {c: sorted(_dedup(v)) for c, v in out.items()}
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def _canonical_to_member_symbols(kind: str = "protein") -> dict[str, list[str]]:
     """``{canonical_ensg: [member symbols, natural-sorted]}`` for a space —
     override-aware via :func:`_canonical_to_member_ensgs`, with symbols resolved
@@ -25,11 +25,12 @@ passes against legacy data.
 from __future__ import annotations
 
 import warnings
-from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+from ..caches import cached
+
 
 PRIMARY_SOURCES: frozenset[str] = frozenset({
     "BEATAML_OHSU_2022",
@@ -99,7 +100,7 @@ def set_yaml_path(path: Path | None) -> None:
     clear_cache()
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _yaml_overlay() -> dict[str, tuple[str, str | None]]:
     """Return ``{source_cohort: (tumor_origin, metastasis_site_or_None)}``
     parsed from any YAML source that declares those fields.
@@ -18,11 +18,11 @@ import re
 import warnings
 from collections import defaultdict
 from dataclasses import dataclass
-from functools import lru_cache
 from typing import Iterable, Sequence, cast
 
 import pandas as pd
 
+from .caches import cached
 from .gene_ids import (
     find_gene_and_ensembl_release_by_name,
     find_gene_name_from_ensembl_gene_id,
@@ -139,7 +139,7 @@ def _gene_id_from_pyensembl(gene) -> str | None:
     return strip_version(raw) if raw else None
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _canonical_reference_frame():
     """Bundled offline snapshot of the authority release's gene table, or None.
 
@@ -252,7 +252,7 @@ def _maps_from_pyensembl() -> dict[str, object]:
     return _empty_maps()
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _canonical_release_maps() -> dict[str, object]:
     """ID / symbol / contig / biotype maps for the canonical authority release.
 
@@ -308,7 +308,7 @@ def _authority_gene_id_for_symbol(symbol: str) -> str | None:
     return None
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _ensembl_alias_maps() -> tuple[dict[str, str], dict[str, str]]:
     """Return ``(alias->canonical, canonical->symbol_hint)``.
 
@@ -338,7 +338,7 @@ def _ensembl_alias_maps() -> tuple[dict[str, str], dict[str, str]]:
     return alias_to_canonical, canonical_to_symbol
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _sequence_identity_map() -> dict[str, str]:
     """``member ENSG -> canonical ENSG`` for byte-identical-cDNA gene groups.
 
@@ -363,7 +363,7 @@ def _sequence_identity_map() -> dict[str, str]:
     return out
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _combined_canonical_map() -> dict[str, str]:
     """``id -> terminal canonical`` over the union of the alt-haplotype/retired
     alias edges and the byte-identical-sequence edges (#465).
@@ -413,7 +413,7 @@ def _combined_canonical_map() -> dict[str, str]:
     return out
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _cross_release_name_map() -> dict[str, str]:
     """Bundled ``ENSG -> symbol`` across Ensembl releases, or {} if absent."""
     try:
@@ -491,7 +491,7 @@ def _canonicalize_ensembl_gene_id(
     return mapped
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _known_proteoform_ids() -> frozenset[str]:
     """Bundled synthetic proteoform keys across both reduced spaces."""
     try:
@@ -512,7 +512,7 @@ def _id_is_in_declared_space(gene_id: str) -> bool:
     return bool(_CANONICAL_ENSG_RE.match(gene_id))
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def _canonical_gene_id_cached(
     identifier: str,
     source_version: str | None,
@@ -590,7 +590,7 @@ def canonical_gene_id(
     return None
 
 
-@lru_cache(maxsize=None)
+@cached(maxsize=None)
 def canonical_gene_symbol(ensembl_gene_id: str, fallback: str | None = None) -> str:
     """Return one display symbol for a canonical ENSG."""
     gene_id = canonical_gene_id(ensembl_gene_id) or _clean_identifier(ensembl_gene_id)
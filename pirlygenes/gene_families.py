@@ -39,11 +39,11 @@ from __future__ import annotations
 
 import warnings
 from dataclasses import dataclass
-from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 
+from .caches import cached
 from .gene_ids import strip_version as _strip_version
 
 
@@ -86,7 +86,7 @@ GENE_FAMILIES: tuple[GeneFamily, ...] = (
 # ---------- helpers ----------
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _load_table() -> pd.DataFrame:
     frames: list[pd.DataFrame] = []
     missing: list[str] = []
@@ -262,7 +262,7 @@ def _sorted_by_priority(df: pd.DataFrame) -> pd.DataFrame:
     ).sort_values("_priority", kind="stable")
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _ensembl_id_to_family() -> dict[str, str]:
     """``{ENSG: family_name}`` with deterministic first-match-wins ordering."""
     df = _sorted_by_priority(_load_table())
@@ -272,7 +272,7 @@ def _ensembl_id_to_family() -> dict[str, str]:
     return dict(zip(df["Ensembl_Gene_ID"], df["family"]))
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _symbol_to_family() -> dict[str, str]:
     """``{SYMBOL: family_name}`` with deterministic first-match-wins ordering."""
     df = _sorted_by_priority(_load_table())
@@ -10,13 +10,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import lru_cache
 from typing import Optional, Sequence, Tuple, List
 
 from tqdm import tqdm
 import pyensembl
 from pyensembl.shell import collect_all_installed_ensembl_releases
 
+from .caches import cached
 from .gene_names import get_alias_as_list, get_reverse_alias_as_list, short_gene_name
 
 genomes = sorted(
@@ -74,7 +74,7 @@ def gene_for_ensembl_id(genome, gene_id: str):
 # matches no installed Ensembl release and is not a curated display alias.
 # ---------------------------------------------------------------------------
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _ncbi_symbol_synonyms() -> dict[str, str]:
     """Load oncoref's synonym rows without collapsing case distinctions."""
     from .load_dataset import get_data
@@ -314,6 +314,24 @@ def _build_indexes():
     _indexes_built = True
 
 
+def _close_genome_databases() -> None:
+    """Close every open pyensembl SQLite connection.
+
+    SQLite connections must not cross a ``fork``: a child that inherits one
+    shares the parent's file descriptor and lock state. Closing them before
+    a process pool starts makes each worker open its own on first use; the
+    parent reopens lazily too. Goes through ``Database._connection`` rather
+    than ``Database.close()``, which older supported pyensembl releases
+    lack.
+    """
+    for genome in genomes:
+        db = getattr(genome, "_db", None)
+        connection = getattr(db, "_connection", None)
+        if connection is not None:
+            connection.close()
+            db._connection = None
+
+
 def _lookup_gene_name_in_older_releases(gene_id: str) -> Optional[str]:
     """Resolve a gene ID against older installed releases on demand.
 
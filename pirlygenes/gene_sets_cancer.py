@@ -15,8 +15,8 @@ from __future__ import annotations
 import threading
 import warnings
 from collections.abc import Mapping
-from functools import lru_cache
 
+from .caches import cached
 from .load_dataset import get_data
 
 
@@ -2359,7 +2359,7 @@ from tsarina.partition import (  # noqa: E402,F401
 )
 
 
-@lru_cache(maxsize=1)
+@cached(maxsize=1)
 def _cta_protein_group_index():
     """``({protein_group: [member_symbol, ...]}, {member_symbol: protein_group})``
     over ``cta-protein-groups`` — the curated identical / near-identical CTA
@@ -31,16 +31,21 @@ missing from both roots, :func:`pirlygenes.data_bundle.ensure_local`
 triggers a one-time download from the GitHub Release.
 """
 
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from . import data_bundle
+from .caches import _SingleFlight, register_cache
 
 _BUNDLED_DATA_DIR = Path(__file__).parent / "data"
 _DOWNLOADED_DATA_DIR = data_bundle.cache_dir()
 _DATASET_PATHS = None
-_CACHED_DATAFRAMES = {}
 
 # Base-layer normalization/gene-family datasets owned by oncoref. Keep their
 # historical pirlygenes get_data names as compatibility re-exports without
@@ -71,6 +76,335 @@ _PIRLYGENES_AGGREGATE_CODES = frozenset({
 # Back-compat alias — many call sites still import _DATA_DIR.
 _DATA_DIR = _BUNDLED_DATA_DIR
 
+# Process-wide default for the ``readonly=`` flag of get_data and the cached
+# reference accessors. Off unless PIRLYGENES_READONLY=1 or set_readonly_default().
+_READONLY_ENV_VAR = "PIRLYGENES_READONLY"
+_READONLY_DEFAULT = os.environ.get(_READONLY_ENV_VAR, "").strip().lower() in {
+    "1", "true", "yes", "on",
+}
+
+
+def set_readonly_default(readonly: bool) -> bool:
+    """Set the process-wide default for ``readonly=`` and return the old one.
+
+    Affects :func:`get_data`, :func:`pirlygenes.expression.pan_cancer_expression`
+    and :func:`pirlygenes.expression.cohort_expression_views` whenever they are
+    called with ``readonly=None`` (the default). The initial value comes from
+    the ``PIRLYGENES_READONLY`` environment variable.
+    """
+    global _READONLY_DEFAULT
+    previous = _READONLY_DEFAULT
+    _READONLY_DEFAULT = bool(readonly)
+    return previous
+
+
+def _resolve_readonly(readonly) -> bool:
+    return _READONLY_DEFAULT if readonly is None else bool(readonly)
+
+
+# Process-wide storage dtype for the cached reference matrices (pan-cancer
+# expression, canonical cohort views, per-sample cohort matrices). float64
+# unless PIRLYGENES_FLOAT_DTYPE=float32 or set_float_dtype_default().
+_FLOAT_DTYPE_ENV_VAR = "PIRLYGENES_FLOAT_DTYPE"
+_FLOAT_DTYPES = ("float64", "float32")
+
+
+def _parse_float_dtype(dtype) -> np.dtype:
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError:
+        resolved = None
+    if resolved is None or resolved.name not in _FLOAT_DTYPES:
+        raise ValueError(f"dtype must be 'float32' or 'float64', got {dtype!r}")
+    return resolved
+
+
+try:
+    _FLOAT_DTYPE_DEFAULT = _parse_float_dtype(
+        os.environ.get(_FLOAT_DTYPE_ENV_VAR, "").strip() or "float64"
+    )
+except ValueError:
+    _FLOAT_DTYPE_DEFAULT = np.dtype("float64")
+
+
+def set_float_dtype_default(dtype) -> np.dtype:
+    """Set the process-wide storage dtype and return the old one.
+
+    ``"float32"`` halves the resident size of the cached pan-cancer matrix and
+    its derived normalize variants, the canonical cohort views and per-sample
+    cohort matrices; normalization constants (clean-TPM scales, housekeeping
+    denominators, percentile references) are still derived in float64.
+    Affects :func:`pirlygenes.expression.pan_cancer_expression`,
+    :func:`pirlygenes.expression.cohort_expression_views` and
+    :func:`pirlygenes.cohorts.read_per_sample` whenever they are called with
+    ``dtype=None`` (the default). The initial value comes from the
+    ``PIRLYGENES_FLOAT_DTYPE`` environment variable.
+    """
+    global _FLOAT_DTYPE_DEFAULT
+    previous = _FLOAT_DTYPE_DEFAULT
+    _FLOAT_DTYPE_DEFAULT = _parse_float_dtype(dtype)
+    return previous
+
+
+def _resolve_float_dtype(dtype) -> np.dtype:
+    return _FLOAT_DTYPE_DEFAULT if dtype is None else _parse_float_dtype(dtype)
+
+
+def _cast_float_columns(df: pd.DataFrame, dtype, columns=None) -> pd.DataFrame:
+    """``df`` with its float (or the given) columns stored as ``dtype``; the
+    frame itself when nothing changes."""
+    dtype = np.dtype(dtype)
+    if columns is None:
+        columns = [
+            c for c in df.columns if pd.api.types.is_float_dtype(df.dtypes[c])
+        ]
+    changes = {c: dtype for c in columns if df.dtypes[c] != dtype}
+    return df.astype(changes) if changes else df
+
+
+def _copy_on_write_active() -> bool:
+    """True when pandas Copy-on-Write protects shallow copies (always >= 3.0)."""
+    if int(pd.__version__.split(".", 1)[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def _readonly_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Zero-copy view of a cached frame that can never write through to it.
+
+    Under pandas Copy-on-Write the view shares the cached buffers: its NumPy
+    arrays (``.to_numpy()``, ``.values``) are non-writeable, and any pandas-level
+    mutation copies just the touched columns first. Without Copy-on-Write
+    (pandas 2 with the option off) a shallow view would alias the cache, so
+    this falls back to a defensive copy.
+    """
+    if _copy_on_write_active():
+        return df.copy(deep=False)
+    return df.copy()
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxbytes", "currbytes", "entries"],
+)
+
+
+def _frame_nbytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class _FrameLRUCache(MutableMapping):
+    """Thread-safe LRU of DataFrames bounded by their total deep memory use.
+
+    Least-recently-used entries are evicted once ``maxbytes`` is exceeded; a
+    single frame larger than the whole budget is never stored. Pinned entries
+    count toward the budget but are never evicted by it — frames no larger
+    than ``pin_nbytes`` are pinned on insert, and :meth:`pin` pins any stored
+    key. Keys must be hashable — callers bypass the cache on ``TypeError``.
+
+    Also a ``MutableMapping``, so dict-style callers keep working;
+    ``cache[key] = frame`` is :meth:`put`, and a silently dropped oversized
+    frame means a following ``cache[key]`` can raise ``KeyError``.
+    """
+
+    def __init__(self, maxbytes: int, *, pin_nbytes: int = 0):
+        self.maxbytes = max(int(maxbytes), 0)
+        self.pin_nbytes = max(int(pin_nbytes), 0)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._nbytes: dict = {}
+        self._pinned: set = set()
+        self._currbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            frame = self._entries.get(key)
+            if frame is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return frame
+
+    def put(self, key, frame: pd.DataFrame) -> None:
+        nbytes = _frame_nbytes(frame)
+        with self._lock:
+            self._discard(key)
+            if nbytes <= self.pin_nbytes:
+                self._pinned.add(key)
+            elif nbytes > self.maxbytes:
+                return
+            self._entries[key] = frame
+            self._nbytes[key] = nbytes
+            self._currbytes += nbytes
+            self._evict()
+
+    def pin(self, key) -> None:
+        """Exempt a stored entry from budget eviction (``KeyError`` if absent)."""
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._pinned.add(key)
+
+    def evict(self, key) -> bool:
+        """Drop ``key`` even if pinned; ``True`` when something was dropped."""
+        with self._lock:
+            return self._discard(key)
+
+    def _discard(self, key) -> bool:
+        if key not in self._entries:
+            return False
+        del self._entries[key]
+        self._currbytes -= self._nbytes.pop(key)
+        self._pinned.discard(key)
+        return True
+
+    def _evict(self) -> None:
+        if self._currbytes <= self.maxbytes:
+            return
+        for key in [k for k in self._entries if k not in self._pinned]:
+            if self._currbytes <= self.maxbytes:
+                break
+            self._discard(key)
+
+    def resize(self, maxbytes: int) -> int:
+        with self._lock:
+            previous = self.maxbytes
+            self.maxbytes = max(int(maxbytes), 0)
+            self._evict()
+            return previous
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes.clear()
+            self._pinned.clear()
+            self._currbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.maxbytes,
+                self._currbytes,
+                len(self._entries),
+            )
+
+    # MutableMapping protocol: lookups here do not touch hit/miss counters.
+
+    def __getitem__(self, key):
+        with self._lock:
+            frame = self._entries[key]
+            self._entries.move_to_end(key)
+            return frame
+
+    def __setitem__(self, key, frame: pd.DataFrame) -> None:
+        self.put(key, frame)
+
+    def __delitem__(self, key) -> None:
+        if not self.evict(key):
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_DATAFRAME_FLIGHTS = _SingleFlight()
+
+
+# Packaged datasets stay resident up to this many bytes (least recently used
+# first out). Small curated panels are pinned and never evicted; the big
+# delegated reference/sample frames are what the budget actually bounds.
+_DATASET_CACHE_ENV_VAR = "PIRLYGENES_DATASET_CACHE_BYTES"
+_DATASET_CACHE_DEFAULT_BYTES = 4 * 2**30
+_DATASET_CACHE_PIN_BYTES = 2**20
+
+
+def _dataset_cache_budget() -> int:
+    try:
+        return int(os.environ[_DATASET_CACHE_ENV_VAR])
+    except (KeyError, ValueError):
+        return _DATASET_CACHE_DEFAULT_BYTES
+
+
+_CACHED_DATAFRAMES = _FrameLRUCache(
+    _dataset_cache_budget(), pin_nbytes=_DATASET_CACHE_PIN_BYTES,
+)
+register_cache("load_dataset._CACHED_DATAFRAMES", lambda: _CACHED_DATAFRAMES)
+
+
+def _dataset_cache_key(name: str) -> str:
+    """The ``_CACHED_DATAFRAMES`` key ``get_data(name)`` stores under."""
+    return name.lower().removesuffix(".gz").removesuffix(".csv") + ".csv"
+
+
+def set_dataset_cache_budget(maxbytes: int) -> int:
+    """Set the byte ceiling of the :func:`get_data` dataset cache.
+
+    Evicts least-recently-used datasets down to the new ceiling (pinned small
+    panels stay); ``0`` keeps only pinned panels resident. Returns the previous
+    ceiling. The initial value comes from the ``PIRLYGENES_DATASET_CACHE_BYTES``
+    environment variable (4 GiB by default).
+    """
+    return _CACHED_DATAFRAMES.resize(maxbytes)
+
+
+def evict_dataset(name: str) -> bool:
+    """Drop one dataset from the :func:`get_data` cache, pinned or not.
+
+    The next ``get_data(name)`` re-reads it. Returns ``True`` when the dataset
+    was resident. Frames delegated to oncoref may stay alive in oncoref's own
+    cache.
+    """
+    target = _dataset_cache_key(name)
+    evicted = False
+    for key in list(_CACHED_DATAFRAMES):
+        if _dataset_cache_key(key) == target:
+            _CACHED_DATAFRAMES.pop(key, None)
+            evicted = True
+    return evicted
+
+
+def _cached_dataset(cache_key: str, build) -> pd.DataFrame:
+    """``_CACHED_DATAFRAMES[cache_key]``, built once by ``build()`` on a miss.
+
+    Returns the built frame itself rather than re-reading the cache, which
+    may have declined (oversized) or already evicted it.
+    """
+    cached = _CACHED_DATAFRAMES.get(cache_key)
+    if cached is not None:
+        return cached
+    with _DATAFRAME_FLIGHTS(cache_key):
+        try:
+            return _CACHED_DATAFRAMES[cache_key]
+        except KeyError:
+            pass
+        cached = build()
+        _CACHED_DATAFRAMES[cache_key] = cached
+    return cached
+
+
+def _serve_cached(df: pd.DataFrame, *, copy: bool, readonly) -> pd.DataFrame:
+    """Return a cached frame per the ``copy=`` / ``readonly=`` contract."""
+    if not copy:
+        return df
+    if _resolve_readonly(readonly):
+        return _readonly_frame(df)
+    return df.copy()
+
 
 def _data_roots() -> list[Path]:
     """Roots checked when resolving a data file, in priority order."""
@@ -379,7 +713,33 @@ def _reconcile_reference_expression_samples(
     return out
 
 
-def get_data(name, _dataframes_dict=None, *, copy=True):
+def _load_delegated_dataset(delegated_name: str) -> pd.DataFrame:
+    """Fetch one of ``_ONCOREF_DATASETS`` from oncoref for the dataset cache."""
+    if delegated_name == "cohort-registry":
+        import oncoref
+
+        # Use the owner's public resolver, which reconciles physical
+        # source rows; its generic table is the unprocessed input.
+        delegated = oncoref.cohort_registry_df()
+    else:
+        from oncoref.load_dataset import get_data as get_oncoref_data
+
+        delegated = get_oncoref_data(
+            delegated_name,
+            copy=False,
+        )
+    if delegated_name == "cancer-cohort-aggregates":
+        delegated = delegated.loc[
+            delegated["aggregate_code"].astype(str).isin(
+                _PIRLYGENES_AGGREGATE_CODES
+            )
+        ].copy()
+    elif delegated_name == "cancer-reference-expression-samples":
+        delegated = _reconcile_reference_expression_samples(delegated)
+    return delegated
+
+
+def get_data(name, _dataframes_dict=None, *, copy=True, readonly=None):
     """Load a packaged dataset as a DataFrame.
 
     By default returns a defensive ``.copy()`` so callers that mutate in
@@ -389,37 +749,24 @@ def get_data(name, _dataframes_dict=None, *, copy=True):
     mutation. This skips the full-frame copy, which for the large
     ``cancer-reference-expression`` table (multi-million-row summary frame)
     dominated test-suite time (#278).
+
+    ``readonly=True`` is the public zero-copy mode: it returns a view backed by
+    the cached buffers instead of a full copy, so hot read paths allocate
+    nothing. Under pandas Copy-on-Write (always on from pandas 3.0) the view's
+    NumPy arrays are non-writeable and pandas-level writes copy first, so the
+    cache stays protected; older pandas without Copy-on-Write falls back to a
+    copy. ``readonly=None`` follows :func:`set_readonly_default`.
+    ``copy=False`` takes precedence.
     """
     normalized_name = name.lower()
 
     delegated_name = normalized_name.removesuffix(".csv")
     if _dataframes_dict is None and delegated_name in _ONCOREF_DATASETS:
-        cache_key = f"{delegated_name}.csv"
-        if cache_key not in _CACHED_DATAFRAMES:
-            if delegated_name == "cohort-registry":
-                import oncoref
-
-                # Use the owner's public resolver, which reconciles physical
-                # source rows; its generic table is the unprocessed input.
-                delegated = oncoref.cohort_registry_df()
-            else:
-                from oncoref.load_dataset import get_data as get_oncoref_data
-
-                delegated = get_oncoref_data(
-                    delegated_name,
-                    copy=False,
-                )
-            if delegated_name == "cancer-cohort-aggregates":
-                delegated = delegated.loc[
-                    delegated["aggregate_code"].astype(str).isin(
-                        _PIRLYGENES_AGGREGATE_CODES
-                    )
-                ].copy()
-            elif delegated_name == "cancer-reference-expression-samples":
-                delegated = _reconcile_reference_expression_samples(delegated)
-            _CACHED_DATAFRAMES[cache_key] = delegated
-        cached = _CACHED_DATAFRAMES[cache_key]
-        return cached.copy() if copy else cached
+        cached = _cached_dataset(
+            f"{delegated_name}.csv",
+            lambda: _load_delegated_dataset(delegated_name),
+        )
+        return _serve_cached(cached, copy=copy, readonly=readonly)
 
     # The empirical cancer-reference-expression rows are owned by oncoref. Keep
     # pirlygenes' generic get_data surface working, but never select the duplicate
@@ -431,16 +778,13 @@ def get_data(name, _dataframes_dict=None, *, copy=True):
     if _dataframes_dict is None and normalized_name in (
         "cancer-reference-expression", "cancer-reference-expression.csv"
     ):
-        cache_key = "cancer-reference-expression.csv"
-        if cache_key not in _CACHED_DATAFRAMES:
-            from oncoref.load_dataset import get_data as get_oncoref_data
+        from oncoref.load_dataset import get_data as get_oncoref_data
 
-            delegated = get_oncoref_data(
-                "cancer-reference-expression", copy=False
-            )
-            _CACHED_DATAFRAMES[cache_key] = delegated
-        cached = _CACHED_DATAFRAMES[cache_key]
-        return cached.copy() if copy else cached
+        cached = _cached_dataset(
+            "cancer-reference-expression.csv",
+            lambda: get_oncoref_data("cancer-reference-expression", copy=False),
+        )
+        return _serve_cached(cached, copy=copy, readonly=readonly)
 
     # The cancer-type registry is owned by oncoref (the empirical base layer);
     # pirlygenes re-exports it rather than shipping a divergent copy. Routing the
@@ -457,7 +801,7 @@ def get_data(name, _dataframes_dict=None, *, copy=True):
         registry = _normalize_dataset_dtypes(
             "cancer-type-registry", oncoref.cancer_type_registry()
         )
-        return registry.copy() if copy else registry
+        return _serve_cached(registry, copy=copy, readonly=readonly)
 
     # cancer-subtype-groupings (cross-cutting MSI/MSS/POLE/HPV/MYCN/EBV axes) is
     # likewise owned by oncoref as of 1.8.95 — a lossless superset of pirlygenes'
@@ -473,7 +817,7 @@ def get_data(name, _dataframes_dict=None, *, copy=True):
         groupings = _normalize_dataset_dtypes(
             "cancer-subtype-groupings", oncoref.cancer_subtype_groupings()
         )
-        return groupings.copy() if copy else groupings
+        return _serve_cached(groupings, copy=copy, readonly=readonly)
 
     # cancer-apd1-response and cancer-tmb are owned by oncoref's structured,
     # provenance-bearing tables (value_basis / source_scope / estimate_type /
@@ -499,7 +843,7 @@ def get_data(name, _dataframes_dict=None, *, copy=True):
                 trial = trial.fillna(apd1["trial_alias"])
             apd1["trial"] = trial
         apd1 = _normalize_dataset_dtypes("cancer-apd1-response", apd1)
-        return apd1.copy() if copy else apd1
+        return _serve_cached(apd1, copy=copy, readonly=readonly)
 
     if _dataframes_dict is None and normalized_name in (
         "cancer-tmb", "cancer-tmb.csv"
@@ -507,7 +851,7 @@ def get_data(name, _dataframes_dict=None, *, copy=True):
         import oncoref
 
         tmb = _normalize_dataset_dtypes("cancer-tmb", oncoref.cancer_tmb_df())
-        return tmb.copy() if copy else tmb
+        return _serve_cached(tmb, copy=copy, readonly=readonly)
 
     candidates = [name, name.lower()]
     for candidate in list(candidates):
@@ -537,30 +881,32 @@ def get_data(name, _dataframes_dict=None, *, copy=True):
             if candidate in paths:
                 resolved = paths[candidate]
                 if resolved.is_dir():
-                    cache_key = resolved.name + ".csv"
-                    if cache_key not in _CACHED_DATAFRAMES:
-                        _CACHED_DATAFRAMES[cache_key] = _load_shard_directory(resolved)
+                    cached = _cached_dataset(
+                        resolved.name + ".csv",
+                        lambda: _load_shard_directory(resolved),
+                    )
                 else:
                     cache_key = resolved.name.removesuffix(".gz")
-                    if cache_key not in _CACHED_DATAFRAMES:
-                        loaded = _normalize_dataset_dtypes(
+                    cached = _cached_dataset(
+                        cache_key,
+                        lambda: _normalize_dataset_dtypes(
                             cache_key,
-                            pd.read_csv(
-                                str(resolved), low_memory=False,
-                            ),
-                        )
-                        _CACHED_DATAFRAMES[cache_key] = loaded
+                            pd.read_csv(str(resolved), low_memory=False),
+                        ),
+                    )
                 # Return a copy so callers that mutate in place (e.g. df["c"]=...,
                 # df.fillna(0, inplace=True)) can't corrupt the shared cache.
-                # copy=False skips this for read-only callers (#278).
-                cached = _CACHED_DATAFRAMES[cache_key]
-                return cached.copy() if copy else cached
+                # copy=False skips this for internal read-only callers (#278);
+                # readonly=True serves a protected zero-copy view.
+                return _serve_cached(cached, copy=copy, readonly=readonly)
         raise ValueError(f"Dataset {name} not found")
 
     for candidate in candidates:
         if candidate in _dataframes_dict:
             # Return a copy so callers that mutate in place (e.g. df["c"]=...,
             # df.fillna(0, inplace=True)) can't corrupt the shared cache.
-            df = _dataframes_dict[candidate].copy() if copy else _dataframes_dict[candidate]
+            df = _serve_cached(
+                _dataframes_dict[candidate], copy=copy, readonly=readonly,
+            )
             return _normalize_dataset_dtypes(candidate, df)
     raise ValueError(f"Dataset {name} not found")
@@ -0,0 +1,356 @@
+"""Synthetic expression inputs for scale and stress testing.
+
+Real per-sample matrices come from oncoref's fetch cache, so offline tests and
+benchmarks need stand-ins with the same shape and the same statistical
+features the transforms key on:
+
+- :func:`synthetic_gene_table` — rows drawn from the bundled canonical ENSG
+  universe (``gene-canonical-reference``), always including the housekeeping
+  panel and every mass-bearing gene of the two clean-TPM censored compartments
+  (ribosomal protein, other technical RNA).
+- :func:`synthetic_tpm_matrix` — a gene × sample TPM matrix in oncoref's
+  per-sample layout (``Ensembl_Gene_ID``, ``Symbol``, one column per sample,
+  every column summing to 10⁶). Censored genes follow oncoref's Treehouse
+  PolyA reference composition, scaled per sample so the technical share varies
+  the way :func:`~pirlygenes.expression.clean_tpm_matrix` is meant to remove;
+  biological genes are log-normal with per-gene dropout.
+- :func:`write_synthetic_per_sample` — the same matrix streamed to a parquet
+  file one gene block at a time, so 60k × 20k workloads never need the whole
+  matrix in memory.
+- :func:`synthetic_transcript_quant` — a salmon-style ``quant.sf`` table plus
+  its transcript → gene map for
+  :func:`~pirlygenes.expression.aggregate_gene_expression`.
+- :func:`synthetic_cohorts` — ragged ``{cohort: gene-indexed matrix}`` sets
+  (different gene panels, sample counts and dropouts) for
+  :meth:`~pirlygenes.expression.stats.PooledCohorts.from_cohorts`.
+
+Everything is deterministic in ``seed``. Values are generated per fixed block
+of genes, so a matrix and its streamed parquet twin are identical regardless
+of how they are consumed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .cohorts import ID_COLS
+
+
+_BLOCK_GENES = 2048
+_TPM_TOTAL = 1e6
+# Mean share of each clean-TPM compartment in a synthetic sample (ribosomal
+# protein, other technical, biological) and the per-sample log-normal spread
+# of the two technical shares around it.
+_COMPARTMENT_SHARES = (0.12, 0.14, 0.74)
+_TECHNICAL_SHARE_SIGMA = 0.45
+_BIOLOGICAL_SIGMA = 2.2
+_SAMPLE_NOISE_SIGMA = 0.6
+# Censored genes below this reference TPM carry almost none of the
+# compartment's mass and are only included by the random fill.
+_MIN_REQUIRED_REFERENCE_TPM = 1.0
+
+
+def _rng(seed: int, *stream: int) -> np.random.Generator:
+    return np.random.default_rng([seed, *stream])
+
+
+def synthetic_gene_table(
+    n_genes: Optional[int] = None,
+    *,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """``n_genes`` canonical genes (all of them when ``None``), sorted by ID.
+
+    Columns: ``Ensembl_Gene_ID``, ``Symbol``, ``biotype``, ``compartment``
+    (``"ribosomal_protein"`` / ``"other_technical"`` / ``"biological"``, the
+    clean-TPM split) and ``reference_tpm`` (oncoref's censored reference
+    composition; 0 for biological genes). The housekeeping panel and every
+    censored gene with reference TPM >= 1 are always included, so ``n_genes``
+    must be at least that many; the remainder is a seeded random draw.
+    """
+    from oncoref.gene_families import clean_tpm_censored_reference_tpm
+
+    from .expression.normalize import (
+        _CLEAN_TPM_COMPARTMENTS,
+        _clean_tpm_compartments,
+        _housekeeping_panel_ensembl_ids,
+    )
+    from .gene_canonicalization import _canonical_reference_frame
+
+    canon = _canonical_reference_frame()
+    ids = canon["ensembl_gene_id"].astype(str)
+    table = pd.DataFrame({
+        "Ensembl_Gene_ID": ids.to_numpy(),
+        # Unnamed loci carry their ID as the symbol, as in the real matrices.
+        "Symbol": canon["symbol"].fillna(ids).astype(str).to_numpy(),
+        "biotype": canon["biotype"].astype(str).to_numpy(),
+    }).drop_duplicates("Ensembl_Gene_ID", ignore_index=True)
+    if n_genes is not None and n_genes < len(table):
+        reference = clean_tpm_censored_reference_tpm()
+        ids = table["Ensembl_Gene_ID"]
+        required = (
+            ids.isin(_housekeeping_panel_ensembl_ids())
+            | ids.map(reference).fillna(0.0).ge(_MIN_REQUIRED_REFERENCE_TPM)
+        ).to_numpy()
+        if n_genes < required.sum():
+            raise ValueError(
+                f"n_genes must be at least {int(required.sum())} (the "
+                "housekeeping panel plus the mass-bearing censored genes)"
+            )
+        optional = np.flatnonzero(~required)
+        fill = _rng(seed, 0).choice(
+            optional, size=n_genes - int(required.sum()), replace=False,
+        )
+        keep = np.sort(np.concatenate([np.flatnonzero(required), fill]))
+        table = table.iloc[keep]
+    elif n_genes is not None and n_genes > len(table):
+        raise ValueError(
+            f"n_genes must be at most {len(table)} (the canonical universe)"
+        )
+    table = table.sort_values("Ensembl_Gene_ID", ignore_index=True)
+    compartment, reference = _clean_tpm_compartments(table)
+    table["compartment"] = np.asarray(_CLEAN_TPM_COMPARTMENTS)[compartment]
+    table["reference_tpm"] = np.where(compartment < 2, reference, 0.0)
+    return table
+
+
+def _gene_profile(genes: pd.DataFrame, seed: int):
+    """Per-gene mean abundance (each compartment summing to its mean share of
+    10⁶), dropout probability and compartment code."""
+    rng = _rng(seed, 1)
+    compartment = (
+        genes["compartment"].map({"ribosomal_protein": 0, "other_technical": 1})
+        .fillna(2).to_numpy(dtype=np.int8)
+    )
+    coding = genes["biotype"].eq("protein_coding").to_numpy()
+    base = np.where(
+        coding,
+        rng.lognormal(1.0, _BIOLOGICAL_SIGMA, len(genes)),
+        rng.lognormal(-1.5, _BIOLOGICAL_SIGMA, len(genes)),
+    )
+    technical = compartment < 2
+    base[technical] = genes["reference_tpm"].to_numpy()[technical]
+    for code, share in enumerate(_COMPARTMENT_SHARES):
+        members = compartment == code
+        total = base[members].sum()
+        if total > 0:
+            base[members] *= share * _TPM_TOTAL / total
+    # Lowly expressed genes drop out more often, as in real bulk RNA-seq.
+    dropout = np.clip(0.6 / (1.0 + base), 0.0, 0.6)
+    return base, dropout, compartment
+
+
+def _sample_factors(n_samples: int, seed: int) -> np.ndarray:
+    """``(3, n_samples)`` per-sample compartment multipliers."""
+    factors = np.ones((3, n_samples))
+    factors[:2] = _rng(seed, 2).lognormal(
+        -_TECHNICAL_SHARE_SIGMA ** 2 / 2, _TECHNICAL_SHARE_SIGMA, (2, n_samples),
+    )
+    return factors
+
+
+def _raw_blocks(genes: pd.DataFrame, n_samples: int, seed: int, dtype):
+    """Yield ``(row_slice, unscaled_values)`` per fixed block of genes."""
+    base, dropout, compartment = _gene_profile(genes, seed)
+    factors = _sample_factors(n_samples, seed)
+    for block, start in enumerate(range(0, len(genes), _BLOCK_GENES)):
+        rows = slice(start, min(start + _BLOCK_GENES, len(genes)))
+        rng = _rng(seed, 3, block)
+        n = rows.stop - rows.start
+        values = rng.lognormal(
+            -_SAMPLE_NOISE_SIGMA ** 2 / 2, _SAMPLE_NOISE_SIGMA, (n, n_samples),
+        )
+        values *= base[rows, None]
+        values *= factors[compartment[rows]]
+        values[rng.random((n, n_samples)) < dropout[rows, None]] = 0.0
+        yield rows, values.astype(dtype, copy=False)
+
+
+def _column_scale(totals: np.ndarray) -> np.ndarray:
+    return _TPM_TOTAL / np.where(totals > 0, totals, 1.0)
+
+
+def _sample_names(n_samples: int, prefix: str) -> list[str]:
+    width = max(6, len(str(n_samples)))
+    return [f"{prefix}{i:0{width}d}" for i in range(1, n_samples + 1)]
+
+
+def _resolve_genes(n_genes, seed) -> pd.DataFrame:
+    if isinstance(n_genes, pd.DataFrame):
+        return n_genes
+    return synthetic_gene_table(n_genes, seed=seed)
+
+
+def synthetic_tpm_matrix(
+    n_genes: Union[int, pd.DataFrame, None] = 20_000,
+    n_samples: int = 100,
+    *,
+    seed: int = 0,
+    dtype=None,
+    sample_prefix: str = "S",
+) -> pd.DataFrame:
+    """A gene × sample TPM matrix in the per-sample layout of
+    :func:`pirlygenes.cohorts.read_per_sample`.
+
+    ``n_genes`` is a gene count (see :func:`synthetic_gene_table`) or a gene
+    table it returned. Sample columns are ``S000001``… (``sample_prefix``)
+    and each sums to 10⁶. ``dtype`` follows
+    :func:`pirlygenes.load_dataset.set_float_dtype_default` when ``None``.
+    """
+    from .load_dataset import _resolve_float_dtype
+
+    dtype = _resolve_float_dtype(dtype)
+    genes = _resolve_genes(n_genes, seed)
+    values = np.empty((len(genes), n_samples), dtype=dtype)
+    totals = np.zeros(n_samples)
+    for rows, block in _raw_blocks(genes, n_samples, seed, dtype):
+        values[rows] = block
+        totals += block.sum(axis=0, dtype=np.float64)
+    values *= _column_scale(totals).astype(dtype)
+    out = pd.DataFrame(values, columns=_sample_names(n_samples, sample_prefix))
+    out.insert(0, ID_COLS[1], genes["Symbol"].to_numpy())
+    out.insert(0, ID_COLS[0], genes["Ensembl_Gene_ID"].to_numpy())
+    return out
+
+
+def write_synthetic_per_sample(
+    path: Union[str, Path],
+    n_genes: Union[int, pd.DataFrame, None] = 20_000,
+    n_samples: int = 100,
+    *,
+    seed: int = 0,
+    dtype="float32",
+    sample_prefix: str = "S",
+) -> Path:
+    """Stream :func:`synthetic_tpm_matrix` to a parquet file.
+
+    Generates and writes one block of genes per row group (two passes: the
+    first only accumulates per-sample totals), so peak memory is one block of
+    rows × ``n_samples`` rather than the whole matrix. Reads back equal to
+    ``synthetic_tpm_matrix`` with the same arguments.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from .load_dataset import _resolve_float_dtype
+
+    dtype = _resolve_float_dtype(dtype)
+    path = Path(path)
+    genes = _resolve_genes(n_genes, seed)
+    totals = np.zeros(n_samples)
+    for _rows, block in _raw_blocks(genes, n_samples, seed, dtype):
+        totals += block.sum(axis=0, dtype=np.float64)
+    scale = _column_scale(totals).astype(dtype)
+    names = _sample_names(n_samples, sample_prefix)
+    arrow_type = pa.from_numpy_dtype(dtype)
+    schema = pa.schema(
+        [(col, pa.string()) for col in ID_COLS]
+        + [(name, arrow_type) for name in names]
+    )
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows, block in _raw_blocks(genes, n_samples, seed, dtype):
+            block *= scale
+            arrays = [
+                pa.array(genes["Ensembl_Gene_ID"].to_numpy()[rows], pa.string()),
+                pa.array(genes["Symbol"].to_numpy()[rows], pa.string()),
+            ] + [pa.array(block[:, j]) for j in range(n_samples)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+    return path
+
+
+def synthetic_transcript_quant(
+    n_genes: Union[int, pd.DataFrame, None] = 2_000,
+    *,
+    transcripts_per_gene: tuple[int, int] = (1, 6),
+    seed: int = 0,
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """A salmon ``quant.sf``-style table and its transcript → gene-symbol map.
+
+    Returns ``(quant, tx_to_gene_name)``: ``quant`` has ``Name`` (versioned
+    synthetic ``ENSTS…`` IDs), ``Length``, ``EffectiveLength``, ``TPM``
+    (summing to 10⁶) and ``NumReads``; pass the map as
+    ``aggregate_gene_expression(quant, tx_to_gene_name=...)``. Each gene gets
+    between ``transcripts_per_gene`` transcripts (inclusive) sharing its
+    synthetic abundance.
+    """
+    genes = _resolve_genes(n_genes, seed)
+    base, dropout, _compartment = _gene_profile(genes, seed)
+    rng = _rng(seed, 4)
+    low, high = transcripts_per_gene
+    counts = rng.integers(low, high + 1, len(genes))
+    gene_of = np.repeat(np.arange(len(genes)), counts)
+    tx_ids = [f"ENSTS{i:011d}" for i in range(len(gene_of))]
+    # Dirichlet(1, ..., 1) isoform shares within each gene.
+    draws = rng.gamma(1.0, 1.0, len(gene_of))
+    share = draws / np.bincount(gene_of, weights=draws)[gene_of]
+    tpm = base[gene_of] * share * rng.lognormal(
+        -_SAMPLE_NOISE_SIGMA ** 2 / 2, _SAMPLE_NOISE_SIGMA, len(gene_of),
+    )
+    tpm[rng.random(len(gene_of)) < dropout[gene_of]] = 0.0
+    tpm *= _TPM_TOTAL / tpm.sum()
+    length = rng.integers(300, 8000, len(gene_of))
+    effective = np.maximum(length - 180.0, 50.0)
+    versions = rng.integers(1, 9, len(tx_ids))
+    quant = pd.DataFrame({
+        "Name": [f"{tx}.{v}" for tx, v in zip(tx_ids, versions)],
+        "Length": length,
+        "EffectiveLength": effective,
+        "TPM": tpm,
+        "NumReads": np.round(tpm * effective / 1e3, 3),
+    })
+    symbols = genes["Symbol"].to_numpy()
+    return quant, dict(zip(tx_ids, symbols[gene_of]))
+
+
+def synthetic_cohorts(
+    n_cohorts: int = 4,
+    *,
+    n_genes: Union[int, pd.DataFrame, None] = 20_000,
+    samples_per_cohort: tuple[int, int] = (20, 200),
+    gene_coverage: tuple[float, float] = (0.6, 1.0),
+    dropout: float = 0.01,
+    seed: int = 0,
+    dtype=None,
+) -> dict[str, pd.DataFrame]:
+    """Ragged ``{cohort: matrix}`` inputs for ``PooledCohorts.from_cohorts``.
+
+    Each matrix is indexed by ``Ensembl_Gene_ID`` and holds one cohort's gene
+    panel — a random ``gene_coverage`` fraction of the universe that always
+    keeps the housekeeping and censored genes — by its own sample count drawn
+    from ``samples_per_cohort``. Sample columns are prefixed with the cohort
+    name (``SYN01:S000001``) so they are unique across the set, and a
+    ``dropout`` fraction of measured cells is ``NaN`` (measured-but-missing).
+    """
+    from .expression.normalize import _housekeeping_panel_ensembl_ids
+
+    genes = _resolve_genes(n_genes, seed)
+    rng = _rng(seed, 5)
+    anchored = (
+        genes["compartment"].ne("biological")
+        | genes["Ensembl_Gene_ID"].isin(_housekeeping_panel_ensembl_ids())
+    ).to_numpy()
+    cohorts = {}
+    for i in range(n_cohorts):
+        name = f"SYN{i + 1:02d}"
+        coverage = rng.uniform(*gene_coverage)
+        panel = anchored | (rng.random(len(genes)) < coverage)
+        n_samples = int(rng.integers(
+            samples_per_cohort[0], samples_per_cohort[1] + 1,
+        ))
+        matrix = synthetic_tpm_matrix(
+            genes[panel].reset_index(drop=True),
+            n_samples,
+            seed=seed + 1 + i,
+            dtype=dtype,
+            sample_prefix=f"{name}:S",
+        ).drop(columns=ID_COLS[1]).set_index(ID_COLS[0])
+        if dropout:
+            values = matrix.to_numpy(copy=True)
+            values[rng.random(values.shape) < dropout] = np.nan
+            matrix = pd.DataFrame(values, index=matrix.index, columns=matrix.columns)
+        cohorts[name] = matrix
+    return cohorts
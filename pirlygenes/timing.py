@@ -0,0 +1,206 @@
+"""Opt-in timing spans for the accessor hot paths.
+
+:func:`cancer_reference_expression` and :func:`pan_cancer_expression` wrap
+their stages (delegated load, canonicalization, normalization per mode,
+schema projection, proteoform collapse, wide pivot, defensive copy) in named
+:func:`span` blocks.
+With no sink installed a span is a shared no-op context manager, so the
+instrumentation costs one global read per stage.
+
+Enable it for a block::
+
+    from pirlygenes.timing import timing
+
+    with timing() as records:          # collect into a list
+        pan_cancer_expression(normalize=["tpm_clean", "hk"])
+    with timing("spans.jsonl"):        # append JSON lines to a file
+        ...
+    with timing(my_callback):          # or call any function per record
+        ...
+
+or process-wide by setting ``PIRLYGENES_TIMING`` to a JSON-lines path before
+import (``add_sink`` / ``remove_sink`` do the same at runtime). A
+:func:`timing` block sees only its own thread's spans; process-wide sinks see
+every thread's.
+
+Each record is a dict: ``name``, ``parent`` (the enclosing span, or ``None``),
+``wall_s``, ``start`` (epoch seconds), ``thread``, any keyword fields given to
+the span (``mode="hk"``, …) and ``alloc_bytes`` — the net change in
+Python/NumPy memory traced by :mod:`tracemalloc` across the span, or ``None``
+when tracemalloc is not tracing. ``timing(trace_memory=True)`` (or
+``PIRLYGENES_TIMING_MEMORY=1``) starts tracemalloc for you; it slows the
+traced code down, so only the timing itself is on by default.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+
+_TIMING_ENV_VAR = "PIRLYGENES_TIMING"
+_TIMING_MEMORY_ENV_VAR = "PIRLYGENES_TIMING_MEMORY"
+
+_SINKS: list[Callable[[dict], None]] = []
+_SINKS_LOCK = threading.Lock()
+_STACK = threading.local()
+
+
+class JSONLinesSink:
+    """Append each span record as one JSON line to ``path``."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict) -> None:
+        line = json.dumps(record, default=str)
+        with self._lock, self.path.open("a") as handle:
+            handle.write(line + "\n")
+
+    def __repr__(self):
+        return f"JSONLinesSink({str(self.path)!r})"
+
+
+def _as_sink(sink) -> Callable[[dict], None]:
+    if isinstance(sink, (str, Path)):
+        return JSONLinesSink(sink)
+    if not callable(sink):
+        raise TypeError("sink must be a callable or a JSON-lines file path")
+    return sink
+
+
+def add_sink(sink) -> Callable[[dict], None]:
+    """Install a sink (callable or JSON-lines path) for every span; returns
+    the installed callable for :func:`remove_sink`."""
+    sink = _as_sink(sink)
+    with _SINKS_LOCK:
+        _SINKS.append(sink)
+    return sink
+
+
+def remove_sink(sink) -> None:
+    with _SINKS_LOCK:
+        if sink in _SINKS:
+            _SINKS.remove(sink)
+
+
+def enabled() -> bool:
+    return bool(_SINKS)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "fields", "_start", "_wall", "_alloc", "_parent")
+
+    def __init__(self, name: str, fields: dict):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        stack = _STACK.__dict__.setdefault("spans", [])
+        self._parent = stack[-1] if stack else None
+        stack.append(self.name)
+        self._alloc = (
+            tracemalloc.get_traced_memory()[0]
+            if tracemalloc.is_tracing() else None
+        )
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        alloc = (
+            tracemalloc.get_traced_memory()[0] - self._alloc
+            if self._alloc is not None and tracemalloc.is_tracing() else None
+        )
+        _STACK.spans.pop()
+        record = {
+            "name": self.name,
+            "parent": self._parent,
+            "wall_s": elapsed,
+            "start": self._wall,
+            "thread": threading.current_thread().name,
+            "alloc_bytes": alloc,
+            **self.fields,
+        }
+        for sink in list(_SINKS):
+            try:
+                sink(record)
+            except Exception:
+                pass  # instrumentation is best-effort; never fail the accessor
+        return False
+
+
+def span(name: str, **fields):
+    """Context manager timing one named stage; a no-op unless a sink is
+    installed. Extra keyword ``fields`` are copied into the record."""
+    if not _SINKS:
+        return _NULL_SPAN
+    return _Span(name, fields)
+
+
+@contextmanager
+def timing(
+    sink: Optional[Union[str, Path, Callable[[dict], None]]] = None,
+    *,
+    trace_memory: bool = False,
+    all_threads: bool = False,
+):
+    """Record spans inside the ``with`` block.
+
+    ``sink`` is a callable receiving each record dict or a JSON-lines path;
+    by default the records are collected into the list bound by ``as``.
+    Only spans closed on the thread that entered the block are recorded, so
+    concurrent accessor calls on other threads do not leak in;
+    ``all_threads=True`` records every thread's spans. ``trace_memory=True``
+    runs :mod:`tracemalloc` for the block so records carry ``alloc_bytes``.
+    """
+    records: list[dict] = []
+    target = records.append if sink is None else _as_sink(sink)
+    if not all_threads:
+        owner = threading.get_ident()
+        unfiltered = target
+
+        def target(record: dict) -> None:
+            # Sinks run in the thread that closes the span.
+            if threading.get_ident() == owner:
+                unfiltered(record)
+
+    installed = add_sink(target)
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield records
+    finally:
+        if started:
+            tracemalloc.stop()
+        remove_sink(installed)
+
+
+if os.environ.get(_TIMING_ENV_VAR, "").strip():
+    add_sink(os.environ[_TIMING_ENV_VAR].strip())
+    if (os.environ.get(_TIMING_MEMORY_ENV_VAR, "").strip().lower()
+            in {"1", "true", "yes", "on"}
+            and not tracemalloc.is_tracing()):
+        tracemalloc.start()
@@ -46,11 +46,13 @@ def build() -> None:
     tpm, clean_tpm, provenance = (
         accessors._rebuild_full_canonical_views()  # noqa: SLF001
     )
-    tpm.to_parquet(OUT_DIR / "tpm.parquet", index=False, compression="zstd")
-    clean_tpm.to_parquet(
-        OUT_DIR / "clean_tpm.parquet",
-        index=False,
-        compression="zstd",
+    # Value matrices are ENSG-sorted in bounded row groups so filtered reads
+    # can push cohort projection and gene predicates down to parquet.
+    accessors._write_cohort_view_parquet(  # noqa: SLF001
+        tpm, OUT_DIR / "tpm.parquet",
+    )
+    accessors._write_cohort_view_parquet(  # noqa: SLF001
+        clean_tpm, OUT_DIR / "clean_tpm.parquet",
     )
     provenance.to_parquet(
         OUT_DIR / "provenance.parquet",
@@ -62,7 +64,11 @@ def build() -> None:
         "artifact": "cancer-reference-expression-views",
         "data_version": DATA_VERSION,
         "canonical_gene_ids": True,
-        "format": 1,
+        "format": 2,
+        "layout": {
+            "row_group_size": accessors._COHORT_VIEW_ROW_GROUP_SIZE,  # noqa: SLF001
+            "sorted_by": "Ensembl_Gene_ID",
+        },
         "source_data_version": oncoref_data_bundle.DATA_VERSION,
         "source_package": "oncoref",
         "source_package_version": oncoref.__version__,
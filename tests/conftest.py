@@ -25,6 +25,8 @@ import shutil
 import subprocess
 from pathlib import Path
 
+import pytest
+
 _DEFAULT_RELEASE = 111
 
 
@@ -65,3 +67,13 @@ def pytest_configure(config):
         )
     except Exception:
         pass  # non-fatal; release-dependent tests skip if 111 stays unavailable
+
+
+@pytest.fixture(autouse=True)
+def _fresh_reference_result_cache():
+    """Results memoized by an earlier test must not mask this test's
+    monkeypatched oncoref delegates."""
+    from pirlygenes.expression import cancer_reference_expression
+
+    cancer_reference_expression.cache_clear()
+    yield
@@ -0,0 +1,134 @@
+"""normalize_quant_directory: parallel quant.sf intake into one parquet."""
+
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pirlygenes import NormalizationPlan, normalize_quant_directory, synthetic
+from pirlygenes.cohorts import ID_COLS
+from pirlygenes.expression import aggregate_gene_expression, discover_quant_files
+from pirlygenes.expression import aggregate
+
+
+@pytest.fixture(scope="module")
+def quant_dir(tmp_path_factory):
+    root = tmp_path_factory.mktemp("quants")
+    tx_to_gene = {}
+    quants = {}
+    for i, sample in enumerate(["S1", "S2", "S3"]):
+        quant, mapping = synthetic.synthetic_transcript_quant(500, seed=i)
+        tx_to_gene.update(mapping)
+        quants[sample] = quant
+    # Two samples as salmon output directories, one as a flat .sf file.
+    for sample in ("S1", "S2"):
+        (root / sample).mkdir()
+        quants[sample].to_csv(root / sample / "quant.sf", sep="\t", index=False)
+    quants["S3"].to_csv(root / "S3.sf", sep="\t", index=False)
+    (root / "notes.txt").write_text("not a sample\n")
+    return root, quants, tx_to_gene
+
+
+def test_discover_quant_files_reads_directories_and_flat_files(quant_dir):
+    root, _, _ = quant_dir
+    found = discover_quant_files(root)
+    assert list(found) == ["S1", "S2", "S3"]
+    assert found["S1"] == root / "S1" / "quant.sf"
+    assert found["S3"] == root / "S3.sf"
+    with pytest.raises(FileNotFoundError):
+        discover_quant_files(root / "missing")
+
+
+def test_normalize_quant_directory_matches_per_sample_aggregation(
+    quant_dir, tmp_path,
+):
+    root, quants, tx_to_gene = quant_dir
+    modes = ["tpm_clean", "hk", "percentile"]
+    serial = pd.read_parquet(normalize_quant_directory(
+        root, tmp_path / "serial.parquet", modes=modes, jobs=1,
+        tx_to_gene_name=tx_to_gene, dtype="float64",
+    ))
+    pooled = pd.read_parquet(normalize_quant_directory(
+        root, tmp_path / "pooled.parquet", modes=modes, jobs=2,
+        tx_to_gene_name=tx_to_gene, dtype="float64",
+    ))
+    pd.testing.assert_frame_equal(serial, pooled)
+    assert list(serial.columns[:2]) == list(ID_COLS)
+    for suffix in ("_TPM_clean", "_TPM_hk", "_TPM_percentile"):
+        assert [f"S{i}{suffix}" in serial.columns for i in (1, 2, 3)] == [True] * 3
+
+    genes = serial[list(ID_COLS)]
+    per_sample = {}
+    for sample, quant in quants.items():
+        agg = aggregate_gene_expression(quant, tx_to_gene_name=tx_to_gene)
+        per_sample[sample] = genes["Symbol"].map(
+            agg.set_index("gene")["TPM"],
+        ).to_numpy()
+    expected = NormalizationPlan.compile(genes, modes=["tpm_clean"]).apply(
+        np.column_stack(list(per_sample.values())),
+    )["tpm_clean"]
+    np.testing.assert_allclose(
+        serial[["S1_TPM_clean", "S2_TPM_clean", "S3_TPM_clean"]].to_numpy(),
+        expected,
+    )
+
+
+def test_gene_ids_are_looked_up_once_in_the_parent(
+    quant_dir, tmp_path, monkeypatch,
+):
+    root, _, tx_to_gene = quant_dir
+    parent = os.getpid()
+    lookups = Counter()
+
+    def lookup(name):
+        if os.getpid() != parent:
+            raise AssertionError("gene ID lookup ran in a pool worker")
+        lookups[name] += 1
+        return None
+
+    monkeypatch.setattr(aggregate, "find_gene_and_ensembl_release_by_name", lookup)
+    aggregate._lookup_gene_meta.cache_clear()
+    try:
+        out = pd.read_parquet(normalize_quant_directory(
+            root, tmp_path / "ids.parquet", modes=["tpm"], jobs=2,
+            tx_to_gene_name=tx_to_gene, dtype="float64",
+        ))
+    finally:
+        aggregate._lookup_gene_meta.cache_clear()
+    assert sorted(lookups) == sorted(out["Symbol"])
+    assert set(lookups.values()) == {1}
+    assert (out["Ensembl_Gene_ID"] == "").all()
+
+
+def test_pooled_run_closes_connections_without_database_close(
+    quant_dir, tmp_path, monkeypatch,
+):
+    # pyensembl < 2.27 has no Database.close(): only the connection is
+    # touched, and the pool still starts.
+    import sqlite3
+    from types import SimpleNamespace
+
+    import pirlygenes.gene_ids as gi
+
+    root, _, tx_to_gene = quant_dir
+    connection = sqlite3.connect(":memory:")
+    db = SimpleNamespace(_connection=connection)
+    monkeypatch.setattr(gi, "genomes", [SimpleNamespace(_db=db)] + gi.genomes)
+    out = pd.read_parquet(normalize_quant_directory(
+        root, tmp_path / "old.parquet", modes=["tpm"], jobs=2,
+        tx_to_gene_name=tx_to_gene, dtype="float64",
+    ))
+    assert db._connection is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("select 1")
+    assert [f"S{i}_TPM" in out.columns for i in (1, 2, 3)] == [True] * 3
+
+
+def test_normalize_quant_directory_rejects_bad_input(quant_dir, tmp_path):
+    root, _, _ = quant_dir
+    with pytest.raises(ValueError, match="modes"):
+        normalize_quant_directory(root, tmp_path / "x.parquet", modes=["zscore"])
+    with pytest.raises(ValueError, match="no quant.sf"):
+        normalize_quant_directory(tmp_path, tmp_path / "x.parquet")
@@ -0,0 +1,92 @@
+"""Cache registry: cached() memoization, cache_info() and clear_caches()."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pirlygenes
+from pirlygenes import caches
+from pirlygenes import load_dataset as ld
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(caches, "_REGISTRY", {})
+    return caches._REGISTRY
+
+
+def test_cached_builds_each_key_once_under_concurrent_first_calls(registry):
+    builds = []
+    barrier = threading.Barrier(8)
+
+    @caches.cached(maxsize=None)
+    def loader(kind):
+        builds.append(kind)
+        time.sleep(0.05)
+        return object()
+
+    def call(kind):
+        barrier.wait()
+        return loader(kind)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(call, ["a"] * 4 + ["b"] * 4))
+    assert sorted(builds) == ["a", "b"]
+    assert len({id(r) for r in results}) == 2
+    assert loader.cache_info() == (6, 2, None, 2)
+    loader.cache_clear()
+    assert loader.cache_info() == (0, 0, None, 0)
+
+
+def test_cached_bounded_evicts_least_recently_used(registry):
+    @caches.cached(maxsize=2)
+    def square(x):
+        return x * x
+
+    square(1), square(2), square(1), square(3)
+    assert square.cache_info().currsize == 2
+    square(1)  # still cached: 2 was the least recently used
+    assert square.cache_info().hits == 2
+    with pytest.raises(TypeError):
+        square([1])
+
+
+def test_cache_info_reports_every_registered_kind(registry):
+    @caches.cached(maxsize=1)
+    def frame():
+        return pd.DataFrame({"x": np.zeros(100)})
+
+    memo = {"k": np.zeros(50)}
+    frames = ld._FrameLRUCache(1 << 20)
+    caches.register_cache("test.memo", memo)
+    caches.register_cache("test.frames", lambda: frames)
+    frame()
+    frames["a"] = pd.DataFrame({"x": np.zeros(10)})
+
+    info = pirlygenes.cache_info("test*").set_index("name")
+    row = info.loc[
+        "test_caches.test_cache_info_reports_every_registered_kind.<locals>.frame"
+    ]
+    assert (row["kind"], row["misses"], row["entries"]) == ("cached", 1, 1)
+    assert row["nbytes"] >= 800
+    assert info.loc["test.memo", "kind"] == "dict"
+    assert info.loc["test.memo", "nbytes"] >= 400
+    assert pd.isna(info.loc["test.memo", "hits"])
+    assert info.loc["test.frames", "entries"] == 1
+
+    assert pirlygenes.clear_caches("test.*") == ["test.frames", "test.memo"]
+    assert memo == {} and len(frames) == 0
+    assert frame.cache_info().currsize == 1
+    pirlygenes.clear_caches()
+    assert frame.cache_info().currsize == 0
+
+
+def test_package_loaders_are_registered():
+    names = set(pirlygenes.cache_info()["name"])
+    assert "load_dataset._CACHED_DATAFRAMES" in names
+    assert "gene_canonicalization._combined_canonical_map" in names
+    assert "expression.accessors._pan_source_reference_frame" in names
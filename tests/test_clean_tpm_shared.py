@@ -283,6 +283,38 @@ def test_runtime_long_table_per_group_budget():
         assert abs(bio - 750_000.0) < 1.0, (code, bio)
 
 
+def test_runtime_long_table_matches_per_group_clean_tpm_matrix():
+    """The single-pass grouped transform equals clean_tpm_matrix run on each
+    group separately, with interleaved rows, NaN group keys and missing values."""
+    gene_table, values = _fixture()
+    rng = np.random.default_rng(0)
+    groups = [("AAA", ""), ("AAA", "x"), ("BBB", None), ("CCC", "")]
+    frames = []
+    for k, (code, subtype) in enumerate(groups):
+        frames.append(pd.DataFrame({
+            "symbol": gene_table["Symbol"],
+            "Ensembl_Gene_ID": gene_table["Ensembl_Gene_ID"],
+            "cancer_code": code,
+            "subtype": subtype,
+            "tumor_tpm_median": values["S1"].to_numpy() * rng.uniform(0.5, 2, 6),
+            "normal_tpm_median": values["S2"].to_numpy() * (k + 1),
+        }))
+    long = pd.concat(frames, ignore_index=True)
+    long.loc[[1, 10], "normal_tpm_median"] = np.nan
+    long = long.sample(frac=1.0, random_state=3).reset_index(drop=True)
+    value_cols = ["tumor_tpm_median", "normal_tpm_median"]
+
+    out, _ = normalize_technical_rna_long_table(
+        long.copy(), value_cols=tuple(value_cols), censored_fill="fixed_fraction")
+
+    for _, g in long.groupby(["cancer_code", "subtype"], dropna=False):
+        gt = g[["symbol", "Ensembl_Gene_ID"]].rename(columns={"symbol": "Symbol"})
+        expected = clean_tpm_matrix(g[value_cols], gene_table=gt)
+        np.testing.assert_allclose(
+            out.loc[g.index, value_cols].to_numpy(), expected.to_numpy(),
+            rtol=1e-12)
+
+
 def test_clean_tpm_helpers_exported_at_top_level():
     import pirlygenes as pg
     assert pg.clean_tpm_matrix is clean_tpm_matrix
@@ -514,3 +546,60 @@ def test_normalize_defaults_track_public_fraction():
     from pirlygenes.expression.qc import TECHNICAL_FRACTION
     sig = inspect.signature(normalize.normalize_expression)
     assert sig.parameters["technical_fraction"].default == TECHNICAL_FRACTION
+
+
+def test_streamed_per_sample_normalization_matches_in_memory(tmp_path):
+    from pirlygenes import normalize_per_sample_parquet, synthetic
+    from pirlygenes.cohorts import ID_COLS
+
+    source = synthetic.write_synthetic_per_sample(
+        tmp_path / "cohort_per_sample_tpm.parquet", 2500, 9, seed=4,
+        dtype="float64",
+    )
+    written = normalize_per_sample_parquet(
+        source,
+        {
+            "tpm_clean": tmp_path / "clean.parquet",
+            "tpm_clean_log1p": tmp_path / "clean_log1p.parquet",
+            "percentile": tmp_path / "percentile.parquet",
+        },
+        batch_size=4,
+        row_group_size=700,
+        dtype="float64",
+    )
+    matrix = pd.read_parquet(source)
+    values = matrix.drop(columns=list(ID_COLS))
+    clean = clean_tpm_matrix(values, gene_table=matrix[list(ID_COLS)])
+    expected = {
+        "tpm_clean": clean,
+        "tpm_clean_log1p": np.log1p(clean),
+        "percentile": values.rank(pct=True) * 100,
+    }
+    for mode, path in written.items():
+        out = pd.read_parquet(path)
+        assert list(out.columns) == list(matrix.columns)
+        pd.testing.assert_frame_equal(out[list(ID_COLS)], matrix[list(ID_COLS)])
+        np.testing.assert_allclose(
+            out[values.columns].to_numpy(), expected[mode].to_numpy(),
+            rtol=1e-9,
+        )
+    assert not list(tmp_path.glob("tmp*"))
+
+
+def test_streamed_row_groups_are_bounded_by_the_batch(tmp_path):
+    import pyarrow.parquet as pq
+
+    from pirlygenes import normalize_per_sample_parquet, synthetic
+
+    source = synthetic.write_synthetic_per_sample(
+        tmp_path / "cohort_per_sample_tpm.parquet", 2500, 9, seed=4,
+        dtype="float64",
+    )
+    written = normalize_per_sample_parquet(
+        source, {"tpm_clean": tmp_path / "clean.parquet"},
+        batch_size=1, dtype="float64",
+    )
+    metadata = pq.ParquetFile(written["tpm_clean"]).metadata
+    rows = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert max(rows) == 2500 // 9
+    assert sum(rows) == 2500
@@ -3,6 +3,7 @@ tpm / clean_tpm / clean_tpm_biological stages so a consumer can't re-normalize
 inconsistently."""
 
 import json
+from pathlib import Path
 
 import oncoref
 import pytest
@@ -456,8 +457,8 @@ def _write_artifact_from_rebuild(root, monkeypatch, fake):
     _install_fake_reference(monkeypatch, fake)
     tpm, clean, prov = accessors._rebuild_full_canonical_views()
     root.mkdir(parents=True, exist_ok=True)
-    tpm.to_parquet(root / "tpm.parquet", index=False)
-    clean.to_parquet(root / "clean_tpm.parquet", index=False)
+    accessors._write_cohort_view_parquet(tpm, root / "tpm.parquet")
+    accessors._write_cohort_view_parquet(clean, root / "clean_tpm.parquet")
     prov.to_parquet(root / "provenance.parquet", index=False)
     _write_current_manifest(root)
     return tpm, clean, prov
@@ -610,6 +611,266 @@ def test_full_view_keeps_entire_gene_union(tmp_path, monkeypatch):
                   if c not in ("Ensembl_Gene_ID", "Symbol")) == [COHORT_A, COHORT_B]
 
 
+def test_readonly_views_share_the_canonical_matrix(tmp_path, monkeypatch):
+    import numpy as np
+
+    fake = _synthetic_reference()
+    root = tmp_path / "views"
+    _write_artifact_from_rebuild(root, monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    accessors._load_precomputed_cohort_views.cache_clear()
+    tpm_full, _clean_full, _prov = accessors._full_canonical_views()
+
+    view = cohort_expression_views(readonly=True)
+    copied = cohort_expression_views()
+    _assert_views_equal(view, copied)
+    cached = tpm_full[COHORT_A].to_numpy()
+    assert np.shares_memory(view.tpm[COHORT_A].to_numpy(), cached)
+    assert not view.tpm[COHORT_A].to_numpy().flags.writeable
+    assert not np.shares_memory(copied.tpm[COHORT_A].to_numpy(), cached)
+
+    view.tpm.loc[0, COHORT_A] = -1.0
+    assert (accessors._full_canonical_views()[0][COHORT_A].dropna() >= 0).all()
+
+
+def test_filtered_views_push_projection_and_gene_predicate_down(
+    tmp_path, monkeypatch,
+):
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    fake = _synthetic_reference()
+    root = tmp_path / "views"
+    monkeypatch.setattr(accessors, "_COHORT_VIEW_ROW_GROUP_SIZE", 1)
+    _write_artifact_from_rebuild(root, monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    accessors._load_precomputed_cohort_views.cache_clear()
+
+    metadata = pq.ParquetFile(root / "tpm.parquet").metadata
+    assert metadata.num_row_groups == 3
+    assert [
+        metadata.row_group(i).column(0).statistics.min for i in range(3)
+    ] == sorted([TP53, ACTB, MALAT1])
+
+    reads = []
+    real_read_parquet = pd.read_parquet
+
+    def recording_read_parquet(path, *args, **kwargs):
+        reads.append((str(path), kwargs.get("columns"), kwargs.get("filters")))
+        return real_read_parquet(path, *args, **kwargs)
+
+    monkeypatch.setattr(accessors.pd, "read_parquet", recording_read_parquet)
+    monkeypatch.setattr(
+        accessors, "_load_precomputed_cohort_views",
+        lambda *a, **k: (_ for _ in ()).throw(AssertionError("full read")),
+    )
+    pushed = cohort_expression_views(COHORT_A, genes=["tp53"])
+
+    value_reads = [
+        (columns, filters) for path, columns, filters in reads
+        if path.endswith(("/tpm.parquet", "/clean_tpm.parquet"))
+        and filters is not None
+    ]
+    assert value_reads == [
+        (["Ensembl_Gene_ID", "Symbol", COHORT_A],
+         [("Ensembl_Gene_ID", "in", [TP53])]),
+    ] * 2
+
+    monkeypatch.undo()
+    _install_fake_reference(monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    tpm_full, clean_full, prov_full = accessors._full_canonical_views()
+    in_memory = accessors._apply_cohort_view_filters(
+        tpm_full, clean_full, prov_full, COHORT_A, ["tp53"],
+        protein_coding=False, min_cohort_coverage=None,
+    )
+    _assert_views_equal(pushed, in_memory)
+    assert pushed.tpm[COHORT_A].tolist() == [3.0]
+
+
+def test_filtered_views_reuse_resident_frames_and_provenance(
+    tmp_path, monkeypatch,
+):
+    import pandas as pd
+
+    fake = _synthetic_reference()
+    root = tmp_path / "views"
+    _write_artifact_from_rebuild(root, monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    monkeypatch.setattr(
+        accessors, "_refresh_cohort_view_provenance", lambda df: df,
+    )
+    accessors._load_precomputed_cohort_views.cache_clear()
+    accessors._cohort_view_provenance.cache_clear()
+
+    reads = []
+    real_read_parquet = pd.read_parquet
+
+    def recording_read_parquet(path, *args, **kwargs):
+        reads.append(Path(path).name)
+        return real_read_parquet(path, *args, **kwargs)
+
+    monkeypatch.setattr(accessors.pd, "read_parquet", recording_read_parquet)
+    # Cold: pushdown reads the value slices, the provenance sidecar once.
+    first = cohort_expression_views(COHORT_A, genes=["tp53"])
+    cohort_expression_views(COHORT_B, genes=["tp53"])
+    assert reads.count("provenance.parquet") == 1
+
+    # Warm: once the full views are resident, a filtered call slices them.
+    full = accessors._full_canonical_views()
+    reads.clear()
+    warm = cohort_expression_views(COHORT_A, genes=["tp53"])
+    assert reads == []
+    _assert_views_equal(warm, first)
+    assert full[0] is accessors._full_canonical_views()[0]
+
+    # Clearing the loader forgets the resident entry even while the caller
+    # still holds the frames.
+    accessors._load_precomputed_cohort_views.cache_clear()
+    assert accessors._resident_cohort_views(root) is None
+    assert full[0] is not None
+
+
+def test_filtered_views_surface_provenance_errors(tmp_path, monkeypatch):
+    fake = _synthetic_reference()
+    root = tmp_path / "views"
+    _write_artifact_from_rebuild(root, monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    accessors._load_precomputed_cohort_views.cache_clear()
+    accessors._cohort_view_provenance.cache_clear()
+
+    def offline(df):
+        raise RuntimeError("oncoref manifest unavailable")
+
+    monkeypatch.setattr(accessors, "_refresh_cohort_view_provenance", offline)
+    monkeypatch.setattr(
+        accessors, "_rebuild_full_canonical_views",
+        lambda *a, **k: (_ for _ in ()).throw(AssertionError("slow path used")),
+    )
+    with pytest.raises(RuntimeError, match="manifest unavailable"):
+        cohort_expression_views(COHORT_A, genes=["tp53"])
+    accessors._cohort_view_provenance.cache_clear()
+
+
+def test_views_build_each_stage_on_first_access(tmp_path, monkeypatch):
+    import pandas as pd
+
+    from pirlygenes.expression import drop_technical_genes
+
+    fake = _synthetic_reference()
+    root = tmp_path / "views"
+    _write_artifact_from_rebuild(root, monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    accessors._load_precomputed_cohort_views.cache_clear()
+
+    selected = []
+    real_select = accessors._select_cohort_columns
+
+    def recording_select(wide, *args, **kwargs):
+        selected.append(wide)
+        return real_select(wide, *args, **kwargs)
+
+    monkeypatch.setattr(accessors, "_select_cohort_columns", recording_select)
+    views = cohort_expression_views()
+    assert selected == []
+
+    assert views.tpm is views.tpm
+    assert len(selected) == 1
+
+    biological = views.clean_tpm_biological
+    assert len(selected) == 2
+    assert views.clean_tpm is views.clean_tpm
+    assert len(selected) == 2
+    # Only the boolean row mask is cached, not a second frame.
+    assert "clean_tpm_biological" not in views._frames
+    assert views._frames["biological_rows"].dtype == bool
+    pd.testing.assert_frame_equal(views.clean_tpm_biological, biological)
+    pd.testing.assert_frame_equal(
+        biological, drop_technical_genes(views.clean_tpm),
+    )
+
+
+def test_views_stage_build_is_retryable_and_single_flight():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pandas as pd
+
+    from pirlygenes.expression import CohortExpressionViews
+
+    calls = []
+
+    def flaky():
+        calls.append(None)
+        if len(calls) == 1:
+            raise OSError("transient read failure")
+        time.sleep(0.05)
+        return pd.DataFrame({"Ensembl_Gene_ID": ["E1"], "Symbol": ["A"]})
+
+    views = CohortExpressionViews(flaky, flaky, None, pd.DataFrame())
+    with pytest.raises(OSError):
+        views.tpm
+    barrier = threading.Barrier(4)
+
+    def read(_):
+        barrier.wait()
+        return views.tpm
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        frames = list(pool.map(read, range(4)))
+    assert len(calls) == 2
+    assert all(frame is frames[0] for frame in frames)
+
+
+def test_views_arrow_return_type_converts_each_stage(tmp_path, monkeypatch):
+    import pyarrow as pa
+
+    fake = _synthetic_reference()
+    root = tmp_path / "views"
+    _write_artifact_from_rebuild(root, monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    accessors._load_precomputed_cohort_views.cache_clear()
+
+    arrow = cohort_expression_views(genes=["TP53", "MALAT1"], return_type="arrow")
+    frames = cohort_expression_views(genes=["TP53", "MALAT1"])
+    for attr in ("tpm", "clean_tpm", "clean_tpm_biological", "provenance"):
+        table = getattr(arrow, attr)
+        assert isinstance(table, pa.Table)
+        assert table.column_names == list(getattr(frames, attr).columns)
+    assert pa.types.is_dictionary(arrow.provenance.schema.field("source_cohort").type)
+    _assert_views_equal(
+        CohortExpressionViews(
+            arrow.tpm.to_pandas(),
+            arrow.clean_tpm.to_pandas(),
+            arrow.clean_tpm_biological.to_pandas(),
+            arrow.provenance.to_pandas().astype({"source_cohort": object}),
+        ),
+        frames,
+    )
+    assert "CohortExpressionViews(genes=2" in repr(arrow)
+
+
+def test_views_float32_dtype_is_cached_separately(tmp_path, monkeypatch):
+    import numpy as np
+
+    fake = _synthetic_reference()
+    root = tmp_path / "views"
+    _write_artifact_from_rebuild(root, monkeypatch, fake)
+    monkeypatch.setattr(accessors, "_cohort_views_root", lambda: root)
+    accessors._load_precomputed_cohort_views.cache_clear()
+
+    narrow = cohort_expression_views(dtype="float32")
+    wide = cohort_expression_views()
+    for attr in ("tpm", "clean_tpm", "clean_tpm_biological"):
+        assert getattr(narrow, attr)[COHORT_A].dtype == np.float32
+        assert getattr(wide, attr)[COHORT_A].dtype == np.float64
+    _assert_views_equal(narrow, wide)
+    sliced = cohort_expression_views(COHORT_A, genes=["TP53"], dtype="float32")
+    assert sliced.tpm[COHORT_A].dtype == np.float32
+    assert sliced.tpm[COHORT_A].tolist() == [3.0]
+
+
 def test_cohort_only_view_excludes_single_cohort_gene(tmp_path, monkeypatch):
     """MALAT1 lives only in COHORT_A; a COHORT_B-only view must not carry it."""
     v = _fast_views(tmp_path, monkeypatch, cancer_types=COHORT_B)
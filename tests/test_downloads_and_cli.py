@@ -245,6 +245,52 @@ def test_cli_downloads_cache_dir(monkeypatch, tmp_path: Path):
     assert out.strip() == str(source_matrices.cache_dir())
 
 
+def test_cli_data_build_pan_cache(monkeypatch, tmp_path: Path):
+    from pirlygenes import expression
+
+    built = []
+
+    def fake_build():
+        built.append(True)
+        return tmp_path
+
+    monkeypatch.setattr(expression, "build_pan_cancer_expression_cache", fake_build)
+    rc, out, _ = _run_cli(["data", "build-pan-cache"])
+    assert rc == 0
+    assert built == [True]
+    assert str(tmp_path) in out
+
+
+def test_cli_normalize_forwards_modes_and_jobs(monkeypatch, tmp_path: Path):
+    from pirlygenes import expression
+
+    calls = []
+
+    def fake_normalize(input_dir, output, **kwargs):
+        calls.append((input_dir, output, kwargs))
+        return Path(output)
+
+    monkeypatch.setattr(expression, "normalize_quant_directory", fake_normalize)
+    out_path = tmp_path / "cohort.parquet"
+    rc, out, _ = _run_cli([
+        "normalize", "--input-dir", str(tmp_path),
+        "--modes", "tpm_clean, hk,percentile", "--jobs", "4",
+        "--output", str(out_path),
+    ])
+    assert rc == 0
+    assert calls == [(
+        str(tmp_path), str(out_path),
+        {"modes": ["tpm_clean", "hk", "percentile"], "jobs": 4,
+         "quant_file": "quant.sf"},
+    )]
+    assert str(out_path) in out
+
+    monkeypatch.undo()
+    rc, _, err = _run_cli(["normalize", "--input-dir", str(tmp_path / "missing")])
+    assert rc == 2
+    assert "input directory not found" in err
+
+
 def test_cli_downloads_list(monkeypatch, tmp_path: Path):
     monkeypatch.setenv("CANCERDATA_SOURCE_MATRICES", str(tmp_path))
     rc, out, _ = _run_cli(["downloads", "list"])
@@ -25,6 +25,7 @@ from pirlygenes.expression import (
     aggregate_gene_expression,
     available_cancer_expression_references,
     cancer_enriched_genes,
+    cancer_enriched_genes_all,
     cancer_expression,
     cancer_expression_reference_status,
     cancer_expression_source_candidates,
@@ -120,7 +121,7 @@ def _local_pan_cancer_fixture():
 
 
 @pytest.fixture
-def local_pan_cancer(monkeypatch):
+def local_pan_cancer(monkeypatch, tmp_path):
     """Stub the two local artifacts and isolate the canonical-frame cache."""
     import oncoref
 
@@ -142,6 +143,12 @@ def local_pan_cancer(monkeypatch):
     expression_accessors._pan_reference_frame.cache_clear()
     expression_accessors._pan_source_reference_frame.cache_clear()
     expression_accessors._load_pan_rollup_frame.cache_clear()
+    monkeypatch.setattr(expression_accessors, "_PAN_FACTOR_CACHE", {})
+    monkeypatch.setattr(expression_accessors, "_PAN_LINEAR_FRAME_CACHE", {})
+    monkeypatch.setattr(expression_accessors, "_PAN_DERIVED_CACHE", {})
+    monkeypatch.setattr(
+        expression_accessors, "_pan_derived_cache_dir", lambda: tmp_path,
+    )
     monkeypatch.setattr(expression_accessors, "get_data", fake_get_data)
     monkeypatch.setattr(oncoref, "pan_cancer_expression", forbidden_eager_call)
     yield raw, rollup, calls
@@ -218,6 +225,279 @@ def test_pan_cancer_adapter_preserves_all_normalize_contracts(
     assert calls == {"pan": 1, "rollup": 0}
 
 
+def test_pan_cancer_gene_subset_matches_full_matrix_normalization(
+    local_pan_cancer,
+):
+    canonical = expression_accessors._pan_reference_frame(
+        include_computed_rollups=True,
+    )
+    value_cols = expression_accessors._pan_analysis_value_cols(canonical)
+    clean, _ = normalize_expression(
+        canonical, value_cols=value_cols, censored_fill="fixed_fraction",
+    )
+    hk = normalize_to_housekeeping(canonical, value_cols=value_cols)
+    percentile, _ = percentile_rank_expression(canonical, value_cols=value_cols)
+
+    subset = pan_cancer_expression(
+        genes=["EGFR", "TP53", "MT-ND1", "RPL7"],
+        normalize=["tpm_clean", "hk", "percentile"],
+        include_computed_rollups=True,
+    )
+    rows = canonical["Ensembl_Gene_ID"].isin(subset["Ensembl_Gene_ID"])
+    assert subset["Symbol"].tolist() == canonical.loc[rows, "Symbol"].tolist()
+    for col in value_cols:
+        public = expression_accessors._pan_public_col_name(col)
+        missing = canonical.loc[rows, col].isna().to_numpy()
+        for suffix, expected in (
+            ("clean", clean),
+            ("hk", hk),
+            ("percentile", percentile),
+        ):
+            want = np.where(
+                missing, np.nan, expected.loc[rows, col].to_numpy(dtype=float),
+            )
+            np.testing.assert_allclose(
+                subset[f"{public}_{suffix}"].to_numpy(dtype=float),
+                want,
+                rtol=1e-12,
+                err_msg=f"{public}_{suffix}",
+            )
+
+
+def test_pan_cancer_normalization_factors_are_computed_once(
+    local_pan_cancer, monkeypatch,
+):
+    computed = []
+    compute = expression_accessors._compute_pan_normalization_factors
+
+    def counting_compute(frame, value_cols, mode):
+        computed.append(mode)
+        return compute(frame, value_cols, mode)
+
+    monkeypatch.setattr(
+        expression_accessors,
+        "_compute_pan_normalization_factors",
+        counting_compute,
+    )
+    modes = ["tpm_clean", "hk", "percentile"]
+    full = pan_cancer_expression(normalize=modes)
+    egfr = pan_cancer_expression(genes=["EGFR"], normalize=modes)
+    assert computed == modes
+    pd.testing.assert_frame_equal(
+        egfr,
+        full[full["Symbol"] == "EGFR"].reset_index(drop=True),
+    )
+
+    # A fresh process reads the persisted factors instead of recomputing.
+    monkeypatch.setattr(expression_accessors, "_PAN_FACTOR_CACHE", {})
+    again = pan_cancer_expression(genes=["EGFR"], normalize=modes)
+    assert computed == modes
+    pd.testing.assert_frame_equal(again, egfr)
+
+
+def test_pan_cancer_factor_cache_write_drops_stale_signature(
+    tmp_path, monkeypatch,
+):
+    frame = pd.DataFrame(
+        {"Ensembl_Gene_ID": ["ENSG1", "ENSG2"], "TPM_A": [1.0, 3.0]}
+    )
+    monkeypatch.setattr(expression_accessors, "_PAN_FACTOR_CACHE", {})
+    monkeypatch.setattr(
+        expression_accessors, "_pan_derived_cache_dir", lambda: tmp_path,
+    )
+    monkeypatch.setattr(
+        expression_accessors, "_compute_pan_normalization_factors",
+        lambda frame, value_cols, mode: {"denominators": np.array([2.0])},
+    )
+
+    def factors():
+        return expression_accessors._pan_normalization_factors(
+            frame, ["TPM_A"], "hk",
+            include_computed_rollups=False, collapse_kind=None,
+        )
+
+    factors()
+    (sig_file,) = tmp_path.glob("*-hk-factors.sig")
+    assert sig_file.with_suffix(".npz").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # A rewrite that fails part-way must neither leave the old signature
+    # paired with the npz nor touch the published npz.
+    def broken_savez(handle, **arrays):
+        handle.write(b"torn")
+        raise OSError("disk full")
+
+    published = sig_file.with_suffix(".npz").read_bytes()
+    monkeypatch.setattr(expression_accessors, "_PAN_FACTOR_CACHE", {})
+    monkeypatch.setattr(
+        expression_accessors, "_pan_frame_fingerprint", lambda *a: "changed",
+    )
+    monkeypatch.setattr(expression_accessors.np, "savez", broken_savez)
+    np.testing.assert_array_equal(factors()["denominators"], [2.0])
+    assert not sig_file.exists()
+    assert sig_file.with_suffix(".npz").read_bytes() == published
+
+
+def test_pan_cancer_float32_does_not_keep_float64_resident(local_pan_cancer):
+    pan_cancer_expression(normalize=["tpm_clean_log1p", "hk"], dtype="float32")
+    assert {key[-1] for key in expression_accessors._PAN_LINEAR_FRAME_CACHE} == {
+        "float32",
+    }
+    assert {key[-1] for key in expression_accessors._PAN_DERIVED_CACHE} == {
+        "float32",
+    }
+
+
+def test_pan_cancer_arrow_return_type_matches_pandas(local_pan_cancer):
+    import pyarrow as pa
+
+    kwargs = dict(genes=["EGFR", "TP53"], normalize=["tpm_clean", "hk"])
+    table = pan_cancer_expression(**kwargs, return_type="arrow")
+    frame = pan_cancer_expression(**kwargs)
+
+    assert isinstance(table, pa.Table)
+    assert table.column_names == list(frame.columns)
+    pd.testing.assert_frame_equal(table.to_pandas(), frame, check_dtype=False)
+    assert b"pirlygenes.attrs" in table.schema.metadata
+
+
+def test_pan_cancer_float32_storage_keeps_float64_factors(
+    local_pan_cancer, tmp_path,
+):
+    modes = ["tpm_clean", "hk", "percentile"]
+    full = pan_cancer_expression(normalize=modes)
+    narrow = pan_cancer_expression(normalize=modes, dtype="float32")
+
+    value_cols = [c for c in full.columns if pd.api.types.is_float_dtype(full[c])]
+    assert value_cols
+    assert set(narrow[value_cols].dtypes) == {np.dtype("float32")}
+    np.testing.assert_allclose(
+        narrow[value_cols].to_numpy(dtype=float),
+        full[value_cols].to_numpy(),
+        rtol=1e-6,
+    )
+    assert (tmp_path / "pan-float32.npy").exists()
+    assert np.load(tmp_path / "pan-float32-tpm_clean.npy").dtype == np.float32
+    for mode in modes:
+        factors = expression_accessors._PAN_FACTOR_CACHE[(False, None, mode)][1]
+        assert all(
+            array.dtype == np.float64
+            for array in factors.values() if array.dtype.kind == "f"
+        )
+
+
+def test_pan_cancer_fresh_process_memory_maps_persisted_matrices(
+    local_pan_cancer, monkeypatch,
+):
+    _raw, _rollup, calls = local_pan_cancer
+    modes = ["tpm_clean", "tpm_clean_log1p", "tpm_log1p", "hk", "percentile"]
+    full = pan_cancer_expression(normalize=modes, include_computed_rollups=True)
+    subset = pan_cancer_expression(
+        genes=["EGFR", "TP53"], normalize=modes, include_computed_rollups=True,
+    )
+    assert calls == {"pan": 1, "rollup": 1}
+
+    def fresh_process():
+        for name in (
+            "_PAN_FACTOR_CACHE", "_PAN_LINEAR_FRAME_CACHE", "_PAN_DERIVED_CACHE",
+        ):
+            monkeypatch.setattr(expression_accessors, name, {})
+        expression_accessors._pan_reference_frame.cache_clear()
+        expression_accessors._pan_source_reference_frame.cache_clear()
+        expression_accessors._load_pan_rollup_frame.cache_clear()
+
+    fresh_process()
+    warm = pan_cancer_expression(
+        normalize=modes, include_computed_rollups=True, readonly=True,
+    )
+    assert calls == {"pan": 1, "rollup": 1}  # no CSV parse
+    pd.testing.assert_frame_equal(warm, full)
+    pd.testing.assert_frame_equal(
+        pan_cancer_expression(
+            genes=["EGFR", "TP53"],
+            normalize=modes,
+            include_computed_rollups=True,
+        ),
+        subset,
+    )
+    frame = expression_accessors._pan_linear_frame(True, None)
+    clean = expression_accessors._pan_derived_matrix(
+        frame,
+        expression_accessors._pan_analysis_value_cols(frame),
+        "tpm_clean",
+        include_computed_rollups=True,
+        collapse_kind=None,
+    )
+    assert isinstance(clean, np.memmap)
+    assert np.shares_memory(warm["LUAD_TPM_clean"].to_numpy(), clean)
+
+    # A changed source invalidates every persisted artifact.
+    fresh_process()
+    monkeypatch.setattr(
+        expression_accessors,
+        "_pan_source_signature",
+        lambda include_computed_rollups, collapse_kind: "edited",
+    )
+    pd.testing.assert_frame_equal(
+        pan_cancer_expression(normalize=modes, include_computed_rollups=True),
+        full,
+    )
+    assert calls == {"pan": 2, "rollup": 2}
+
+
+def test_pan_cancer_entity_projection_matches_full_width_view(
+    local_pan_cancer,
+):
+    modes = ["tpm_clean", "tpm_clean_log1p", "hk", "percentile"]
+    full = pan_cancer_expression(normalize=modes, include_computed_rollups=True)
+
+    luad = pan_cancer_expression(
+        normalize=modes,
+        include_computed_rollups=True,
+        cancer_types=["lung adenocarcinoma"],
+    )
+    assert not any(col.startswith("liver_") for col in luad.columns)
+    assert not any(col.startswith("CRC_") for col in luad.columns)
+    assert {"LUAD_FPKM", "LUAD_TPM", "LUAD_TPM_clean", "LUAD_TPM_hk"} <= set(
+        luad.columns
+    )
+    pd.testing.assert_frame_equal(luad, full[list(luad.columns)])
+
+    mixed = pan_cancer_expression(
+        genes=["EGFR"],
+        normalize=modes,
+        include_computed_rollups=True,
+        cancer_types="CRC",
+        tissues=["Liver"],
+    )
+    assert [col for col in mixed.columns if col.endswith("_percentile")] == [
+        "liver_nTPM_percentile", "CRC_TPM_percentile",
+    ]
+    expected = full[full["Symbol"] == "EGFR"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(mixed, expected[list(mixed.columns)])
+
+    with pytest.raises(ValueError, match="include_computed_rollups=True"):
+        pan_cancer_expression(cancer_types=["CRC"])
+    with pytest.raises(ValueError, match="tissue 'kidney'"):
+        pan_cancer_expression(tissues=["kidney"])
+
+
+def test_pan_cancer_readonly_view_shares_cached_buffers(local_pan_cancer):
+    canonical = expression_accessors._pan_reference_frame()
+
+    view = pan_cancer_expression(normalize=["tpm", "hk"], readonly=True)
+    copied = pan_cancer_expression(normalize=["tpm", "hk"])
+    pd.testing.assert_frame_equal(view, copied)
+
+    cached_values = canonical["nTPM_liver"].to_numpy()
+    assert np.shares_memory(view["liver_nTPM"].to_numpy(), cached_values)
+    assert not view["liver_nTPM"].to_numpy().flags.writeable
+    assert not np.shares_memory(copied["liver_nTPM"].to_numpy(), cached_values)
+
+    view.loc[0, "liver_nTPM"] = -1.0
+    assert (expression_accessors._pan_reference_frame()["nTPM_liver"] >= 0).all()
+
+
 def test_pan_cancer_canonical_rows_rollups_and_legacy_gene_filters(
     local_pan_cancer,
 ):
@@ -424,6 +704,105 @@ def test_cancer_enriched_genes_excludes_members_of_aggregate_target(monkeypatch)
     assert enriched.loc[0, "other_median"] == pytest.approx(8.0)
 
 
+def test_cancer_enriched_genes_all_matches_per_type_tables(monkeypatch):
+    frame = pd.DataFrame({
+        "Ensembl_Gene_ID": [f"ENSG0000000000{i}" for i in range(5)],
+        "Symbol": ["A", "B", "C", "D", "E"],
+        "LUAD_FPKM": 1.0,
+        "LUSC_FPKM": 1.0,
+        "COAD_FPKM": 1.0,
+        "PRAD_FPKM": 1.0,
+        "LUAD_TPM_clean": [12.0, 0.0, np.nan, 5.0, 3.0],
+        "LUSC_TPM_clean": [4.0, 2.0, 1.0, 5.0, np.nan],
+        "COAD_TPM_clean": [8.0, 0.5, np.nan, 5.0, np.nan],
+        "PRAD_TPM_clean": [1.0, 9.0, 4.0, 5.0, np.nan],
+        "NSCLC_TPM_clean": [50.0, 1.0, 2.0, 5.0, 7.0],
+    })
+    calls = []
+
+    def fake_pan_cancer_expression(**_kwargs):
+        calls.append(_kwargs)
+        return frame.copy()
+
+    monkeypatch.setattr(
+        expression_accessors, "pan_cancer_expression", fake_pan_cancer_expression,
+    )
+
+    batch = cancer_enriched_genes_all(min_fold=0.0, min_expression=0.0)
+
+    assert len(calls) == 1
+    assert list(dict.fromkeys(batch["cancer_code"])) == [
+        "LUAD", "LUSC", "COAD", "PRAD", "NSCLC",
+    ]
+    for code in ["LUAD", "LUSC", "COAD", "PRAD", "NSCLC"]:
+        single = cancer_enriched_genes(code, min_fold=0.0, min_expression=0.0)
+        pd.testing.assert_frame_equal(
+            batch[batch["cancer_code"] == code]
+            .drop(columns="cancer_code")
+            .reset_index(drop=True),
+            single,
+        )
+
+
+def test_cancer_expressions_makes_one_request_per_backing_source(
+    local_pan_cancer, monkeypatch,
+):
+    reference_calls = []
+
+    def fake_reference_expression(**kwargs):
+        reference_calls.append(kwargs["cancer_types"])
+        return pd.DataFrame({
+            "Ensembl_Gene_ID": [
+                "ENSG00000146648", "ENSG00000141510", "ENSG00000146648",
+                "ENSG00000105173",
+            ],
+            "Symbol": ["EGFR", "TP53", "EGFR", "CCNE1"],
+            "cancer_code": ["CLL", "CLL", "CLL", "MM"],
+            "expression": [1.0, 2.0, 3.0, 4.0],
+        })
+
+    monkeypatch.setattr(
+        expression_accessors,
+        "cancer_reference_expression",
+        fake_reference_expression,
+    )
+    monkeypatch.setattr(
+        expression_accessors,
+        "_oncoref_reference_code_set",
+        lambda: frozenset({"CLL", "MM"}),
+    )
+    pan_calls = []
+    pan = expression_accessors.pan_cancer_expression
+
+    def counting_pan(**kwargs):
+        pan_calls.append(kwargs["cancer_types"])
+        return pan(**kwargs)
+
+    monkeypatch.setattr(expression_accessors, "pan_cancer_expression", counting_pan)
+
+    matrix = expression_accessors.cancer_expressions(
+        ["LUAD", "CLL", "lung adenocarcinoma", "NSCLC", "MM"],
+    )
+
+    assert pan_calls == [["LUAD", "NSCLC"]]
+    assert reference_calls == [["CLL", "MM"]]
+    assert list(matrix.columns) == [
+        "Ensembl_Gene_ID", "Symbol", "LUAD", "CLL", "NSCLC", "MM",
+    ]
+    for code in ["LUAD", "NSCLC"]:
+        single = cancer_expression(code).set_index("Ensembl_Gene_ID")
+        pd.testing.assert_series_equal(
+            matrix.set_index("Ensembl_Gene_ID")[code].loc[single.index],
+            single["expression"],
+            check_names=False,
+        )
+    by_gene = matrix.set_index("Symbol")
+    assert by_gene.loc["EGFR", "CLL"] == 1.0  # first delegated source row
+    assert by_gene.loc["TP53", "CLL"] == 2.0
+    assert by_gene.loc["CCNE1", "MM"] == 4.0
+    assert np.isnan(by_gene.loc["CCNE1", "LUAD"])
+
+
 def test_cancer_expression_returns_per_symbol_expression_column():
     df = cancer_expression("PRAD")
     assert {"Ensembl_Gene_ID", "Symbol", "expression"} <= set(df.columns)
@@ -1630,6 +2009,56 @@ def test_percentile_rank_expression_is_reusable():
     assert record["columns"]["TPM_S1"]["n_ranked"] == 3
 
 
+def test_column_transforms_match_per_column_reference_with_ties_and_nans():
+    df = pd.DataFrame({
+        "TPM_S1": [3.0, 1.0, np.nan, 1.0],
+        "TPM_S2": ["2", "x", "4", "2"],
+        "TPM_S3": [0.0, 0.0, 0.0, 0.0],
+    })
+    cols = ["TPM_S1", "TPM_S2", "TPM_S3"]
+    ranked, record = percentile_rank_expression(df, value_cols=cols)
+    scaled, scale_record = renormalize_to_million(df, value_cols=cols)
+    for col in cols:
+        vals = pd.to_numeric(df[col], errors="coerce")
+        expected = vals.rank(pct=True) * 100
+        assert ranked[col].tolist() == pytest.approx(
+            expected.tolist(), nan_ok=True,
+        )
+        assert record["columns"][col]["n_ranked"] == int(expected.notna().sum())
+    assert scaled["TPM_S1"].sum() == pytest.approx(1_000_000)
+    assert scaled["TPM_S2"].sum() == pytest.approx(1_000_000)
+    assert scale_record["columns"]["TPM_S3"]["scale"] == 1.0
+    assert df["TPM_S1"].tolist()[:2] == [3.0, 1.0]
+
+
+def test_column_transforms_support_inplace_and_out():
+    df = pd.DataFrame({"Symbol": ["A", "B"], "TPM_S1": [1.0, 3.0]})
+    same, _ = renormalize_to_million(df, value_cols=["TPM_S1"], inplace=True)
+    assert same is df
+    assert df["TPM_S1"].tolist() == pytest.approx([250_000, 750_000])
+
+    target = pd.DataFrame(index=df.index)
+    written, _ = percentile_rank_expression(
+        df, value_cols=["TPM_S1"], out=target,
+    )
+    assert written is target
+    assert target["TPM_S1"].tolist() == pytest.approx([50, 100])
+    assert df["TPM_S1"].tolist() == pytest.approx([250_000, 750_000])
+
+    mixed = pd.DataFrame({"TPM_S1": [1.0, 3.0], "TPM_S2": [0.0, np.nan]})
+    scaled_out = pd.DataFrame(index=mixed.index)
+    renormalize_to_million(mixed, out=scaled_out)
+    assert list(scaled_out.columns) == ["TPM_S1", "TPM_S2"]
+    assert scaled_out["TPM_S2"].tolist() == pytest.approx(
+        [0.0, np.nan], nan_ok=True,
+    )
+
+    with pytest.raises(ValueError):
+        renormalize_to_million(df, inplace=True, out=target)
+    with pytest.raises(ValueError):
+        fpkm_to_tpm(df, out=pd.DataFrame(index=[0]))
+
+
 def test_log1p_transform_is_reusable():
     df = pd.DataFrame({"TPM_S1": [0.0, 1.0, 9.0]})
     out = log1p_transform(df, value_cols=["TPM_S1"])
@@ -2226,3 +2655,21 @@ def test_pan_cancer_expression_proteoform_duality():
     only = pan_cancer_expression(genes=["CTAG1B"], normalize="tpm",
                                  collapse_protein_identical=True)
     assert set(only.Symbol) == {"CTAG1A/B"}
+
+
+def test_pan_cancer_timing_spans_cover_each_stage(local_pan_cancer):
+    from pirlygenes.timing import timing
+
+    with timing() as records:
+        pan_cancer_expression(normalize=["tpm_clean", "hk"])
+    names = [(r["name"], r.get("mode")) for r in records]
+    assert ("canonicalize", None) in names
+    assert ("normalize", "tpm_clean") in names and ("normalize", "hk") in names
+    assert names[-1] == ("copy", None)
+    assert all(r["wall_s"] >= 0 for r in records)
+    load = next(r for r in records if r["name"] == "load" and r["parent"] is None)
+    assert load["dtype"] == "float64"
+
+    with timing() as warm:
+        pan_cancer_expression(normalize="tpm_clean", readonly=True)
+    assert [r["name"] for r in warm] == ["load", "normalize"]
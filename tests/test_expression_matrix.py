@@ -0,0 +1,109 @@
+"""Dense ExpressionMatrix: label lookup, zero-copy slicing, frame round-trip."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pirlygenes.expression import CohortExpressionViews, ExpressionMatrix
+
+
+def _wide():
+    return pd.DataFrame(
+        {
+            "Ensembl_Gene_ID": ["ENSG1", "ENSG2", "ENSG3", "ENSG4"],
+            "Symbol": ["A", "B", "C", "D"],
+            "LUAD_TPM": [1.0, 2.0, 3.0, 4.0],
+            "LUAD_TPM_clean": [10.0, 20.0, 30.0, 40.0],
+            "PRAD_TPM_clean": [50.0, 60.0, np.nan, 80.0],
+        }
+    )
+
+
+def test_from_frame_suffix_strips_labels_and_sets_normalization():
+    matrix = ExpressionMatrix.from_frame(_wide(), suffix="_TPM_clean")
+
+    assert matrix.cohorts == ("LUAD", "PRAD")
+    assert matrix.genes == ("ENSG1", "ENSG2", "ENSG3", "ENSG4")
+    assert matrix.normalization == "TPM_clean"
+    assert matrix.values.flags.c_contiguous
+    assert matrix.gene_position("ENSG3") == 2
+    assert matrix.cohort_position("PRAD") == 1
+    np.testing.assert_array_equal(matrix.row("ENSG2"), [20.0, 60.0])
+    np.testing.assert_array_equal(matrix.column("LUAD"), [10.0, 20.0, 30.0, 40.0])
+
+
+def test_slices_share_memory_and_gathers_copy():
+    matrix = ExpressionMatrix.from_frame(_wide(), suffix="_TPM_clean")
+
+    run = matrix.select(genes=["ENSG2", "ENSG3"], cohorts=["PRAD"])
+    assert np.shares_memory(run.values, matrix.values)
+    assert run.genes == ("ENSG2", "ENSG3")
+    assert run.gene_position("ENSG3") == 1
+    assert np.shares_memory(matrix.iloc(slice(1, 3)).values, matrix.values)
+    assert np.shares_memory(matrix.row("ENSG1"), matrix.values)
+
+    gathered = matrix.select(genes=["ENSG4", "ENSG1"])
+    assert not np.shares_memory(gathered.values, matrix.values)
+    np.testing.assert_array_equal(gathered.row("ENSG4"), [40.0, 80.0])
+    with pytest.raises(KeyError):
+        matrix.select(genes=["ENSG_MISSING"])
+
+
+def test_to_frame_round_trips_without_copying_values():
+    frame = _wide()[["Ensembl_Gene_ID", "LUAD_TPM_clean", "PRAD_TPM_clean"]]
+    matrix = ExpressionMatrix.from_frame(frame)
+
+    out = matrix.to_frame()
+    pd.testing.assert_frame_equal(
+        out, frame, check_dtype=False, check_column_type=False,
+    )
+    assert np.shares_memory(out["LUAD_TPM_clean"].to_numpy(), matrix.values)
+    assert not np.shares_memory(
+        matrix.to_frame(copy=True)["LUAD_TPM_clean"].to_numpy(), matrix.values,
+    )
+
+
+def test_rejects_duplicate_labels_and_shape_mismatch():
+    with pytest.raises(ValueError, match="duplicate gene"):
+        ExpressionMatrix(np.zeros((2, 1)), ["ENSG1", "ENSG1"], ["LUAD"])
+    with pytest.raises(ValueError, match="does not match"):
+        ExpressionMatrix(np.zeros((2, 2)), ["ENSG1", "ENSG2"], ["LUAD"])
+
+
+def test_views_matrix_uses_cohort_columns_and_stage_label():
+    wide = _wide()[["Ensembl_Gene_ID", "Symbol", "LUAD_TPM", "PRAD_TPM_clean"]]
+    wide = wide.rename(columns={"LUAD_TPM": "LUAD", "PRAD_TPM_clean": "PRAD"})
+    provenance = pd.DataFrame(
+        {"source_cohort": ["S1"], "processing_pipeline": ["x"], "n_samples": [1]}
+    )
+    views = CohortExpressionViews(wide, wide.copy(), None, provenance)
+
+    matrix = views.matrix("tpm", dtype=np.float32)
+    assert matrix.normalization == "tpm"
+    assert matrix.cohorts == ("LUAD", "PRAD")
+    assert matrix.values.dtype == np.float32
+    with pytest.raises(ValueError, match="stage"):
+        views.matrix("provenance")
+
+
+def test_contiguous_slices_share_label_maps_and_gathers_build_lazily():
+    matrix = ExpressionMatrix.from_frame(_wide(), suffix="_TPM_clean")
+
+    column = matrix.iloc(slice(None), slice(1, 2))
+    assert column.genes is matrix.genes
+    assert column._gene_index is matrix._gene_index
+    assert column.cohorts == ("PRAD",)
+    assert column.cohort_position("PRAD") == 0
+    with pytest.raises(KeyError):
+        column.cohort_position("LUAD")
+
+    inner = matrix.iloc(slice(1, 4)).iloc(slice(1, 3))
+    assert inner.genes == ("ENSG3", "ENSG4")
+    assert inner.gene_position("ENSG4") == 1
+    with pytest.raises(KeyError):
+        inner.gene_position("ENSG2")
+
+    gathered = matrix.iloc(np.array([3, 0]))
+    assert gathered._gene_index._positions is None
+    assert gathered.gene_position("ENSG1") == 1
+    np.testing.assert_array_equal(gathered.row("ENSG4"), [40.0, 80.0])
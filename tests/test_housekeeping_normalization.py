@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
 import pytest
+from oncoref.normalization import (
+    tpm_to_housekeeping_normalized as oncoref_tpm_to_housekeeping_normalized,
+)
 
 from pirlygenes.expression.normalize import tpm_to_housekeeping_normalized
 
@@ -43,11 +47,13 @@ def test_housekeeping_normalization_delegates_to_oncoref(monkeypatch):
         value_cols=["TPM_S1"],
         panel_ids=HK_IDS,
         panel_name="test_panel",
+        method="legacy_geomean",
     )
 
     assert calls
     assert calls[0][1]["panel_ids"] == {s.split(".", 1)[0] for s in HK_IDS}
     assert calls[0][1]["panel_name"] == "test_panel"
+    assert calls[0][1]["method"] == "legacy_geomean"
     assert record["applied"] is True
     pd.testing.assert_series_equal(out["TPM_S1"], df["TPM_S1"] / 2.0)
 
@@ -109,3 +115,79 @@ def test_housekeeping_normalization_rejects_symbol_panel():
     df = _housekeeping_frame([10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
     with pytest.raises(ValueError, match="panel_ids"):
         tpm_to_housekeeping_normalized(df, value_cols=["TPM_S1"], panel=["ACTB"])
+
+
+def test_median_of_ratios_matches_oncoref_across_many_columns():
+    rng = np.random.default_rng(0)
+    ids = HK_IDS + [f"ENSGBIO{i:04d}" for i in range(20)]
+    values = rng.lognormal(3.0, 1.0, size=(len(ids), 12))
+    values[0, 1] = np.nan
+    values[:4, 2] = 0.0  # fails the positive-HK gate: left on the input scale
+    values[:, 3] = np.nan  # no measured HK values
+    values[1, 4] = 0.0  # one zero HK gene still passes the gate
+    cols = [f"TPM_S{i}" for i in range(values.shape[1])]
+    df = pd.concat(
+        [
+            pd.DataFrame({"Symbol": ids, "Ensembl_Gene_ID": ids}),
+            pd.DataFrame(values, columns=cols),
+        ],
+        axis=1,
+    )
+    reference = pd.DataFrame(
+        {"Ensembl_Gene_ID": HK_IDS, "reference_tpm": [5.0, 10.0, 20.0, 40.0, 0.0, 15.0]}
+    )
+
+    out, record = tpm_to_housekeeping_normalized(
+        df, value_cols=cols, panel_ids=HK_IDS, reference_profile=reference,
+    )
+
+    skipped = {"TPM_S2", "TPM_S3"}
+    kept = [col for col in cols if col not in skipped]
+    expected, expected_record = oncoref_tpm_to_housekeeping_normalized(
+        df,
+        value_cols=kept,
+        panel_ids=set(HK_IDS),
+        panel_name="custom",
+        reference_profile=reference,
+    )
+    pd.testing.assert_frame_equal(out[kept], expected[kept])
+    pd.testing.assert_frame_equal(out[sorted(skipped)], df[sorted(skipped)])
+    for col in kept:
+        assert record["columns"][col] == pytest.approx(expected_record["columns"][col])
+    assert record["columns"]["TPM_S2"]["reason"] == "insufficient positive HK genes"
+    assert record["columns"]["TPM_S3"]["reason"] == "no measured HK values"
+    assert record["value_cols"] == cols
+    assert record["panel_genes_present"] == expected_record["panel_genes_present"]
+
+
+def test_median_of_ratios_reads_reference_profiles_like_oncoref():
+    df = _housekeeping_frame([10.0, 20.0, 40.0, 80.0, 160.0, 320.0])
+    series = pd.Series(
+        [5.0, 10.0, 20.0, 40.0, 80.0, 160.0, 9.0],
+        index=HK_IDS + [HK_IDS[0]],  # duplicated ENSG: the later value wins
+    )
+    out, record = tpm_to_housekeeping_normalized(
+        df, value_cols=["TPM_S1"], panel_ids=HK_IDS, reference_profile=series,
+    )
+    expected, expected_record = oncoref_tpm_to_housekeeping_normalized(
+        df,
+        value_cols=["TPM_S1"],
+        panel_ids=set(HK_IDS),
+        panel_name="custom",
+        reference_profile=series,
+    )
+    pd.testing.assert_frame_equal(out, expected)
+    assert record["columns"]["TPM_S1"] == pytest.approx(
+        expected_record["columns"]["TPM_S1"],
+    )
+    assert {k: v for k, v in record.items() if k != "columns"} == {
+        k: v for k, v in expected_record.items() if k != "columns"
+    }
+
+    with pytest.raises(ValueError, match="Ensembl_Gene_ID"):
+        tpm_to_housekeeping_normalized(
+            df,
+            value_cols=["TPM_S1"],
+            panel_ids=HK_IDS,
+            reference_profile=pd.DataFrame({"reference_tpm": [1.0]}),
+        )
@@ -41,6 +41,40 @@ def test_get_data_copy_false_returns_shared_cached_frame():
     assert defensive is not shared  # default path still copies
 
 
+def test_get_data_readonly_is_zero_copy_and_protects_cache(monkeypatch):
+    cached = pd.DataFrame({"x": [1.0, 2.0], "label": ["a", "b"]})
+    fake = {"abc.csv": cached}
+
+    view = ld.get_data("abc", _dataframes_dict=fake, readonly=True)
+    assert view is not cached
+    assert np.shares_memory(view["x"].to_numpy(), cached["x"].to_numpy())
+    assert not view["x"].to_numpy().flags.writeable
+    view.loc[0, "x"] = 99.0
+    assert cached["x"].tolist() == [1.0, 2.0]
+
+    copied = ld.get_data("abc", _dataframes_dict=fake)
+    assert not np.shares_memory(copied["x"].to_numpy(), cached["x"].to_numpy())
+
+    # The process-wide default applies to readonly=None callers only.
+    monkeypatch.setattr(ld, "_READONLY_DEFAULT", False)
+    assert ld.set_readonly_default(True) is False
+    shared = ld.get_data("abc", _dataframes_dict=fake)
+    assert np.shares_memory(shared["x"].to_numpy(), cached["x"].to_numpy())
+    explicit = ld.get_data("abc", _dataframes_dict=fake, readonly=False)
+    assert not np.shares_memory(explicit["x"].to_numpy(), cached["x"].to_numpy())
+    assert ld.set_readonly_default(False) is True
+
+
+def test_float_dtype_default_accepts_only_float32_and_float64(monkeypatch):
+    monkeypatch.setattr(ld, "_FLOAT_DTYPE_DEFAULT", np.dtype("float64"))
+    assert ld.set_float_dtype_default("float32") == np.float64
+    assert ld._resolve_float_dtype(None) == np.float32
+    assert ld._resolve_float_dtype("float64") == np.float64
+    with pytest.raises(ValueError, match="float32"):
+        ld.set_float_dtype_default("int32")
+    assert ld.set_float_dtype_default(np.float64) == np.float32
+
+
 def test_cancer_reference_name_variants_delegate_to_oncoref(monkeypatch):
     import oncoref.load_dataset
 
@@ -846,3 +880,93 @@ def test_cancer_classification_ontology_and_supertypes():
     assert path[-1] == "THCA" and path[0] == "EPITHELIAL"
     assert "PAX8_LINEAGE" in path and "TTF1_LINEAGE" in path
     assert (onto[onto.node == "NEUROENDOCRINE"]["module"] == "cross_cutting").any()
+
+
+def test_frame_lru_cache_evicts_least_recently_used_within_budget():
+    frames = {
+        key: pd.DataFrame({"value": [float(i)] * 100})
+        for i, key in enumerate("abc")
+    }
+    size = ld._frame_nbytes(frames["a"])
+    cache = ld._FrameLRUCache(2 * size)
+    cache.put("a", frames["a"])
+    cache.put("b", frames["b"])
+    assert cache.get("a") is frames["a"]  # "b" is now least recently used
+    cache.put("c", frames["c"])
+    assert cache.get("b") is None
+    assert cache.get("c") is frames["c"]
+    assert cache.info() == (2, 1, 2 * size, 2 * size, 2)
+
+    cache.put("huge", pd.concat([frames["a"]] * 3, ignore_index=True))
+    assert cache.get("huge") is None
+    assert cache.resize(size) == 2 * size
+    assert cache.info().entries == 1 and cache.get("c") is frames["c"]
+    cache.clear()
+    assert cache.info() == (0, 0, size, 0, 0)
+
+
+def test_concurrent_first_calls_build_each_artifact_once(monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import oncoref.load_dataset
+
+    calls = []
+
+    def slow_get_data(name, *, copy):
+        calls.append(name)
+        time.sleep(0.05)
+        return pd.DataFrame({"sentinel": [1]})
+
+    monkeypatch.setattr(ld, "_CACHED_DATAFRAMES", {})
+    monkeypatch.setattr(oncoref.load_dataset, "get_data", slow_get_data)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        frames = list(pool.map(
+            lambda _: ld.get_data("cancer-reference-expression", copy=False),
+            range(8),
+        ))
+    assert calls == ["cancer-reference-expression"]
+    assert all(frame is frames[0] for frame in frames)
+
+
+def test_frame_lru_cache_pins_small_frames_and_evicts_on_request():
+    small = pd.DataFrame({"value": [1.0]})
+    big = pd.DataFrame({"value": np.arange(1000, dtype=float)})
+    cache = ld._FrameLRUCache(
+        ld._frame_nbytes(big), pin_nbytes=ld._frame_nbytes(small),
+    )
+    cache["panel"] = small
+    cache["big"] = big
+    # Over budget: the unpinned frame goes, the pinned panel stays.
+    assert "big" not in cache and cache["panel"] is small
+    assert cache.resize(0) == ld._frame_nbytes(big)
+    assert list(cache) == ["panel"]
+    assert cache.evict("panel") and not cache.evict("panel")
+    with pytest.raises(KeyError):
+        cache.pin("panel")
+
+
+def test_dataset_cache_budget_bounds_get_data(monkeypatch):
+    import oncoref.load_dataset
+
+    reference = pd.DataFrame({"value": np.arange(10_000, dtype=float)})
+    calls = []
+
+    def fake_get_data(name, *, copy):
+        calls.append(name)
+        return reference
+
+    monkeypatch.setattr(ld, "_CACHED_DATAFRAMES", ld._FrameLRUCache(1 << 30))
+    monkeypatch.setattr(oncoref.load_dataset, "get_data", fake_get_data)
+    assert ld.get_data("cancer-reference-expression", copy=False) is reference
+    ld.get_data("cancer-reference-expression", copy=False)
+    assert len(calls) == 1
+    assert ld.evict_dataset("Cancer-Reference-Expression")
+    assert not ld.evict_dataset("cancer-reference-expression")
+
+    assert ld.set_dataset_cache_budget(100) == 1 << 30
+    # Larger than the ceiling: served, but not kept resident.
+    assert ld.get_data("cancer-reference-expression", copy=False) is reference
+    ld.get_data("cancer-reference-expression", copy=False)
+    assert len(calls) == 3
+    assert len(ld._CACHED_DATAFRAMES) == 0
@@ -0,0 +1,86 @@
+"""NormalizationPlan: compiled gene-side state matches the per-call transforms."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pirlygenes import NormalizationPlan, synthetic
+from pirlygenes.cohorts import ID_COLS
+from pirlygenes.expression.normalize import (
+    clean_tpm_matrix,
+    tpm_to_housekeeping_normalized,
+)
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    return synthetic.synthetic_tpm_matrix(2500, 16, seed=11, dtype="float64")
+
+
+def _values(matrix):
+    return matrix.drop(columns=list(ID_COLS))
+
+
+def test_plan_clean_tpm_matches_clean_tpm_matrix(matrix):
+    values = _values(matrix).copy()
+    values.iloc[3, 2] = np.nan
+    plan = NormalizationPlan.compile(matrix[list(ID_COLS)], modes="tpm_clean")
+    out = plan.apply(values)
+    expected = clean_tpm_matrix(values, gene_table=matrix[list(ID_COLS)])
+    pd.testing.assert_frame_equal(out["tpm_clean"], expected, check_dtype=False)
+
+
+def test_plan_modes_resolve_dependencies_and_aliases(matrix):
+    plan = NormalizationPlan.compile(
+        matrix["Ensembl_Gene_ID"], modes=["tpm_clean_log1p", "housekeeping"],
+    )
+    assert plan.modes == ("tpm_clean", "tpm_clean_log1p", "hk")
+    out = plan.apply(_values(matrix).to_numpy())
+    assert list(out) == list(plan.modes)
+    np.testing.assert_allclose(out["tpm_clean_log1p"], np.log1p(out["tpm_clean"]))
+    with pytest.raises(ValueError, match="modes"):
+        NormalizationPlan.compile(matrix["Ensembl_Gene_ID"], modes=["zscore"])
+    with pytest.raises(ValueError, match="genes"):
+        plan.apply(np.zeros((3, 2)))
+
+
+def test_plan_housekeeping_matches_tpm_to_housekeeping_normalized(matrix):
+    values = _values(matrix).copy()
+    # Knock out most panel genes in one sample so the positivity gate fails.
+    plan = NormalizationPlan.compile(matrix[list(ID_COLS)], modes=["hk"])
+    values.iloc[plan.hk_gate_rows[:-2], 0] = 0.0
+    frame = pd.concat([matrix[list(ID_COLS)], values], axis=1)
+    expected, record = tpm_to_housekeeping_normalized(
+        frame, value_cols=list(values.columns),
+    )
+    out = plan.apply(values)["hk"]
+    assert out.iloc[:, 0].isna().all()
+    assert record["columns"][values.columns[0]]["applied"] is False
+    pd.testing.assert_frame_equal(
+        out.iloc[:, 1:], expected[values.columns[1:]], check_dtype=False,
+    )
+
+
+def test_plan_percentile_and_log1p_match_column_transforms(matrix):
+    values = _values(matrix)
+    plan = NormalizationPlan.compile(
+        matrix[list(ID_COLS)], modes=["tpm", "percentile", "tpm_log1p"],
+    )
+    out = plan.apply(values)
+    pd.testing.assert_frame_equal(out["tpm"], values, check_dtype=False)
+    pd.testing.assert_frame_equal(
+        out["percentile"], values.rank(pct=True) * 100, check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        out["tpm_log1p"], np.log1p(values), check_dtype=False,
+    )
+
+
+def test_plan_rejects_gene_indexed_frame_in_another_order(matrix):
+    plan = NormalizationPlan.compile(matrix[list(ID_COLS)], modes="tpm_clean")
+    indexed = _values(matrix).set_axis(matrix["Ensembl_Gene_ID"], axis=0)
+    out = plan.apply(indexed)["tpm_clean"]
+    assert out.index.equals(indexed.index)
+    with pytest.raises(ValueError, match="gene order"):
+        plan.apply(indexed.iloc[::-1])
+    plan.apply(indexed.iloc[::-1].reindex(list(plan.genes)))
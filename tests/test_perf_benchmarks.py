@@ -0,0 +1,494 @@
+"""Offline performance benchmarks for the reference accessors and transforms.
+
+Every case runs against synthetic data shaped like the real bundles — gene
+rows drawn from the bundled canonical ENSG universe (``gene-canonical-
+reference``), the delegated oncoref reader replaced by an in-memory fake — so
+the suite needs no network, no downloaded bundle and no patient data.
+
+The module is opt-in (``perf`` marker, skipped unless ``PIRLYGENES_PERF`` is
+set) because cold cases clear every registered cache:
+
+- ``PIRLYGENES_PERF=1 pytest tests/test_perf_benchmarks.py`` times each
+  case (best of ``_REPEATS``) and fails when it is slower than its recorded
+  baseline times ``PIRLYGENES_PERF_TOLERANCE`` (default 1.5) plus a small
+  absolute slack. Cases without a baseline are timed but not gated.
+- ``PIRLYGENES_PERF=record`` rewrites ``perf_baselines.json`` beside this
+  file with the current timings and the library versions they were taken
+  with. Record on the machine that will run the gate, before an upgrade.
+
+``cold`` variants call :func:`pirlygenes.clear_caches` (and drop the
+persisted pan matrices) before every repeat, so they include the gene-map and
+matrix builds a fresh process pays; ``warm`` variants prime once and then time
+the cached path. Pure transforms without a cache have a single ``run``
+variant.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pirlygenes
+from pirlygenes import coverage
+from pirlygenes.expression import accessors
+from pirlygenes.expression.aggregate import aggregate_gene_expression
+from pirlygenes.expression.normalize import normalize_technical_rna_long_table
+from pirlygenes.expression.stats import PooledCohorts, compute_cohort_stats
+from pirlygenes.gene_canonicalization import (
+    _canonical_reference_frame,
+    canonicalize_gene_table,
+)
+from pirlygenes.synthetic import (
+    synthetic_cohorts,
+    synthetic_tpm_matrix,
+    synthetic_transcript_quant,
+)
+
+
+_PERF_ENV_VAR = "PIRLYGENES_PERF"
+_TOLERANCE_ENV_VAR = "PIRLYGENES_PERF_TOLERANCE"
+_BASELINES_PATH = Path(__file__).with_name("perf_baselines.json")
+_DEFAULT_TOLERANCE = 1.5
+# Sub-10ms warm paths jitter by more than 50% on a loaded machine; the slack
+# keeps them gated against order-of-magnitude regressions only.
+_ABSOLUTE_SLACK_S = 0.01
+_REPEATS = 5
+
+_PERF_MODE = os.environ.get(_PERF_ENV_VAR, "").strip().lower()
+
+pytestmark = [
+    pytest.mark.perf,
+    pytest.mark.skipif(
+        not _PERF_MODE,
+        reason=f"performance benchmarks are opt-in: set {_PERF_ENV_VAR}=1",
+    ),
+]
+
+_SEED = 0
+_PAN_TISSUES = (
+    "adipose tissue", "adrenal gland", "bone marrow", "brain", "breast",
+    "colon", "heart muscle", "kidney", "liver", "lung", "lymph node",
+    "ovary", "pancreas", "prostate", "skeletal muscle", "skin", "spleen",
+    "stomach", "testis", "thyroid gland",
+)
+_PAN_CANCERS = (
+    "BLCA", "BRCA", "CESC", "COAD", "GBM", "HNSC", "KIRC", "LIHC", "LUAD",
+    "LUSC", "OV", "PAAD", "PRAD", "READ", "SKCM", "STAD", "THCA", "UCEC",
+)
+_PAN_MODES = (
+    None, "tpm", "tpm_clean", "hk", "percentile", "tpm_log1p",
+    "tpm_clean_log1p",
+)
+# Real registry codes so cancer_types resolve; each gets two source cohorts
+# so unions and pooling have something to combine.
+_REFERENCE_CODES = ("CLL", "MM", "PRAD", "LUAD", "BRCA", "COAD")
+_REFERENCE_GENES = 8000
+
+
+# ---------- timing harness ----------
+
+
+class _Benchmarks:
+    """Time cases against the recorded baselines (or record new ones)."""
+
+    def __init__(self, path: Path, mode: str):
+        self.path = path
+        self.record = mode == "record"
+        self.tolerance = float(
+            os.environ.get(_TOLERANCE_ENV_VAR, "") or _DEFAULT_TOLERANCE
+        )
+        self.baselines = {}
+        if path.exists():
+            self.baselines = json.loads(path.read_text()).get("cases", {})
+        self.timings: dict[str, float] = {}
+
+    def measure(self, name, fn, *, setup=None, warm=False):
+        """Best-of-``_REPEATS`` wall time of ``fn()``; ``setup()`` runs
+        untimed before every repeat, and ``warm=True`` primes once first."""
+        if warm:
+            fn()
+        best = float("inf")
+        for _ in range(_REPEATS):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        self.timings[name] = best
+        baseline = self.baselines.get(name)
+        if self.record or baseline is None:
+            return best
+        limit = baseline * self.tolerance + _ABSOLUTE_SLACK_S
+        assert best <= limit, (
+            f"{name}: {best:.4f}s exceeds baseline {baseline:.4f}s "
+            f"x {self.tolerance:g} (+{_ABSOLUTE_SLACK_S}s)"
+        )
+        return best
+
+    def write(self):
+        cases = {**self.baselines, **self.timings}
+        self.path.write_text(json.dumps({
+            "environment": {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "numpy": np.__version__,
+                "pandas": pd.__version__,
+                "pirlygenes": pirlygenes.__version__,
+                "repeats": _REPEATS,
+            },
+            "cases": {name: round(cases[name], 6) for name in sorted(cases)},
+        }, indent=2) + "\n")
+
+
+@pytest.fixture(scope="module")
+def benchmarks():
+    bench = _Benchmarks(_BASELINES_PATH, _PERF_MODE)
+    yield bench
+    if bench.record and bench.timings:
+        bench.write()
+
+
+# ---------- synthetic fixtures ----------
+
+
+@pytest.fixture(scope="module")
+def canonical_genes():
+    """Protein-coding plus mitochondrial rows of the bundled canonical
+    universe: every housekeeping and technical-RNA gene the normalizers
+    look for is present."""
+    canon = _canonical_reference_frame()
+    keep = canon["biotype"].eq("protein_coding") | canon["contig"].eq("MT")
+    return canon.loc[keep, ["ensembl_gene_id", "symbol"]].reset_index(drop=True)
+
+
+@pytest.fixture(scope="module")
+def synthetic_pan(canonical_genes):
+    """Pre-canonical pan matrix: ``nTPM_<tissue>`` / ``FPKM_<code>`` columns."""
+    rng = np.random.default_rng(_SEED)
+    n = len(canonical_genes)
+    data = {
+        "Ensembl_Gene_ID": canonical_genes["ensembl_gene_id"].to_numpy(),
+        "Symbol": canonical_genes["symbol"].to_numpy(),
+    }
+    for tissue in _PAN_TISSUES:
+        data[f"nTPM_{tissue}"] = rng.gamma(0.4, 60.0, n).round(1)
+    for code in _PAN_CANCERS:
+        data[f"FPKM_{code}"] = rng.gamma(0.4, 20.0, n).round(3)
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(scope="module")
+def synthetic_reference(canonical_genes):
+    """Per-source cohort summary rows in oncoref's linear long schema."""
+    rng = np.random.default_rng(_SEED + 1)
+    genes = canonical_genes.head(_REFERENCE_GENES)
+    n = len(genes)
+    parts = []
+    for code in _REFERENCE_CODES:
+        for source, n_samples in (("A", 24), ("B", 9)):
+            tpm = rng.gamma(0.5, 40.0, n)
+            parts.append(pd.DataFrame({
+                "Ensembl_Gene_ID": genes["ensembl_gene_id"].to_numpy(),
+                "Symbol": genes["symbol"].to_numpy(),
+                "cancer_code": code,
+                "source_cohort": f"SYNTH_{code}_{source}",
+                "source_project": "synthetic",
+                "source_version": "v1",
+                "n_samples": n_samples,
+                "n_detected": rng.integers(0, n_samples + 1, n),
+                "processing_pipeline": "synthetic",
+                "notes": "",
+                "TPM_median": tpm,
+                "TPM_q1": tpm * 0.5,
+                "TPM_q3": tpm * 1.5,
+                "TPM_clean_median": tpm * 1.1,
+                "TPM_clean_q1": tpm * 0.55,
+                "TPM_clean_q3": tpm * 1.65,
+            }))
+    return pd.concat(parts, ignore_index=True)
+
+
+def _fake_oncoref_reference(summary: pd.DataFrame):
+    """In-memory stand-ins for oncoref's delegated reader and availability."""
+    labels = {"tpm": ("TPM", "tpm_raw"), "tpm_clean": ("TPM_clean", "tpm_clean")}
+
+    def availability(cancer_types=None, normalize="tpm_clean", *,
+                     reference_source="summary_rows_all", **_kwargs):
+        if reference_source == "artifact":
+            return pd.DataFrame(
+                {"cancer_code": [], "source_cohort": [], "available": []}
+            )
+        pairs = summary[["cancer_code", "source_cohort"]].drop_duplicates()
+        if cancer_types is not None:
+            pairs = pairs[pairs["cancer_code"].isin(list(cancer_types))]
+        return pairs.assign(available=True, normalization=normalize).reset_index(
+            drop=True
+        )
+
+    def reference(cancer_types=None, genes=None, normalize="tpm_clean", *,
+                  include_provenance=True, **_kwargs):
+        prefix, label = labels[normalize]
+        df = summary
+        if cancer_types is not None:
+            df = df[df["cancer_code"].isin(list(cancer_types))]
+        if genes is not None:
+            wanted = {str(gene) for gene in genes}
+            df = df[
+                df["Ensembl_Gene_ID"].isin(wanted) | df["Symbol"].isin(wanted)
+            ]
+        out = df[[
+            "Ensembl_Gene_ID", "Symbol", "cancer_code", "source_cohort",
+            "source_project", "source_version", "n_samples", "n_detected",
+            "processing_pipeline", "notes",
+        ]].copy()
+        out["Proteoform_ID"] = out["Ensembl_Gene_ID"]
+        out["Member_Ensembl_Gene_IDs"] = out["Ensembl_Gene_ID"]
+        out["normalization"] = label
+        out["expression"] = df[f"{prefix}_median"].to_numpy()
+        out["q1"] = df[f"{prefix}_q1"].to_numpy()
+        out["q3"] = df[f"{prefix}_q3"].to_numpy()
+        codes = sorted(set(df["cancer_code"]))
+        out.attrs.update(
+            reference_source="summary_rows_all",
+            availability=[
+                {"cancer_code": code, "normalization": label, "available": True}
+                for code in codes
+            ],
+            missing_requests=[],
+        )
+        return out.reset_index(drop=True)
+
+    return availability, reference
+
+
+@pytest.fixture
+def pan_source(monkeypatch, tmp_path, synthetic_pan):
+    """Serve the synthetic matrix as the local pan artifact; persisted
+    derived matrices go under ``tmp_path``."""
+    import oncoref
+
+    def fake_get_data(name, *, copy=True):
+        if name == "pan-cancer-expression":
+            return synthetic_pan.copy()
+        raise AssertionError(f"unexpected dataset {name!r}")
+
+    def forbidden_eager_call(*args, **kwargs):
+        raise AssertionError("the pan adapter must not call oncoref's eager accessor")
+
+    monkeypatch.setattr(accessors, "_PAN_FACTOR_CACHE", {})
+    monkeypatch.setattr(accessors, "_PAN_LINEAR_FRAME_CACHE", {})
+    monkeypatch.setattr(accessors, "_PAN_DERIVED_CACHE", {})
+    monkeypatch.setattr(accessors, "_pan_derived_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(accessors, "get_data", fake_get_data)
+    monkeypatch.setattr(oncoref, "pan_cancer_expression", forbidden_eager_call)
+    pirlygenes.clear_caches("expression.*")
+
+    def cold():
+        pirlygenes.clear_caches()
+        for path in tmp_path.iterdir():
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+    yield cold
+    pirlygenes.clear_caches("expression.*")
+
+
+@pytest.fixture
+def reference_source(monkeypatch, synthetic_reference):
+    """Route the delegated oncoref reader through the synthetic summaries."""
+    import oncoref
+
+    availability, reference = _fake_oncoref_reference(synthetic_reference)
+    monkeypatch.setattr(
+        oncoref, "cancer_reference_expression_availability", availability,
+    )
+    monkeypatch.setattr(oncoref, "cancer_reference_expression", reference)
+    pirlygenes.clear_caches("expression.*")
+    yield
+    pirlygenes.clear_caches("expression.*")
+
+
+@pytest.fixture
+def views_source(monkeypatch, tmp_path, synthetic_reference):
+    """Serve the synthetic summary frame as the cohort-views reference, with
+    no precomputed artifact."""
+    monkeypatch.setattr(
+        accessors, "_load_cancer_reference_expression",
+        lambda: synthetic_reference,
+    )
+    monkeypatch.setattr(
+        accessors, "_cohort_views_root", lambda: tmp_path / "missing",
+    )
+    pirlygenes.clear_caches("expression.*")
+    yield
+    pirlygenes.clear_caches("expression.*")
+
+
+# ---------- reference accessors ----------
+
+
+@pytest.mark.parametrize("variant", ["cold", "warm"])
+@pytest.mark.parametrize("mode", _PAN_MODES, ids=lambda mode: str(mode))
+def test_bench_pan_cancer_expression(benchmarks, pan_source, mode, variant):
+    def run():
+        out = accessors.pan_cancer_expression(normalize=mode)
+        assert len(out) > 10_000
+
+    benchmarks.measure(
+        f"pan_cancer_expression[{mode}]-{variant}",
+        run,
+        setup=pan_source if variant == "cold" else None,
+        warm=variant == "warm",
+    )
+
+
+@pytest.mark.parametrize("variant", ["cold", "warm"])
+@pytest.mark.parametrize(
+    "case,kwargs",
+    [
+        ("long", dict(normalize=["tpm", "tpm_clean", "tpm_clean_log1p"])),
+        ("wide", dict(format="wide")),
+        ("pool", dict(pool=True)),
+    ],
+    ids=["long", "wide", "pool"],
+)
+def test_bench_cancer_reference_expression(
+    benchmarks, reference_source, case, kwargs, variant,
+):
+    def run():
+        out = accessors.cancer_reference_expression(
+            list(_REFERENCE_CODES), **kwargs,
+        )
+        assert len(out) >= _REFERENCE_GENES
+
+    benchmarks.measure(
+        f"cancer_reference_expression[{case}]-{variant}",
+        run,
+        setup=pirlygenes.clear_caches if variant == "cold" else None,
+        warm=variant == "warm",
+    )
+
+
+@pytest.mark.parametrize("variant", ["cold", "warm"])
+@pytest.mark.parametrize(
+    "case,kwargs",
+    [
+        ("full", {}),
+        ("subset", dict(cancer_types=["CLL", "PRAD"], protein_coding=True)),
+    ],
+    ids=["full", "subset"],
+)
+def test_bench_cohort_expression_views(
+    benchmarks, views_source, case, kwargs, variant,
+):
+    def run():
+        views = accessors.cohort_expression_views(**kwargs)
+        assert len(views.clean_tpm_biological) > 1000
+
+    benchmarks.measure(
+        f"cohort_expression_views[{case}]-{variant}",
+        run,
+        setup=pirlygenes.clear_caches if variant == "cold" else None,
+        warm=variant == "warm",
+    )
+
+
+# ---------- transforms ----------
+
+
+@pytest.mark.parametrize("variant", ["cold", "warm"])
+def test_bench_canonicalize_gene_table(
+    benchmarks, synthetic_reference, variant,
+):
+    table = synthetic_reference[[
+        "Ensembl_Gene_ID", "Symbol", "cancer_code", "source_cohort",
+        "TPM_median", "TPM_clean_median",
+    ]]
+
+    def run():
+        out = canonicalize_gene_table(
+            table,
+            group_keys=("cancer_code", "source_cohort"),
+            value_cols=["TPM_median", "TPM_clean_median"],
+        )
+        assert len(out) > 0
+
+    benchmarks.measure(
+        f"canonicalize_gene_table-{variant}",
+        run,
+        setup=pirlygenes.clear_caches if variant == "cold" else None,
+        warm=variant == "warm",
+    )
+
+
+def test_bench_aggregate_gene_expression(benchmarks):
+    # An explicit transcript map: times the grouping and the per-gene Ensembl
+    # metadata lookups, not the one-off pyensembl index build.
+    quant, tx_to_gene = synthetic_transcript_quant(4000, seed=_SEED)
+
+    def run():
+        out = aggregate_gene_expression(quant, tx_to_gene_name=tx_to_gene)
+        assert len(out) == len(set(tx_to_gene.values()))
+
+    benchmarks.measure("aggregate_gene_expression-run", run)
+
+
+def test_bench_clean_tpm_long_table(benchmarks, synthetic_reference):
+    # Every (cancer_code, source_cohort) group is cleaned separately.
+    value_cols = ("TPM_median", "TPM_q1", "TPM_q3")
+
+    def run():
+        out, info = normalize_technical_rna_long_table(
+            synthetic_reference.copy(),
+            label_col="Symbol",
+            group_cols=("cancer_code", "source_cohort"),
+            value_cols=value_cols,
+            censored_fill="fixed_fraction",
+        )
+        assert info["applied"] and len(out) == len(synthetic_reference)
+
+    benchmarks.measure("clean_tpm_long_table-run", run)
+
+
+def test_bench_greedy_coverage(benchmarks):
+    rng = np.random.default_rng(_SEED + 3)
+    mat = pd.DataFrame(rng.gamma(0.3, 15.0, size=(600, 400)))
+
+    def run():
+        order, cum, n = coverage.greedy_coverage(mat, 25.0)
+        assert n == 400 and len(order) == len(cum) > 0
+
+    benchmarks.measure("greedy_coverage-run", run)
+
+
+def test_bench_compute_cohort_stats(benchmarks):
+    values = synthetic_tpm_matrix(20_000, 120, seed=_SEED, dtype="float64")
+    values = values.set_index("Ensembl_Gene_ID").drop(columns="Symbol")
+
+    def run():
+        stats = compute_cohort_stats(values)
+        assert len(stats["TPM_median"]) == len(values)
+
+    benchmarks.measure("compute_cohort_stats-run", run)
+
+
+def test_bench_pooled_cohort_summary(benchmarks):
+    cohorts = synthetic_cohorts(
+        4, n_genes=20_000, samples_per_cohort=(10, 60), seed=_SEED,
+    )
+
+    def run():
+        summary = PooledCohorts.from_cohorts(cohorts).summary()
+        assert summary["n_available"].max() > summary["n_available"].min()
+
+    benchmarks.measure("pooled_cohort_summary-run", run)
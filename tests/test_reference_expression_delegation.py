@@ -535,3 +535,138 @@ def test_one_shot_filters_are_reused_across_normalization_modes():
     assert set(out["normalization"]) == {"TPM", "TPM_clean"}
     assert out.groupby("normalization").size().nunique() == 1
     assert set(out["Symbol"]) == {"MS4A1"}
+
+
+def test_identical_requests_are_served_from_the_result_cache(monkeypatch):
+    calls = []
+
+    def fake_uncached(**request):
+        calls.append(request)
+        out = pd.DataFrame(
+            {
+                "Ensembl_Gene_ID": ["ENSG00000163534"],
+                "Symbol": ["FCRL5"],
+                "cancer_code": ["MM"],
+                "normalization": ["TPM"],
+                "expression": [9.0],
+            }
+        )
+        out.attrs.update({"missing_requests": []})
+        return out
+
+    monkeypatch.setattr(accessors, "_cancer_reference_expression", fake_uncached)
+    request = dict(cancer_types="MM", genes=["FCRL5"], normalize="tpm")
+
+    first = accessors.cancer_reference_expression(**request)
+    first.loc[0, "expression"] = -1.0
+    first.attrs["missing_requests"].append("mutated")
+    second = accessors.cancer_reference_expression(
+        genes=(gene for gene in ["FCRL5"]), cancer_types="MM", normalize="tpm",
+    )
+    assert len(calls) == 1
+    assert calls[0]["genes"] == ["FCRL5"]
+    assert second["expression"].tolist() == [9.0]
+    assert second.attrs["missing_requests"] == []
+    info = accessors.cancer_reference_expression.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+    assert 0 < info.currbytes <= info.maxbytes
+
+    # A different request, or a new oncoref release, misses.
+    accessors.cancer_reference_expression(**request, format="wide")
+    monkeypatch.setattr(oncoref, "__version__", "0+test", raising=False)
+    accessors.cancer_reference_expression(**request)
+    assert len(calls) == 3
+
+    previous = accessors.set_reference_expression_cache_budget(0)
+    try:
+        assert accessors.cancer_reference_expression.cache_info().entries == 0
+        accessors.cancer_reference_expression(**request)
+        accessors.cancer_reference_expression(**request)
+        assert len(calls) == 5
+    finally:
+        accessors.set_reference_expression_cache_budget(previous)
+
+
+def test_arrow_return_type_dictionary_encodes_identifier_columns(monkeypatch):
+    import json
+
+    import pyarrow as pa
+
+    def fake_uncached(**request):
+        out = pd.DataFrame(
+            {
+                "Ensembl_Gene_ID": ["ENSG00000163534", "ENSG00000141510"],
+                "Symbol": ["FCRL5", "TP53"],
+                "cancer_code": ["MM", "MM"],
+                "source_cohort": ["MM_SRC", "MM_SRC"],
+                "normalization": ["TPM", "TPM"],
+                "expression": [9.0, None],
+            }
+        )
+        out.attrs.update({"missing_requests": []})
+        return out
+
+    monkeypatch.setattr(accessors, "_cancer_reference_expression", fake_uncached)
+    table = accessors.cancer_reference_expression(
+        "MM", normalize="tpm", return_type="arrow",
+    )
+
+    assert isinstance(table, pa.Table)
+    for name in ("cancer_code", "source_cohort", "normalization"):
+        assert pa.types.is_dictionary(table.schema.field(name).type)
+    assert table.column("cancer_code").to_pylist() == ["MM", "MM"]
+    assert table.column("expression").null_count == 1
+    attrs = json.loads(table.schema.metadata[b"pirlygenes.attrs"])
+    assert attrs == {"missing_requests": []}
+    pd.testing.assert_frame_equal(
+        table.to_pandas().astype({
+            name: object
+            for name in ("cancer_code", "source_cohort", "normalization")
+        }),
+        accessors.cancer_reference_expression("MM", normalize="tpm"),
+        check_dtype=False,
+    )
+    with pytest.raises(ValueError, match="return_type"):
+        accessors.cancer_reference_expression("MM", return_type="polars")
+
+
+def test_multi_mode_request_fetches_each_linear_mode_once(monkeypatch):
+    calls = []
+
+    def fake_linear(**kwargs):
+        calls.append(kwargs["delegated_mode"])
+        scale = 1.0 if kwargs["delegated_mode"] == "tpm" else 2.0
+        delegated = pd.DataFrame(
+            {
+                "Ensembl_Gene_ID": ["ENSG00000163534", "ENSG00000141510"],
+                "Symbol": ["FCRL5", "TP53"],
+                "cancer_code": ["MM", "MM"],
+                "source_cohort": ["MMRF_COMMPASS_IA21"] * 2,
+                "n_samples": [10, 10],
+                "expression": [9.0 * scale, 3.0 * scale],
+                "q1": [3.0, 1.0],
+                "q3": [15.0, 5.0],
+            }
+        )
+        attrs = {"availability": [], "missing_requests": []}
+        return delegated, attrs, ["shared linear transform"]
+
+    monkeypatch.setattr(accessors, "_oncoref_reference_linear", fake_linear)
+
+    out = accessors.cancer_reference_expression(
+        normalize=["tpm", "tpm_clean", "tpm_log1p", "tpm_clean_log1p"],
+    )
+
+    assert calls == ["tpm", "tpm_clean"]
+    values = out.pivot(
+        index="Symbol", columns="normalization", values="expression",
+    )
+    np.testing.assert_allclose(values["TPM_log1p"], np.log1p(values["TPM"]))
+    np.testing.assert_allclose(
+        values["TPM_clean_log1p"], np.log1p(values["TPM_clean"]),
+    )
+    assert out.attrs["compatibility_transforms"] == [
+        "shared linear transform",
+        "tpm_log1p derived with numpy.log1p from delegated raw TPM",
+        "tpm_clean_log1p derived with numpy.log1p from delegated clean TPM",
+    ]
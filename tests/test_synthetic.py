@@ -0,0 +1,89 @@
+"""Synthetic scale-data generators: shape, TPM invariants and determinism."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pirlygenes import synthetic
+from pirlygenes.cohorts import ID_COLS
+from pirlygenes.expression import aggregate_gene_expression
+from pirlygenes.expression.normalize import (
+    _housekeeping_panel_ensembl_ids,
+    clean_tpm_matrix,
+)
+from pirlygenes.expression.stats import PooledCohorts
+
+
+@pytest.fixture(scope="module")
+def genes():
+    return synthetic.synthetic_gene_table(3000, seed=7)
+
+
+def test_gene_table_keeps_housekeeping_and_censored_compartments(genes):
+    assert len(genes) == 3000
+    assert genes["Ensembl_Gene_ID"].is_unique
+    assert genes["Ensembl_Gene_ID"].is_monotonic_increasing
+    assert _housekeeping_panel_ensembl_ids() <= set(genes["Ensembl_Gene_ID"])
+    assert set(genes["compartment"]) == {
+        "ribosomal_protein", "other_technical", "biological",
+    }
+    assert genes["Symbol"].notna().all()
+    pd.testing.assert_frame_equal(
+        genes, synthetic.synthetic_gene_table(3000, seed=7),
+    )
+    with pytest.raises(ValueError, match="at least"):
+        synthetic.synthetic_gene_table(10)
+
+
+def test_tpm_matrix_sums_to_a_million_with_variable_technical_share(genes):
+    matrix = synthetic.synthetic_tpm_matrix(genes, 40, seed=3, dtype="float64")
+    assert list(matrix.columns[:2]) == list(ID_COLS)
+    values = matrix.drop(columns=list(ID_COLS))
+    assert values.shape == (3000, 40)
+    np.testing.assert_allclose(values.sum(), 1e6)
+    assert (values.to_numpy() >= 0).all() and (values.to_numpy() == 0).any()
+
+    technical = genes["compartment"].ne("biological").to_numpy()
+    share = values[technical].sum() / 1e6
+    assert 0.1 < share.mean() < 0.5 and share.std() > 0.02
+
+    # Clean TPM pins the censored compartments, so the technical share no
+    # longer varies across samples.
+    clean = clean_tpm_matrix(values, gene_table=matrix[list(ID_COLS)])
+    clean_share = clean[technical].sum() / 1e6
+    assert clean_share.std() < 1e-9
+
+
+def test_streamed_parquet_matches_in_memory_matrix(genes, tmp_path):
+    path = synthetic.write_synthetic_per_sample(
+        tmp_path / "synthetic_per_sample_tpm.parquet", genes, 12, seed=5,
+    )
+    streamed = pd.read_parquet(path)
+    expected = synthetic.synthetic_tpm_matrix(genes, 12, seed=5, dtype="float32")
+    pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+    assert streamed["S000001"].dtype == np.float32
+
+
+def test_transcript_quant_aggregates_to_its_genes():
+    quant, tx_to_gene = synthetic.synthetic_transcript_quant(600, seed=2)
+    assert quant["TPM"].sum() == pytest.approx(1e6)
+    assert quant["Name"].str.contains(r"\.\d$").all()
+    out = aggregate_gene_expression(quant, tx_to_gene_name=tx_to_gene)
+    assert set(out["gene"]) == set(tx_to_gene.values())
+    assert out.attrs["transcript_aggregation_stats"]["unknown_tpm"] == 0
+
+
+def test_ragged_cohorts_pool_with_membership_masks(genes):
+    cohorts = synthetic.synthetic_cohorts(
+        3, n_genes=genes, samples_per_cohort=(4, 9), dropout=0.05, seed=1,
+    )
+    assert list(cohorts) == ["SYN01", "SYN02", "SYN03"]
+    assert len({len(m) for m in cohorts.values()}) > 1
+    pooled = PooledCohorts.from_cohorts(cohorts)
+    assert pooled.values.columns.is_unique
+    assert not pooled.measured.to_numpy().all()
+    assert (pooled.n_measured_genes == pd.Series(
+        {name: len(m) for name, m in cohorts.items()}
+    )).all()
+    # Dropout cells stay measured: membership, not notna, is the mask.
+    assert (pooled.measured & pooled.values.isna()).to_numpy().any()
@@ -0,0 +1,62 @@
+"""Opt-in timing spans: disabled no-op, nesting, sinks, memory tracing."""
+
+import json
+import threading
+
+import numpy as np
+
+from pirlygenes import timing
+
+
+def test_span_is_a_shared_noop_without_a_sink():
+    assert not timing.enabled()
+    assert timing.span("load") is timing.span("pivot") is timing._NULL_SPAN
+
+
+def test_timing_collects_nested_records_with_fields():
+    with timing.timing() as records:
+        with timing.span("outer", mode="hk"):
+            with timing.span("inner"):
+                pass
+    assert not timing.enabled()
+    assert [(r["name"], r["parent"]) for r in records] == [
+        ("inner", "outer"), ("outer", None),
+    ]
+    assert records[1]["mode"] == "hk"
+    assert records[1]["wall_s"] >= records[0]["wall_s"]
+    assert records[0]["alloc_bytes"] is None
+
+
+def test_jsonl_sink_and_memory_tracing(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    with timing.timing(path, trace_memory=True):
+        with timing.span("alloc"):
+            block = np.ones(1_000_000)
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["alloc"]
+    assert lines[0]["alloc_bytes"] >= block.nbytes
+
+
+def test_failing_sink_never_breaks_the_traced_code():
+    def broken(record):
+        raise RuntimeError("sink down")
+
+    with timing.timing(broken):
+        with timing.span("load"):
+            value = 1
+    assert value == 1
+
+
+def test_timing_records_only_its_own_thread_by_default():
+    def other():
+        with timing.span("elsewhere"):
+            pass
+
+    with timing.timing() as own, timing.timing(all_threads=True) as every:
+        worker = threading.Thread(target=other)
+        worker.start()
+        worker.join()
+        with timing.span("here"):
+            pass
+    assert [r["name"] for r in own] == ["here"]
+    assert sorted(r["name"] for r in every) == ["elsewhere", "here"]